@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import os
+import pickle
+import functools
 import numpy as np
 import geatpy as ea
 import time
@@ -16,17 +19,18 @@ Algorithm : class - 算法模板顶级父类
     
     problem         : class <Problem> - 问题类的对象。
     
-    MAXGEN          : int      - 最大进化代数。
+    MAXGEN          : int      - 最大进化代数，为None时不限制进化代数。
     
     currentGen      : int      - 当前进化的代数。
     
-    MAXTIME         : float    - 时间限制（单位：秒）。
+    MAXTIME         : float    - 时间限制（单位：秒），为None时不限制时间。
     
     timeSlot        : flot     - 时间戳（单位：秒）。
     
     passTime        : float    - 已用时间（单位：秒）。
     
-    MAXEVALS        : int      - 最大评价次数。
+    MAXEVALS        : int      - 最大评价次数，为None时不限制评价次数。
+                                 MAXGEN、MAXTIME和MAXEVALS至少要设置一个，任一预算耗尽时即终止进化。
     
     evalsNum        : int      - 当前评价次数。
     
@@ -41,10 +45,89 @@ Algorithm : class - 算法模板顶级父类
     mutFunc         : str      - 变异算子的名称。
     
     drawing         : int      - 绘图方式的参数，0表示不绘图，1表示绘图，2表示实时绘制动态图。
+    
+    plotSink        : class <PlotSink> - 绘制动态图的绘图接收器，drawing为2时在第一次绘制动态图时创建，
+                                 动态图在单独的进程中绘制，来不及绘制的帧会被丢弃，因此不会拖慢进化（详见PlotSink类）。
+                                 也可以在run()之前为其赋一个自定义的PlotSink对象（例如保存每一帧图片）。
+    
+    poolSize        : int      - 并行评价种群时所用的进程数或线程数（由问题类的poolType决定），
+                                 None或1表示在主进程中串行评价。
+    
+    evalCache       : class <EvalCache> - 评价缓存对象，为None时不使用缓存。
+                                 启用后重复出现的个体不再调用aimFunc，evalsNum只统计真正评价的个体数。
+    
+    surrogate       : class <Surrogate> - 代理模型预筛选对象，为None时不进行预筛选。设置后支持预筛选的算法模板每一代
+                                 先生成更多的候选子代，再用由已评价个体拟合的代理模型从中选出最有希望的个体真正评价（详见Surrogate类）。
+    
+    arena           : class <PopArena> - 种群缓冲区对象，采用父子合并选择的算法模板用它来合并与选择种群，
+                                 以避免每一代重新分配内存（详见PopArena类），在initialization()中初始化。
+    
+    checkpointFile  : str      - 检查点文件的路径，为None时不保存检查点。设置后每隔checkpointGap代，
+                                 就把算法模板的全部动态参数、当代种群、算法模板的循环状态以及随机数生成器的状态
+                                 以二进制的形式保存到该文件中，之后可以调用resume()从该检查点继续进化。
+    
+    checkpointGap   : int      - 每隔多少代保存一次检查点，默认为1。
+    
+    profiler        : class <Profiler> - 分阶段计时器，为None时不计时。设置后算法模板会记录选择、重组、变异、解码、
+                                 评价、非支配排序、重插入等各阶段的累计用时、调用次数以及每一代的用时（详见Profiler类）。
+    
+    hooks           : dict     - 各事件的钩子函数列表，键为事件名，通过addHook()注册。所有算法模板都会触发以下事件：
+                                 'start'            : initialization()完成之后（从检查点恢复时也会触发），种群为算法模板的population属性
+                                                      （此时尚未初始化染色体，可用于查看或修改初始种群）；
+                                 'afterEvaluation'  : 每次评价种群之后，种群为刚评价完的种群；
+                                 'afterReinsertion' : 每一代产生新一代种群之后，种群为新一代种群；
+                                 'generationEnd'    : 每一代统计记录之后（即terminated()的末尾），种群为当代种群；
+                                 'finish'           : 进化结束之后，种群为返回的结果种群（多目标时为非支配种群）。
+                                 钩子函数的形式为hook(algorithm, population)，返回True时请求终止进化，
+                                 进化在下一次调用terminated()时终止。没有注册钩子时触发事件没有任何开销。
+    
+    stopRequested   : bool     - 是否有钩子函数请求终止进化。
+    
+    seed            : int      - 随机数种子，为None时不起作用。设置后每次运行都在initialization()中用它创建一个新的
+                                 np.random.Generator作为rng，因此同一个种子总能得到相同的结果。
+    
+    rng             : np.random.Generator - 算法模板的随机数生成器，为None时使用Numpy的全局随机数状态（与np.random.seed()配合使用）。
+                                 initialization()会把它设为纯Numpy内核的各算子、Population.shuffle()等使用的当前随机数生成器，
+                                 进化结束后（run()出错或被中断时也一样）再恢复原来的生成器（详见rng.py）。它的状态随检查点一起保存。
+                                 注意：当前随机数生成器是进程内的全局状态，同一进程中在多个线程里同时运行的算法模板会共用它，
+                                 此时各自的随机数流会相互交错，结果不再可复现，应改用多进程（如IslandModel、Experiment）。
+                                 注意：编译版内核的算子不受它控制。
 
 函数:
+    call_aimFunc(pop) : 调用问题类的evaluation()评价种群pop，并更新评价次数。
+    
+    candidateNum(NUM) : 返回为了得到NUM个子代需要生成的候选子代数。
+    
+    prescreen(offspring, NUM) : 用代理模型从候选子代中选出最有希望的NUM个个体。
+    
+    checkBudget()   : 检查是否至少设置了一种预算（MAXGEN、MAXTIME或MAXEVALS）。
+    
+    exhausted()     : 判断进化代数、时间或评价次数的预算是否已经耗尽。
+    
+    progress()      : 计算已消耗的预算比例。
+    
     terminated()    : 计算是否需要终止进化，具体功能需要在继承类即算法模板中实现。
     
+    saveCheckpoint(pop, states) : 保存检查点，由terminated()在每一代的开始调用。
+    
+    restoreState()  : 从检查点恢复算法模板的动态参数，由initialization()调用。
+    
+    restoreLoop()   : 从检查点恢复种群、循环状态及随机数生成器的状态，由算法模板的run()调用。
+    
+    resume(fileName) : 从检查点文件恢复并继续进化，返回值与run()相同。
+    
+    draw(frames)    : 把当代的一帧动态图交给绘图接收器。
+    
+    closePlotSink() : 等待动态图的最后一帧绘制完毕并关闭绘图接收器。
+    
+    tick(phase)     : 把从上一次计时到现在的用时计入阶段phase，由算法模板在每个阶段结束时调用。
+    
+    addHook(event, hook) : 为事件event注册钩子函数hook。
+    
+    removeHook(event, hook) : 注销事件event的钩子函数hook。
+    
+    fire(event, pop) : 依次调用事件event的各钩子函数。
+    
     run()           : 执行函数，需要在继承类即算法模板中实现。
     
 """
@@ -65,12 +148,255 @@ Algorithm : class - 算法模板顶级父类
         self.recFunc = None
         self.mutFunc = None
         self.drawing = None
+        self.plotSink = None
+        self.poolSize = None
+        self.evalCache = None
+        self.surrogate = None
+        self.arena = None
+        self.checkpointFile = None
+        self.checkpointGap = 1
+        self.profiler = None
+        self.hooks = {}
+        self.stopRequested = False
+        self.seed = None
+        self.rng = None
+        self.previousRng = None # initialization()之前的当前随机数生成器，进化结束后恢复
+        self.resumeState = None # resume()读取的检查点，恢复完成后重置为None
+    
+    def call_aimFunc(self, pop):
+        """
+        描述: 评价种群pop，并更新评价次数evalsNum。
+        所有算法模板都通过该函数来调用问题类的目标函数，
+        当poolSize大于1时，种群将被切分成若干块并交由进程池或线程池并行评价（详见Problem类的evaluation()）。
+        当设置了evalCache时，只有缓存中没有记录的个体才会被真正评价并计入evalsNum（详见EvalCache类）。
+        当设置了surrogate时，评价完的个体会被加入代理模型的存档。
+        当设置了MAXEVALS且剩余的评价次数不足以评价整个种群时，pop会被原地截断为其前面若干个个体，
+        以确保evalsNum不会超过MAXEVALS；设置了evalCache时只截断未命中缓存的个体，命中缓存的个体不消耗评价次数，全部保留。
+        """
+        
+        if self.evalCache is None:
+            if self.MAXEVALS is not None and self.evalsNum + pop.sizes > self.MAXEVALS:
+                _truncate(pop, max(self.MAXEVALS - self.evalsNum, 0)) # 截断种群，使评价次数不超过MAXEVALS
+            self.problem.evaluation(pop, self.poolSize)
+            self.evalsNum += pop.sizes # 更新评价次数
+        else:
+            maxEvals = None if self.MAXEVALS is None else max(self.MAXEVALS - self.evalsNum, 0)
+            self.evalsNum += self.evalCache.evaluate(self.problem, pop, self.poolSize, maxEvals) # 只统计真正评价的个体数
+        if self.surrogate is not None:
+            self.surrogate.update(pop) # 加入代理模型的存档
+        if self.hooks:
+            self.fire('afterEvaluation', pop) # 触发“评价之后”事件
+    
+    def candidateNum(self, NUM):
+        """
+        描述: 返回为了得到NUM个子代需要生成的候选子代数，没有设置surrogate时即为NUM。
+        """
+        
+        return NUM if self.surrogate is None else self.surrogate.candidateNum(NUM)
+    
+    def prescreen(self, offspring, NUM):
+        """
+        描述: 设置了surrogate时，用代理模型预测候选子代offspring的表现，返回由其中最有希望的NUM个个体组成的种群
+        （代理模型的存档不足时返回前NUM个候选子代），否则原样返回offspring。
+        """
+        
+        if self.surrogate is None:
+            return offspring
+        chosen = self.surrogate.screen(offspring, NUM, self.problem.maxormins)
+        offspring = offspring[chosen if chosen is not None else np.arange(min(NUM, offspring.sizes))]
+        self.tick('prescreening')
+        return offspring
+    
+    def checkBudget(self):
+        """
+        描述: 检查是否至少设置了MAXGEN、MAXTIME和MAXEVALS中的一个，否则进化将永不终止。
+        """
+        
+        if self.MAXGEN is None and self.MAXTIME is None and self.MAXEVALS is None:
+            raise RuntimeError('error in Algorithm: MAXGEN, MAXTIME and MAXEVALS are all None. (MAXGEN、MAXTIME和MAXEVALS至少要设置一个。)')
+    
+    def exhausted(self):
+        """
+        描述: 判断进化代数、时间或评价次数的预算是否已经耗尽。
+        由于代数是从0数起，因此在比较currentGen和MAXGEN时需要对currentGen加1。
+        """
+        
+        if self.MAXGEN is not None and self.currentGen + 1 >= self.MAXGEN:
+            return True
+        if self.MAXTIME is not None and self.passTime + time.time() - self.timeSlot >= self.MAXTIME:
+            return True
+        if self.MAXEVALS is not None and self.evalsNum >= self.MAXEVALS:
+            return True
+        return False
+    
+    def progress(self):
+        """
+        描述: 计算已消耗的预算比例（0到1之间），取已设置的各项预算中消耗比例最大者。
+        一些算法模板（如RVEA）需要根据进化的进度来调整参数，此时可以用它来代替currentGen / MAXGEN。
+        """
+        
+        rates = [0]
+        if self.MAXGEN is not None:
+            rates.append(self.currentGen / self.MAXGEN)
+        if self.MAXTIME is not None:
+            rates.append((self.passTime + time.time() - self.timeSlot) / self.MAXTIME)
+        if self.MAXEVALS is not None:
+            rates.append(self.evalsNum / self.MAXEVALS)
+        return min(max(rates), 1)
+    
+    def saveCheckpoint(self, pop, states = ()):
+        """
+        描述: 设置了checkpointFile且当前代数是checkpointGap的整数倍时，保存检查点。
+        检查点包括算法模板的动态参数（除问题对象、绘图对象、缓冲区及预算等设置外的所有属性）、
+        当代种群pop、算法模板的run()中跨代保存的循环状态states（如参考点），以及Numpy全局随机数状态（rng的状态在动态参数中）。
+        检查点先写到临时文件中，写完后再替换原文件，因此进程在写入时被中断也不会损坏已有的检查点。
+        """
+        
+        if self.checkpointFile is None or self.currentGen % self.checkpointGap != 0:
+            return
+        state = {key : value for key, value in self.__dict__.items() if key not in _TRANSIENT}
+        state['passTime'] = self.passTime + time.time() - self.timeSlot # 当前已用时间
+        checkpoint = {'class' : self.__class__.__name__,
+                      'state' : state,
+                      'population' : pop,
+                      'loop' : list(states),
+                      'random' : np.random.get_state(),
+                      'evalCache' : None if self.evalCache is None else [self.evalCache.records, self.evalCache.hits, self.evalCache.misses],
+                      'surrogate' : None if self.surrogate is None else [self.surrogate.Phen, self.surrogate.ObjV, self.surrogate.vio,
+                                                                         self.surrogate.screened, self.surrogate.saved, self.surrogate.fits]}
+        trace = getattr(self, 'pop_trace', None)
+        if trace is not None and trace.fileName is not None: # 记录流式记录文件当前的大小，恢复时截掉检查点之后写入的部分
+            checkpoint['traceFileSize'] = os.path.getsize(trace.fileName)
+        dirName = os.path.dirname(self.checkpointFile)
+        if dirName != '' and os.path.exists(dirName) == False:
+            os.makedirs(dirName)
+        tempFile = self.checkpointFile + '.tmp'
+        with open(tempFile, 'wb') as file:
+            pickle.dump(checkpoint, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tempFile, self.checkpointFile)
+    
+    def restoreState(self):
+        """
+        描述: 若正在从检查点恢复（详见resume()），则恢复检查点中算法模板的动态参数并返回True，否则返回False。
+        """
+        
+        if self.resumeState is None:
+            return False
+        checkpoint = self.resumeState
+        self.__dict__.update(checkpoint['state'])
+        if checkpoint['evalCache'] is not None and self.evalCache is not None:
+            self.evalCache.records, self.evalCache.hits, self.evalCache.misses = checkpoint['evalCache']
+        if checkpoint.get('surrogate') is not None and self.surrogate is not None:
+            self.surrogate.Phen, self.surrogate.ObjV, self.surrogate.vio, self.surrogate.screened, self.surrogate.saved, self.surrogate.fits = checkpoint['surrogate']
+            self.surrogate.fitted = None # 模型在下一次预筛选时重新拟合
+        if 'traceFileSize' in checkpoint:
+            os.truncate(self.pop_trace.fileName, checkpoint['traceFileSize'])
+        self.arena = ea.PopArena() # 缓冲区不保存在检查点中，重新初始化即可
+        self.timeSlot = time.time() # 重新开始计时
+        return True
+    
+    def restoreLoop(self):
+        """
+        描述: 若正在从检查点恢复，则恢复Numpy随机数生成器的状态，并返回[population, states]，
+        即检查点中的种群以及算法模板的循环状态，此时算法模板应跳过进化前的准备工作，直接进入进化循环；
+        否则返回None。
+        """
+        
+        if self.resumeState is None:
+            return None
+        checkpoint = self.resumeState
+        self.resumeState = None
+        np.random.set_state(checkpoint['random'])
+        return [checkpoint['population'], checkpoint['loop']]
     
+    def resume(self, fileName = None):
+        """
+        描述: 从检查点文件fileName（缺省或为None时为checkpointFile）恢复，并继续进化，返回值与run()相同。
+        调用前需要像第一次运行时那样创建好问题对象和算法模板对象并设置好参数，
+        恢复后的进化过程与未中断时完全相同（受MAXTIME限制的进化除外）。
+        若没有设置checkpointFile，则之后的检查点也保存到fileName中。
+        """
+        
+        fileName = self.checkpointFile if fileName is None else fileName
+        if fileName is None:
+            raise RuntimeError('error in Algorithm: No checkpoint file is given. (没有指定检查点文件。)')
+        with open(fileName, 'rb') as file:
+            checkpoint = pickle.load(file)
+        if checkpoint['class'] != self.__class__.__name__:
+            raise RuntimeError('error in Algorithm: The checkpoint was saved by ' + checkpoint['class'] + '. (该检查点是由' + checkpoint['class'] + '保存的。)')
+        if self.checkpointFile is None:
+            self.checkpointFile = fileName
+        self.resumeState = checkpoint
+        return self.run()
+
+    def draw(self, frames):
+        """
+        描述: 把当代的一帧动态图交给绘图接收器（详见PlotSink类），frames的每个元素形如[绘图函数名, 数据矩阵, 标签]。
+        绘图接收器在第一次调用时创建，它在单独的进程中绘图，来不及绘制的帧会被直接丢弃，因此该函数不会等待绘图。
+        """
+
+        if self.plotSink is None:
+            self.plotSink = ea.PlotSink()
+        self.plotSink.send(self.currentGen, frames)
+
+    def tick(self, phase):
+        """
+        描述: 设置了profiler时，把从上一次计时到现在的用时计入阶段phase（详见Profiler类），否则什么也不做。
+        """
+
+        if self.profiler is not None:
+            self.profiler.tick(phase)
+
+    def addHook(self, event, hook):
+        """
+        描述: 为事件event注册钩子函数hook，同一事件的各钩子函数按注册的先后顺序调用。
+        hook的形式为hook(algorithm, population)，返回True时请求终止进化。可选的事件详见hooks属性。
+        """
+
+        if event not in _EVENTS:
+            raise RuntimeError('error in Algorithm: No such event: ' + str(event) + '. (没有名为' + str(event) + '的事件。)')
+        self.hooks.setdefault(event, []).append(hook)
+
+    def removeHook(self, event, hook):
+        """
+        描述: 注销事件event的钩子函数hook。
+        """
+
+        if hook in self.hooks.get(event, []):
+            self.hooks[event].remove(hook)
+            if len(self.hooks[event]) == 0:
+                del self.hooks[event] # 保证没有钩子时hooks为空字典，使算法模板可以跳过触发事件
+    
+    def fire(self, event, pop):
+        """
+        描述: 依次调用事件event的各钩子函数，若有钩子函数返回True，则把stopRequested设为True。
+        算法模板在触发事件前先判断hooks是否为空，因此没有注册钩子时不会调用该函数。
+        """
+
+        for hook in self.hooks.get(event, []):
+            if hook(self, pop) == True:
+                self.stopRequested = True
+
+    def closePlotSink(self):
+        """
+        描述: 等待动态图的最后一帧绘制完毕，然后关闭绘图接收器。
+        """
+
+        if self.plotSink is not None:
+            self.plotSink.close()
+            self.plotSink = None
+
     def terminated(self):
         pass
     
     def run(self):
         pass
+    
+    def __init_subclass__(cls, **kwargs):
+        # 包装算法模板自己定义的run()，使进化正常结束、出错或被中断时都能恢复原来的随机数生成器
+        super().__init_subclass__(**kwargs)
+        if 'run' in cls.__dict__:
+            cls.run = _restoringRng(cls.__dict__['run'])
 
 class MoeaAlgorithm(Algorithm): # 多目标优化算法模板父类
     
@@ -86,47 +412,81 @@ class MoeaAlgorithm(Algorithm): # 多目标优化算法模板父类
         self.problem = problem
         self.population = population
         self.drawing = 1 # 绘图
-        self.ax1 = None # 用于存储目标空间动态图
-        self.ax2 = None # 用于存储决策空间动态图
         self.forgetCount = None # “遗忘策略”计数器，用于记录连续若干代出现种群所有个体都不是可行个体的次数
         self.maxForgetCount = None # “遗忘策略”计数器最大上限值
         self.pop_trace = None # 种群记录器
+        self.traceMode = 'full' # 种群记录器在内存中的记录方式，'full'：记录完整种群；'objv'：只记录ObjV和CV；'off'：不记录
+        self.traceGap = 1 # 种群记录器每隔多少代记录一次
+        self.traceMaxLen = None # 种群记录器在内存中最多保留的记录数，为None时不限制
+        self.traceFile = None # 种群记录器流式写入的文件路径，为None时不写文件
+        self.tracker = None # 指标追踪器（详见MetricTracker类），设置后每记录一代都会在线计算该代的指标
+        self.archive = None # 帕累托存档（详见ParetoArchive类），设置后每一代的种群都会被插入其中，finishing()返回存档中的非支配个体
+        self.archivedPop = None # 最近一次由stat()插入帕累托存档的种群，finishing()不再重复插入该种群
     
     def initialization(self):
         """
         描述: 该函数用于在进化前对算法模板的参数进行初始化操作。
         该函数需要在执行算法模板的run()方法的一开始被调用，同时开始计时，
-        以确保所有这些参数能够被正确初始化。
+        以确保所有这些参数能够被正确初始化。从检查点恢复时则恢复检查点中的参数。
         """
-        self.ax1 = None # 重置ax1
-        self.ax2 = None # 重置ax2
+        if self.profiler is not None:
+            self.profiler.start() # 开始分阶段计时
+        self.archivedPop = None
+        if self.restoreState(): # 从检查点恢复（详见resume()）
+            self.previousRng = ea.setRng(self.rng) # 使用检查点中的随机数生成器
+            if self.hooks:
+                self.fire('start', self.population) # 触发“开始”事件
+            return
         self.passTime = 0 # 初始化计时器
         self.forgetCount = 0 # 初始化“遗忘策略”计数器
         self.maxForgetCount = 1000 # 初始化“遗忘策略”计数器最大上限值
-        self.pop_trace = [] # 初始化种群记录器
+        self.checkBudget() # 检查终止条件
+        self.pop_trace = ea.PopTrace(self.traceMode, self.traceGap, self.traceMaxLen, self.traceFile) # 初始化种群记录器（详见PopTrace类）
+        self.arena = ea.PopArena() # 初始化种群缓冲区，其容量在第一次合并种群时确定
+        if self.tracker is not None:
+            self.tracker.clear() # 清空指标追踪器的记录
+        if self.archive is not None:
+            self.archive.clear() # 清空帕累托存档
         self.currentGen = 0 # 设置初始为第0代
+        self.evalsNum = 0 # 初始化评价次数
+        self.stopRequested = False # 清除钩子函数的终止请求
+        if self.seed is not None:
+            self.rng = np.random.default_rng(self.seed)
+        self.previousRng = ea.setRng(self.rng) # 让各算子使用算法模板的随机数生成器
+        if self.hooks:
+            self.fire('start', self.population) # 触发“开始”事件
         self.timeSlot = time.time() # 开始计时
     
     def stat(self, pop): # 分析记录，更新进化记录器，pop为当代种群对象，NDSet为当代的种群中的非支配个体集
         feasible = np.where(np.all(pop.CV <= 0, 1))[0] # 找到可行解个体的下标
         if len(feasible) > 0:
-            self.pop_trace.append(pop) # 添加记录
+            self.pop_trace.record(pop, self.currentGen) # 添加记录
+            if self.archive is not None:
+                self.archive.insert(pop) # 增量地更新帕累托存档
+                self.archivedPop = pop
             self.forgetCount = 0 # “遗忘策略”计数器清零
             self.passTime += time.time() - self.timeSlot # 更新用时记录
+            if self.tracker is not None:
+                self.tracker.update(pop, self.currentGen) # 在线计算指标，其用时不计入passTime
             if self.drawing == 2:
-                # 绘制目标空间动态图
-                self.ax1 = ea.moeaplot(pop.ObjV, 'objective values', False, self.ax1, self.currentGen)
-                # 绘制决策空间动态图
-                self.ax2 = ea.varplot(pop.Phen, 'decision variables', False, self.ax2, self.currentGen)
+                # 绘制目标空间及决策空间动态图
+                self.draw([['moeaplot', pop.ObjV, 'objective values'], ['varplot', pop.Phen, 'decision variables']])
             self.timeSlot = time.time() # 更新时间戳
         else:
             self.currentGen -= 1 # 忽略这一代
             self.forgetCount += 1 # “遗忘策略”计数器加1
         
-    def terminated(self, pop): # 判断是终止进化，pop为当代种群对象，NDSet为当代的种群中的非支配个体集
+    def terminated(self, pop, *states): # 判断是终止进化，pop为当代种群对象，states为算法模板需要跨代保存的循环状态
+        self.tick('other') # 上一次计时之后未单独计时的用时
+        self.saveCheckpoint(pop, states) # 保存检查点
         self.stat(pop) # 进行统计分析，更新进化记录器
-        # 判断是否终止进化，由于代数是从0数起，因此在比较currentGen和MAXGEN时需要对currentGen加1
-        if self.currentGen + 1 >= self.MAXGEN or self.forgetCount >= self.maxForgetCount:
+        if self.profiler is not None:
+            self.tick('stat')
+            self.profiler.endGen(self.currentGen)
+        if self.hooks:
+            self.fire('generationEnd', pop) # 触发“一代结束”事件
+        # 判断是否终止进化
+        if self.exhausted() or self.forgetCount >= self.maxForgetCount or self.stopRequested:
             return True
         else:
             self.currentGen += 1 # 进化代数+1
@@ -134,10 +494,20 @@ class MoeaAlgorithm(Algorithm): # 多目标优化算法模板父类
     
     def finishing(self, population): # 进化完成后调用的函数
         # 得到非支配种群
-        [levels, criLevel] = ea.ndsortDED(self.problem.maxormins * population.ObjV, None, 1, population.CV) # 非支配分层
-        NDSet = population[np.where(levels == 1)[0]] # 只保留种群中的非支配个体，形成一个非支配种群
+        if self.archive is not None:
+            if population is not self.archivedPop: # 最后一代种群若已在stat()中插入则不再重复插入（存档不去重时会产生重复个体）
+                self.archive.insert(population)
+            NDSet = self.archive.NDSet if self.archive.NDSet is not None else population[np.zeros(0, dtype = int)]
+        else:
+            [levels, criLevel] = ea.ndsortSweep(self.problem.maxormins * population.ObjV, None, 1, population.CV) # 非支配分层
+            NDSet = population[np.where(levels == 1)[0]] # 只保留种群中的非支配个体，形成一个非支配种群
         NDSet = NDSet[np.where(np.all(NDSet.CV <= 0, 1))[0]] # 最后要彻底排除非可行解
         self.passTime += time.time() - self.timeSlot # 更新用时记录
+        self.problem.closePool() # 释放并行评价所用的进程池
+        self.closePlotSink() # 关闭绘图接收器
+        ea.setRng(self.previousRng) # 恢复原来的随机数生成器
+        if self.hooks:
+            self.fire('finish', NDSet) # 触发“结束”事件
         # 绘图
         if self.drawing != 0:
             ea.moeaplot(NDSet.ObjV, 'Pareto Front', True)
@@ -160,20 +530,34 @@ class SoeaAlgorithm(Algorithm): # 单目标优化算法模板父类
         self.drawing = 1 # 绘图
         self.maxForgetCount = 1000 # “遗忘策略”计数器最大上限值
         self.forgetCount = None # “遗忘策略”计数器，用于记录连续若干代出现种群所有个体都不是可行个体的次数
-        self.ax = None # 存储上一桢动画
     
     def initialization(self):
         """
         描述: 该函数用于在进化前对算法模板的一些动态参数进行初始化操作
         该函数需要在执行算法模板的run()方法的一开始被调用，同时开始计时，
-        以确保所有这些参数能够被正确初始化。
+        以确保所有这些参数能够被正确初始化。从检查点恢复时则恢复检查点中的参数。
         """
-        self.ax = None # 设ax为None，确保初始化
+        if self.profiler is not None:
+            self.profiler.start() # 开始分阶段计时
+        if self.restoreState(): # 从检查点恢复（详见resume()）
+            self.previousRng = ea.setRng(self.rng) # 使用检查点中的随机数生成器
+            if self.hooks:
+                self.fire('start', self.population) # 触发“开始”事件
+            return
         self.passTime = 0 # 记录用时
         self.forgetCount = 0 # “遗忘策略”计数器，用于记录连续若干代出现种群所有个体都不是可行个体的次数
-        self.obj_trace = np.zeros((self.MAXGEN, 2)) * np.nan # 定义目标函数值记录器，初始值为nan
-        self.var_trace = np.zeros((self.MAXGEN, self.problem.Dim)) * np.nan # 定义变量记录器，记录决策变量值，初始值为nan
+        self.checkBudget() # 检查终止条件
+        self.obj_trace = [] # 定义目标函数值记录器，每一代记录一行[种群个体平均目标函数值, 最优个体目标函数值]
+        self.var_trace = [] # 定义变量记录器，每一代记录一行最优个体的决策变量值
+        self.arena = ea.PopArena() # 初始化种群缓冲区，其容量在第一次合并种群时确定
         self.currentGen = 0 # 设置初始为第0代
+        self.evalsNum = 0 # 初始化评价次数
+        self.stopRequested = False # 清除钩子函数的终止请求
+        if self.seed is not None:
+            self.rng = np.random.default_rng(self.seed)
+        self.previousRng = ea.setRng(self.rng) # 让各算子使用算法模板的随机数生成器
+        if self.hooks:
+            self.fire('start', self.population) # 触发“开始”事件
         self.timeSlot = time.time() # 开始计时
 
     def stat(self, pop): # 分析记录，更新进化记录器
@@ -182,44 +566,91 @@ class SoeaAlgorithm(Algorithm): # 单目标优化算法模板父类
         if len(feasible) > 0:
             tempPop = pop[feasible]
             bestIdx = np.argmax(tempPop.FitnV) # 获取最优个体的下标
-            self.obj_trace[self.currentGen,0] = np.sum(tempPop.ObjV) / tempPop.sizes # 记录种群个体平均目标函数值
-            self.obj_trace[self.currentGen,1] = tempPop.ObjV[bestIdx] # 记录当代目标函数的最优值
-            self.var_trace[self.currentGen,:] = tempPop.Phen[bestIdx, :] # 记录当代最优的决策变量值
+            self.obj_trace.append([np.sum(tempPop.ObjV) / tempPop.sizes, # 记录种群个体平均目标函数值
+                                   tempPop.ObjV[bestIdx, 0]]) # 记录当代目标函数的最优值
+            self.var_trace.append(tempPop.Phen[bestIdx, :]) # 记录当代最优的决策变量值
             self.forgetCount = 0 # “遗忘策略”计数器清零
             self.passTime += time.time() - self.timeSlot # 更新用时记录
             if self.drawing == 2:
-                self.ax = ea.soeaplot(self.obj_trace[:,[1]], None , False, self.ax, self.currentGen) # 绘制动态图
+                self.draw([['soeaplot', np.array(self.obj_trace)[:,[1]], None]]) # 绘制动态图
             self.timeSlot = time.time() # 更新时间戳
         else:
             self.currentGen -= 1 # 忽略这一代
             self.forgetCount += 1 # “遗忘策略”计数器加1
     
-    def terminated(self, population):
+    def terminated(self, population, *states):
         
         """
         描述:
             该函数用于判断是否应该终止进化，population为传入的种群，
+            states为算法模板需要跨代保存的循环状态（用于保存检查点，详见saveCheckpoint()）。
         """
         
+        self.tick('other') # 上一次计时之后未单独计时的用时
+        self.saveCheckpoint(population, states) # 保存检查点
         self.stat(population) # 分析记录当代种群的数据
-        # 判断是否终止进化，由于代数是从0数起，因此在比较currentGen和MAXGEN时需要对currentGen加1
-        if self.currentGen + 1 >= self.MAXGEN or self.forgetCount >= self.maxForgetCount:
+        if self.profiler is not None:
+            self.tick('stat')
+            self.profiler.endGen(self.currentGen)
+        if self.hooks:
+            self.fire('generationEnd', population) # 触发“一代结束”事件
+        # 判断是否终止进化
+        if self.exhausted() or self.forgetCount >= self.maxForgetCount or self.stopRequested:
             return True
         else:
             self.currentGen += 1 # 进化代数+1
             return False
 
     def finishing(self, population): # 进化完成后调用的函数
-        # 处理进化记录器
-        delIdx = np.where(np.isnan(self.obj_trace))[0]
-        self.obj_trace = np.delete(self.obj_trace, delIdx, 0)
-        self.var_trace = np.delete(self.var_trace, delIdx, 0)
-        if self.obj_trace.shape[0] == 0:
+        self.problem.closePool() # 释放并行评价所用的进程池
+        self.closePlotSink() # 关闭绘图接收器
+        ea.setRng(self.previousRng) # 恢复原来的随机数生成器
+        if len(self.obj_trace) == 0:
             raise RuntimeError('error: No feasible solution. (有效进化代数为0，没找到可行解。)')
+        # 处理进化记录器，把它们转换成矩阵
+        self.obj_trace = np.array(self.obj_trace)
+        self.var_trace = np.array(self.var_trace)
         self.passTime += time.time() - self.timeSlot # 更新用时记录
+        if self.hooks:
+            self.fire('finish', population) # 触发“结束”事件
         # 绘图
         if self.drawing != 0:
             ea.trcplot(self.obj_trace, [['种群个体平均目标函数值', '种群最优个体目标函数值']])
         # 返回最后一代种群、进化记录器、变量记录器以及执行时间
         return [population, self.obj_trace, self.var_trace]
-    
\ No newline at end of file
+    
+
+# 算法模板触发的事件（详见Algorithm类的hooks属性）
+_EVENTS = ['start', 'afterEvaluation', 'afterReinsertion', 'generationEnd', 'finish']
+
+# 不保存到检查点中的属性：问题对象、初始种群、缓冲区、绘图对象、计时器、钩子函数（可能无法序列化）、外部的随机数生成器、时间戳，以及恢复时允许重新设置的参数
+_TRANSIENT = {'problem', 'population', 'arena', 'plotSink', 'profiler', 'hooks', 'previousRng', 'timeSlot', 'drawing', 'poolSize', 'evalCache', 'surrogate', 'archivedPop',
+              'MAXGEN', 'MAXTIME', 'MAXEVALS', 'checkpointFile', 'checkpointGap', 'resumeState'}
+
+def _restoringRng(run):
+    """
+    描述: 返回包装后的run()：无论run()正常返回还是抛出异常（包括KeyboardInterrupt），
+    都把当前随机数生成器恢复为调用run()之前的生成器，避免算法模板的rng在出错后仍被后续代码使用。
+    """
+    
+    @functools.wraps(run)
+    def wrapper(self, *args, **kwargs):
+        previous = ea.getRng()
+        try:
+            return run(self, *args, **kwargs)
+        finally:
+            ea.setRng(previous)
+    return wrapper
+
+def _truncate(pop, num):
+    """
+    描述: 把种群原地截断为其前num个个体。
+    """
+    
+    sizes = pop.sizes
+    pop.sizes = num
+    pop.Chrom = pop.Chrom[:num] if pop.Chrom is not None else None
+    pop.ObjV = pop.ObjV[:num] if pop.ObjV is not None and pop.ObjV.shape[0] == sizes else pop.ObjV
+    pop.FitnV = pop.FitnV[:num] if pop.FitnV is not None and pop.FitnV.shape[0] == sizes else pop.FitnV
+    pop.CV = pop.CV[:num] if pop.CV is not None and pop.CV.shape[0] == sizes else pop.CV
+    pop.Phen = pop.Phen[:num] if pop.Phen is not None else None
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import time
+import queue
+import numpy as np
+
+class AsyncEvaluator:
+
+    """
+AsyncEvaluator : class - 异步评价器类
+
+描述:
+    代际算法模板每一代都要等种群中最慢的个体评价完才能开始下一代，当各个体的评价用时相差很大时（如调用仿真程序），
+    进程池中的大部分进程在每一代的后期都处于空闲状态。异步评价器把个体逐个提交到问题对象的进程池或线程池中
+    （详见Problem类的submit()），哪个个体先评价完就先返回哪个，使稳态算法模板可以在每得到一个评价结果后
+    立即把它插入种群并生成下一个个体提交评价，从而让所有进程始终保持忙碌。
+    poolSize为None或不大于1时不使用池，提交的个体在submit()中直接由主进程评价。
+    异步评价器同时统计各进程（线程）的忙碌时间，用于计算进程利用率。
+    用法:
+        evaluator = ea.AsyncEvaluator(problem, poolSize)
+        evaluator.submit(offspring)  # 提交一个个体
+        ...
+        offspring = evaluator.next() # 等待并取回最先评价完的一个个体（其ObjV和CV已写好）
+        evaluator.close()
+
+属性:
+    problem  : class <Problem> - 问题类的对象。
+
+    poolSize : int   - 池的大小，为None或不大于1时在主进程中评价。
+
+    workers  : int   - 同时评价的个体数上限，即池的大小（不使用池时为1）。
+
+    pending  : int   - 已提交但尚未取回的个体数。
+
+    count    : int   - 已取回的个体数。
+
+    busyTime : float - 各进程（线程）调用aimFunc的累计用时（单位：秒）。
+
+函数:
+    submit(pop)   : 提交种群pop（通常只含一个个体）进行评价，不等待评价完成。
+
+    next()        : 等待并返回最先评价完成的种群，其ObjV和CV已是评价结果。
+
+    utilization() : 返回从创建评价器到现在的进程利用率，即busyTime / (workers * 经过的时间)。
+
+    close()       : 停止计时。池由问题对象管理，在算法模板的finishing()中随problem.closePool()释放。
+
+"""
+
+    def __init__(self, problem, poolSize = None):
+        self.problem = problem
+        self.poolSize = poolSize
+        self.workers = poolSize if poolSize is not None and poolSize > 1 else 1
+        self.results = queue.Queue() # 评价结果队列，由池的结果处理线程放入
+        self.jobs = {} # 已提交但尚未取回的种群，键为提交的序号
+        self.serial = 0
+        self.pending = 0
+        self.count = 0
+        self.busyTime = 0.0
+        self.startTime = time.perf_counter()
+        self.endTime = None
+
+    def submit(self, pop):
+        job = self.serial
+        self.serial += 1
+        self.jobs[job] = pop
+        self.pending += 1
+        if self.poolSize is None or self.poolSize <= 1:
+            start = time.perf_counter()
+            self.problem.aimFunc(pop)
+            self.results.put((job, [pop.ObjV, pop.CV, time.perf_counter() - start], None))
+        else:
+            self.problem.submit(pop, self.poolSize, lambda result : self.results.put((job, result, None)),
+                                lambda error : self.results.put((job, None, error)))
+
+    def next(self):
+        """
+        描述: 等待并返回最先评价完成的种群，并把评价结果写到其ObjV和CV中。
+        评价出错时抛出aimFunc所抛出的异常。没有已提交的个体时抛出RuntimeError。
+        """
+
+        if self.pending == 0:
+            raise RuntimeError('error in AsyncEvaluator: No individual is being evaluated. (没有正在评价的个体。)')
+        job, result, error = self.results.get()
+        pop = self.jobs.pop(job)
+        self.pending -= 1
+        if error is not None:
+            raise error
+        pop.ObjV, CV, elapsed = result
+        pop.CV = CV if CV is not None else np.zeros((pop.sizes, 1))
+        self.busyTime += elapsed
+        self.count += 1
+        return pop
+
+    def utilization(self):
+        elapsed = (self.endTime if self.endTime is not None else time.perf_counter()) - self.startTime
+        return self.busyTime / (self.workers * elapsed) if elapsed > 0 else 0.0
+
+    def close(self):
+        self.endTime = time.perf_counter()
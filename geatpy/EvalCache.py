@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from collections import OrderedDict
+
+class EvalCache:
+
+    """
+EvalCache : class - 评价缓存类
+
+描述:
+    评价缓存类用于记忆已经评价过的个体的目标函数值和违反约束程度，
+    以个体染色体（或表现型）每一行的字节作为键，当再次遇到相同的个体时直接取出结果而不调用aimFunc。
+    在采用'P'或'BG'编码、或求解整数'RI'问题时，选择和低变异率往往会反复生成已评价过的个体，
+    此时若aimFunc计算代价高昂，则使用评价缓存可以显著减少评价次数。
+    缓存的容量有限，满了之后按LRU（最近最少使用）原则淘汰旧的记录。
+    用法: 设置算法模板对象的evalCache属性即可启用，例如：
+         myAlgorithm.evalCache = ea.EvalCache(10000)
+    此时算法模板的evalsNum只统计真正调用aimFunc评价的个体数。
+    注意: 只有当个体的目标函数值只由其自身决定（而与同一种群中的其他个体无关）时才能使用评价缓存。
+
+属性:
+    MAXSIZE  : int   - 缓存最多能记录的个体数。
+
+    key      : str   - 用哪个矩阵的行作为键，'Phen'（默认）表示表现型，'Chrom'表示染色体。
+
+    hits     : int   - 命中缓存的个体数。
+
+    misses   : int   - 未命中缓存、需要真正评价的个体数。
+
+    records  : OrderedDict - 缓存记录，键为行的字节，值为(ObjV行, CV行)。
+
+函数:
+    evaluate(problem, pop, poolSize, maxEvals) : 利用缓存评价种群，返回真正评价的个体数。
+
+    clear() : 清空缓存及计数器。
+
+"""
+
+    def __init__(self, MAXSIZE = 10000, key = 'Phen'):
+        if key != 'Phen' and key != 'Chrom':
+            raise RuntimeError('error in EvalCache: key must be ''Phen'' or ''Chrom''. (key必须为''Phen''或''Chrom''。)')
+        self.MAXSIZE = MAXSIZE
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self.records = OrderedDict()
+
+    def __len__(self):
+        return len(self.records)
+
+    def clear(self):
+        """
+        描述: 清空缓存记录及命中计数器。
+        """
+
+        self.hits = 0
+        self.misses = 0
+        self.records.clear()
+
+    def evaluate(self, problem, pop, poolSize = None, maxEvals = None):
+        """
+        描述: 利用缓存评价种群pop，计算其ObjV和CV。
+        缓存中已有的个体直接取出结果，其余个体（同一种群中的重复个体只算一个）
+        组成一个子种群交由problem.evaluation()评价，并把结果存入缓存。
+        maxEvals为允许真正评价的个体数，为None时不限制。需要评价的个体多于maxEvals时，
+        只评价前maxEvals个，其余未命中缓存的个体被从pop中原地删除，命中缓存的个体则全部保留。
+        返回真正评价的个体数。
+        """
+
+        if pop.sizes == 0:
+            _clearResults(problem, pop)
+            return 0
+        Keys = pop.Phen if self.key == 'Phen' else pop.Chrom
+        Keys = np.ascontiguousarray(Keys)
+        keys = [row.tobytes() for row in Keys]
+        ObjVs = [None] * pop.sizes
+        CVs = [None] * pop.sizes
+        missIdx = [] # 需要真正评价的个体的下标
+        missKeys = {} # 需要真正评价的个体的键到其在missIdx中的位置的映射
+        repeats = [] # 与本种群中待评价个体重复的个体的下标
+        for i, key in enumerate(keys):
+            if key in self.records:
+                self.records.move_to_end(key)
+                ObjVs[i], CVs[i] = self.records[key]
+            elif key in missKeys:
+                repeats.append(i)
+            else:
+                missKeys[key] = len(missIdx)
+                missIdx.append(i)
+        if maxEvals is not None and len(missIdx) > maxEvals: # 超出评价次数预算的个体不评价，从种群中删除
+            dropped = set(keys[i] for i in missIdx[maxEvals:])
+            keep = np.array([i for i in range(pop.sizes) if keys[i] not in dropped], dtype = int)
+            _select(pop, keep)
+            keys = [keys[i] for i in keep]
+            ObjVs = [ObjVs[i] for i in keep]
+            CVs = [CVs[i] for i in keep]
+            position = {old : new for new, old in enumerate(keep)}
+            missIdx = [position[i] for i in missIdx[:maxEvals]]
+            repeats = [position[i] for i in repeats if i in position]
+            if pop.sizes == 0:
+                _clearResults(problem, pop)
+                return 0
+        self.hits += pop.sizes - len(missIdx)
+        self.misses += len(missIdx)
+        if len(missIdx) > 0:
+            missIdx = np.array(missIdx)
+            subPop = pop.__class__(pop.Encoding,
+                                   pop.Field,
+                                   len(missIdx),
+                                   pop.Chrom[missIdx] if pop.Chrom is not None else None,
+                                   None,
+                                   None,
+                                   pop.CV[missIdx] if pop.CV is not None and pop.CV.shape[0] == pop.sizes else None,
+                                   pop.Phen[missIdx])
+            problem.evaluation(subPop, poolSize)
+            for j, i in enumerate(missIdx):
+                ObjVs[i], CVs[i] = subPop.ObjV[j].copy(), subPop.CV[j].copy()
+                self.records[keys[i]] = (ObjVs[i], CVs[i])
+            for i in repeats:
+                ObjVs[i], CVs[i] = ObjVs[missIdx[missKeys[keys[i]]]], CVs[missIdx[missKeys[keys[i]]]]
+            while len(self.records) > self.MAXSIZE: # 淘汰最近最少使用的记录
+                self.records.popitem(last = False)
+        pop.ObjV = np.vstack(ObjVs)
+        pop.CV = np.vstack(CVs)
+        return len(missIdx)
+
+def _clearResults(problem, pop):
+    # 空种群的ObjV和CV为0行的矩阵
+    pop.ObjV = np.zeros((0, problem.M))
+    pop.CV = np.zeros((0, pop.CV.shape[1] if pop.CV is not None else 1))
+
+def _select(pop, index):
+    """
+    描述: 把种群原地缩减为index对应的个体。
+    """
+
+    sizes = pop.sizes
+    pop.sizes = len(index)
+    pop.Chrom = pop.Chrom[index] if pop.Chrom is not None else None
+    pop.ObjV = pop.ObjV[index] if pop.ObjV is not None and pop.ObjV.shape[0] == sizes else pop.ObjV
+    pop.FitnV = pop.FitnV[index] if pop.FitnV is not None and pop.FitnV.shape[0] == sizes else pop.FitnV
+    pop.CV = pop.CV[index] if pop.CV is not None and pop.CV.shape[0] == sizes else pop.CV
+    pop.Phen = pop.Phen[index] if pop.Phen is not None else None
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import os
+import itertools
+import traceback
+import multiprocessing
+import numpy as np
+import geatpy as ea
+
+class Experiment:
+
+    """
+Experiment : class - 批量实验类
+
+描述:
+    testbed中的moea_test_*、soea_test_*脚本每次只在一个问题上串行地运行一个算法模板一次，并把结果写到当前文件夹中。
+    比较算法时需要在多个问题上以多个随机数种子重复运行多个算法模板，批量实验类把这些运行组成一个网格，
+    每一次运行由(算法模板, 问题, 参数, 随机数种子)确定，用进程池并行执行各次运行，
+    并把每次运行的用时passTime、评价次数evalsNum、进化代数以及最终的评价指标收集到一个按列存储的结果文件中。
+    每次运行都在saveDir中自己的子文件夹（run_序号）中进行，算法模板或问题在运行过程中写出的文件
+    （如种群记录器的traceFile、检查点）都保存在该子文件夹中，不同的运行之间互不干扰。
+    各问题的理论最优解（Problem.getBest()）在主进程中计算一次后传给各次运行，并保存在saveDir的Real_Best文件夹中。
+    结果文件是一个.npz文件，其中每一列（每一个指标）是一个行向量，第i个元素对应第i次运行：
+    'templet'  : 算法模板的类名；
+    'problem'  : 问题的名称；
+    'params'   : 参数字典的字符串表示；
+    'seed'     : 随机数种子，用作算法模板的seed属性（详见Algorithm类），必须为整数，以保证每次运行都可以复现；
+    'passTime' : 算法模板的用时（单位：秒）；
+    'evalsNum' : 评价次数；
+    'gens'     : 进化代数（包括第0代，即algorithm.currentGen + 1）；
+    'NDSize'   : 多目标时为结果中非支配个体的数目，单目标时为1；
+    'GD'、'IGD'、'HV'、'Spacing' : 多目标时结果的评价指标（没有理论最优解时GD和IGD为NaN），单目标时为NaN；
+    'bestObjV' : 单目标时找到的最优目标函数值，多目标时为NaN；
+    'gap'      : 单目标时最优目标函数值与理论最优值之差的绝对值（没有理论最优值时为NaN），多目标时为NaN；
+    'error'    : 运行出错时为出错信息，否则为空字符串，出错的运行的各数值列为NaN。
+    用法:
+        experiment = ea.Experiment([ea.moea_NSGA2_templet, ea.moea_NSGA3_templet], [ZDT1(), DTLZ1()], range(30), [{'MAXGEN' : 200}])
+        results = experiment.run() # 结果同时保存在saveDir/results.npz中
+        results = ea.Experiment.load('Experiment/results.npz')
+
+构造方法:
+    Experiment(templets, problems, seeds, params = None, poolSize = None, saveDir = 'Experiment')
+    templets为算法模板类的列表，problems为问题对象的列表，seeds为随机数种子的列表，params为参数字典的列表（缺省时为[{}]）。
+
+属性:
+    runs      : list  - 各次运行组成的列表，每个元素为(算法模板类, 问题对象, 参数字典, 随机数种子)。
+                        构造方法根据传入的各列表生成它们的笛卡尔积，也可以在调用run()之前直接修改该列表。
+                        参数字典中的'Encoding'和'NIND'分别为种群的编码方式和种群规模（缺省时为'RI'和50），
+                        其余的键值对用于设置算法模板的同名属性，如{'MAXGEN' : 200, 'NIND' : 100}。
+
+    poolSize  : int   - 进程池的进程数，缺省或为None时为CPU核数。
+
+    saveDir   : str   - 保存各次运行的子文件夹以及结果文件的文件夹，默认为'Experiment'。
+
+    fileName  : str   - 结果文件的文件名，默认为'results.npz'。
+
+    results   : dict  - 最近一次run()的结果，键为列名，值为Numpy array类型的行向量。
+
+函数:
+    run()          : 执行所有运行，返回结果字典并保存结果文件。
+
+    load(fileName) : 静态方法，读取结果文件，返回结果字典。
+
+"""
+
+    def __init__(self, templets, problems, seeds, params = None, poolSize = None, saveDir = 'Experiment'):
+        self.runs = [(templet, problem, paramDict, seed) for templet, problem, paramDict, seed in
+                     itertools.product(templets, problems, params if params is not None else [{}], seeds)]
+        self.poolSize = poolSize
+        self.saveDir = saveDir
+        self.fileName = 'results.npz'
+        self.results = None
+
+    def run(self):
+        for templet, problem, paramDict, seed in self.runs: # 在开始运行前检查种子，避免全部运行结束后才因无法保存结果而出错
+            if not isinstance(seed, (int, np.integer)) or isinstance(seed, bool):
+                raise RuntimeError('error in Experiment: Each seed must be an integer, got ' + repr(seed) + '. (随机数种子必须为整数。)')
+        if os.path.exists(self.saveDir) == False:
+            os.makedirs(self.saveDir)
+        # 在主进程中读取/计算各问题的理论最优解，避免各次运行重复计算及同时写同一个文件
+        cwd = os.getcwd()
+        os.chdir(self.saveDir)
+        try:
+            bests = {}
+            for templet, problem, paramDict, seed in self.runs:
+                if id(problem) not in bests:
+                    bests[id(problem)] = problem.getBest()
+        finally:
+            os.chdir(cwd)
+        tasks = [(index, templet, problem, paramDict, seed, bests[id(problem)], os.path.join(os.path.abspath(self.saveDir), 'run_' + str(index)))
+                 for index, (templet, problem, paramDict, seed) in enumerate(self.runs)]
+        rows = [None] * len(tasks)
+        pool = multiprocessing.Pool(self.poolSize)
+        try:
+            for index, row in pool.imap_unordered(_runOne, tasks):
+                rows[index] = row
+        finally:
+            pool.close()
+            pool.join()
+        self.results = {name : np.array([row[name] for row in rows], dtype = dtype) for name, dtype in _COLUMNS}
+        np.savez(os.path.join(self.saveDir, self.fileName), **self.results)
+        return self.results
+
+    @staticmethod
+    def load(fileName):
+        """
+        描述: 读取run()保存的结果文件，返回一个字典，键为列名，值为Numpy array类型的行向量。
+        """
+
+        with np.load(fileName) as data:
+            return {name : data[name] for name in data.files}
+
+# 结果文件的各列及其数据类型
+_COLUMNS = [('templet', str), ('problem', str), ('params', str), ('seed', int), ('passTime', float), ('evalsNum', float),
+            ('gens', float), ('NDSize', float), ('GD', float), ('IGD', float), ('HV', float), ('Spacing', float),
+            ('bestObjV', float), ('gap', float), ('error', str)]
+
+def _runOne(task):
+    # 进程池中执行一次运行：在该次运行的子文件夹中运行算法模板，返回(序号, 结果行)
+    index, templet, problem, paramDict, seed, PF, runDir = task
+    row = {name : (np.nan if dtype is float else '') for name, dtype in _COLUMNS}
+    row.update({'templet' : templet.__name__, 'problem' : problem.name, 'params' : str(paramDict), 'seed' : seed})
+    cwd = os.getcwd()
+    try:
+        if os.path.exists(runDir) == False:
+            os.makedirs(runDir)
+        os.chdir(runDir)
+        Field = ea.crtfld(paramDict.get('Encoding', 'RI'), problem.varTypes, problem.ranges, problem.borders)
+        population = ea.Population(paramDict.get('Encoding', 'RI'), Field, paramDict.get('NIND', 50))
+        algorithm = templet(problem, population)
+        algorithm.drawing = 0
+        for name, value in paramDict.items():
+            if name != 'Encoding' and name != 'NIND':
+                setattr(algorithm, name, value)
+        algorithm.seed = seed # 每次运行使用由自己的种子创建的随机数生成器，结果与进程池的进程数及执行顺序无关
+        result = algorithm.run()
+        row.update({'passTime' : algorithm.passTime, 'evalsNum' : algorithm.evalsNum, 'gens' : algorithm.currentGen + 1})
+        if isinstance(algorithm, ea.MoeaAlgorithm):
+            NDSet = result
+            row['NDSize'] = NDSet.sizes
+            if NDSet.sizes > 0:
+                if PF is not None:
+                    row['GD'] = ea.indicator.GD(NDSet.ObjV, PF)
+                    row['IGD'] = ea.indicator.IGD(NDSet.ObjV, PF)
+                row['HV'] = ea.indicator.HV(NDSet.ObjV, PF)
+                row['Spacing'] = ea.indicator.Spacing(NDSet.ObjV)
+        else:
+            obj_trace = result[1]
+            best = np.argmin(problem.maxormins[0] * obj_trace[:, 1])
+            row['NDSize'] = 1
+            row['bestObjV'] = obj_trace[best, 1]
+            if PF is not None:
+                row['gap'] = abs(obj_trace[best, 1] - PF[0, 0])
+    except Exception:
+        for name, dtype in _COLUMNS[4:-1]:
+            row[name] = np.nan
+        row['error'] = traceback.format_exc()
+    finally:
+        os.chdir(cwd)
+    return index, row
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+import time
+import queue
+import traceback
+import multiprocessing
+import numpy as np
+import geatpy as ea
+
+class IslandModel:
+
+    """
+IslandModel : class - 岛屿模型类
+
+描述:
+    一个算法模板只在一个进程中进化一个种群，当目标函数计算量不大时，并行评价（poolSize）带来的加速有限，无法利用多核机器。
+    岛屿模型在NUM个进程中分别运行同一个算法模板的一个副本（称为岛屿），每个岛屿进化自己的种群，
+    每隔migrationGap代，各岛屿按拓扑结构把若干个个体（迁移个体）复制给相邻的岛屿，并用收到的个体替换自己种群中的个体。
+    迁移通过各岛屿的接收队列（基于管道）完成，由算法模板的'generationEnd'事件（详见Algorithm类的hooks属性）触发，
+    因此任何内置算法模板（以及触发了该事件的自定义模板）都可以直接作为岛屿使用，无需修改。
+    迁移个体携带其目标函数值和违反约束程度，接收方不需要重新评价它们；替换后，这些位置的个体保留原有的适应度直到下一次计算适应度。
+    进化结束后，把各岛屿的结果合并为与算法模板的返回值格式相同的结果：
+    多目标优化算法模板返回合并后的非支配种群；
+    单目标优化算法模板返回[合并后的最后一代种群, 进化记录器, 变量记录器]，
+    进化记录器每一代的种群个体平均目标函数值取各岛屿的平均值，最优个体目标函数值及其决策变量取各岛屿中最优的一个。
+    用法:
+        islands = ea.IslandModel(ea.moea_NSGA2_templet, problem, population, 8)
+        islands.settings = {'MAXGEN' : 500} # 设置每个岛屿的算法模板的参数
+        islands.migrationGap = 20
+        NDSet = islands.run()
+    子进程由multiprocessing.Process创建，它们不是守护进程，因此各岛屿的算法模板也可以设置poolSize用进程池并行评价；
+    run()在返回或抛出异常之前总会等待所有岛屿退出，主进程出错（如KeyboardInterrupt）时先终止仍在运行的岛屿。
+    在采用'fork'方式创建进程的平台（如Linux）上，
+    算法模板类、问题对象和setup函数都直接由子进程继承；在其他平台上它们必须可以被pickle序列化，
+    且调用run()的代码须位于if __name__ == '__main__':之下。
+
+属性:
+    templet      : class  - 算法模板类，如ea.moea_NSGA2_templet。
+
+    problem      : class <Problem> - 问题类的对象，每个岛屿使用它的一个副本。
+
+    population   : class <Population> - 种群对象，每个岛屿使用它的一个副本作为初始种群。
+
+    NUM          : int    - 岛屿的数目（即进程数），默认为4。
+
+    settings     : dict   - 每个岛屿的算法模板的参数，键为属性名，如{'MAXGEN' : 500, 'F' : 0.7}。各岛屿的drawing默认为0。
+
+    setup        : function - 为None时不起作用，否则在设置settings之后调用setup(algorithm, index)对第index个岛屿的算法模板作进一步设置，
+                            例如让各岛屿采用不同的参数。
+
+    migrationGap : int    - 迁移间隔，即每隔多少代迁移一次，默认为10，为0时不迁移。
+
+    migrants     : int    - 每次迁移时每个岛屿发送给每个相邻岛屿的个体数，默认为2。
+
+    topology     : str/list - 迁移的拓扑结构，'ring'表示环形，即第i个岛屿发送给第i+1个岛屿（最后一个发送给第一个）；
+                            'full'表示全连接，即每个岛屿发送给其他所有岛屿；
+                            也可以是一个列表，其第i个元素为第i个岛屿要发送给的岛屿的下标列表。默认为'ring'。
+
+    emigrate     : str    - 迁移个体的选择策略，'best'表示选择最优的个体（默认），'random'表示随机选择。
+
+    replace      : str    - 被替换个体的选择策略，'worst'表示替换最差的个体（默认），'random'表示随机选择。
+                            个体的优劣与非支配排序算子一致：可行个体优于不可行个体，不可行个体之间违反约束程度之和越小越优；
+                            单目标时再按目标函数值比较，多目标时再按非支配层级及拥挤距离比较。
+
+    sync         : bool   - 是否同步迁移，默认为True。为True时每个岛屿在迁移时都等待所有相邻岛屿本次发送的个体，
+                            设置了随机数种子且终止条件不含MAXTIME时结果可以复现；
+                            为False时只接收已经到达的个体而不等待，岛屿之间速度差异较大时可以避免快的岛屿等待慢的岛屿。
+                            已经结束进化的岛屿不会被等待。
+
+    seed         : int    - 随机数种子，为None时各岛屿各自从操作系统获取随机的种子，
+                            否则用np.random.SeedSequence(seed).spawn(NUM)为各岛屿派生相互独立的随机数流，
+                            作为各岛屿算法模板的rng（详见Algorithm类的rng属性）。
+
+    drawing      : int    - 是否绘制合并后的结果，0表示不绘图，否则与算法模板的drawing为1时相同，默认为1。
+
+    results      : list   - 各岛屿算法模板的返回值。
+
+    islandGens   : list   - 各岛屿最终的代数。
+
+    evalsNum     : int    - 所有岛屿的总评价次数。
+
+    passTime     : float  - 运行岛屿模型的总用时（单位：秒）。
+
+函数:
+    neighbors()  : 返回各岛屿要发送给的岛屿的下标列表。
+
+    run()        : 运行岛屿模型，返回合并后的结果。
+
+    merge()      : 把各岛屿的返回值合并为与算法模板的返回值格式相同的结果，由run()调用。
+
+"""
+
+    def __init__(self, templet, problem, population, NUM = 4):
+        self.templet = templet
+        self.problem = problem
+        self.population = population
+        self.NUM = NUM
+        self.settings = {}
+        self.setup = None
+        self.migrationGap = 10
+        self.migrants = 2
+        self.topology = 'ring'
+        self.emigrate = 'best'
+        self.replace = 'worst'
+        self.sync = True
+        self.seed = None
+        self.drawing = 1
+        self.results = None
+        self.islandGens = None
+        self.evalsNum = None
+        self.passTime = None
+
+    def neighbors(self):
+        """
+        描述: 根据topology返回一个列表，其第i个元素为第i个岛屿要发送给的岛屿的下标列表。
+        """
+
+        if self.topology == 'ring':
+            return [[(i + 1) % self.NUM] if self.NUM > 1 else [] for i in range(self.NUM)]
+        elif self.topology == 'full':
+            return [[j for j in range(self.NUM) if j != i] for i in range(self.NUM)]
+        elif isinstance(self.topology, (list, tuple)) and len(self.topology) == self.NUM:
+            targets = [list(t) for t in self.topology]
+            for i, t in enumerate(targets):
+                if any(j == i or j < 0 or j >= self.NUM for j in t):
+                    raise RuntimeError('error in IslandModel: topology is invalid. (拓扑结构中的岛屿下标必须在0到NUM-1之间且不能指向自身。)')
+            return targets
+        else:
+            raise RuntimeError('error in IslandModel: topology must be ''ring'', ''full'' or a list of length NUM. (topology必须为''ring''、''full''或长度为NUM的列表。)')
+
+    def run(self):
+        if self.emigrate != 'best' and self.emigrate != 'random':
+            raise RuntimeError('error in IslandModel: emigrate must be ''best'' or ''random''. (emigrate必须为''best''或''random''。)')
+        if self.replace != 'worst' and self.replace != 'random':
+            raise RuntimeError('error in IslandModel: replace must be ''worst'' or ''random''. (replace必须为''worst''或''random''。)')
+        targets = self.neighbors()
+        sources = [[i for i in range(self.NUM) if j in targets[i]] for j in range(self.NUM)] # 各岛屿的来源岛屿
+        startTime = time.time()
+        inboxes = [multiprocessing.Queue() for i in range(self.NUM)] # 各岛屿的接收队列
+        resultQueue = multiprocessing.Queue()
+        workers = []
+        self.results = [None] * self.NUM
+        self.islandGens = [0] * self.NUM
+        self.evalsNum = 0
+        errors = []
+        try:
+            # 岛屿不是守护进程，因此可以用进程池并行评价（poolSize）
+            for i in range(self.NUM):
+                worker = multiprocessing.Process(target = _island, args = (self, i, targets[i], sources[i], inboxes, resultQueue))
+                worker.start()
+                workers.append(worker)
+            # 先取出所有结果再等待子进程退出，否则子进程可能因结果未被取走而无法退出
+            for k in range(self.NUM):
+                index, result, info = resultQueue.get()
+                if result is None:
+                    errors.append('island ' + str(index) + ':\n' + info)
+                else:
+                    self.results[index] = result
+                    self.islandGens[index], evalsNum = info
+                    self.evalsNum += evalsNum
+        except BaseException:
+            for worker in workers:
+                worker.terminate() # 主进程出错（如KeyboardInterrupt）时终止仍在运行的岛屿
+            raise
+        finally:
+            for worker in workers:
+                worker.join()
+        self.passTime = time.time() - startTime
+        if len(errors) > 0:
+            raise RuntimeError('error in IslandModel: some islands failed. (部分岛屿运行出错。)\n' + '\n'.join(errors))
+        return self.merge()
+
+    def merge(self):
+        """
+        描述: 把各岛屿的返回值合并为与算法模板的返回值格式相同的结果。
+        """
+
+        maxormins = np.array(self.problem.maxormins)
+        if issubclass(self.templet, ea.MoeaAlgorithm):
+            NDSet = self.results[0]
+            for result in self.results[1:]:
+                NDSet = NDSet + result
+            if NDSet.sizes > 0:
+                [levels, criLevel] = ea.ndsortSweep(maxormins * NDSet.ObjV, None, 1, NDSet.CV) # 各岛屿的非支配个体之间还可能相互支配
+                NDSet = NDSet[np.where(levels == 1)[0]]
+            if self.drawing != 0:
+                ea.moeaplot(NDSet.ObjV, 'Pareto Front', True)
+            return NDSet
+        population = self.results[0][0]
+        for result in self.results[1:]:
+            population = population + result[0]
+        # 逐代合并进化记录器，各岛屿的进化代数可能不同，每一代只合并记录到了该代的岛屿
+        maxLen = max(len(result[1]) for result in self.results)
+        obj_trace = np.zeros((maxLen, 2))
+        var_trace = np.zeros((maxLen, self.results[0][2].shape[1]))
+        for gen in range(maxLen):
+            islands = [result for result in self.results if len(result[1]) > gen]
+            objs = np.array([result[1][gen] for result in islands])
+            best = np.argmin(maxormins[0] * objs[:, 1])
+            obj_trace[gen] = [np.mean(objs[:, 0]), objs[best, 1]]
+            var_trace[gen] = islands[best][2][gen]
+        if self.drawing != 0:
+            ea.trcplot(obj_trace, [['种群个体平均目标函数值', '种群最优个体目标函数值']])
+        return [population, obj_trace, var_trace]
+
+def _rank(pop, maxormins):
+    # 返回种群个体从优到劣的下标
+    violation = np.sum(np.maximum(pop.CV, 0), 1)
+    if pop.ObjV.shape[1] == 1:
+        return np.lexsort([maxormins[0] * pop.ObjV[:, 0], violation])
+    [levels, criLevel] = ea.ndsortSweep(maxormins * pop.ObjV, None, None, pop.CV)
+    dis = ea.crowdis(pop.ObjV, levels)
+    return np.lexsort([-dis, levels])
+
+def _island(model, index, targets, sources, inboxes, resultQueue):
+    # 岛屿子进程：运行算法模板，并在'generationEnd'事件中迁移个体
+    try:
+        algorithm = model.templet(model.problem, model.population.copy())
+        algorithm.drawing = 0
+        for name, value in model.settings.items():
+            setattr(algorithm, name, value)
+        if model.setup is not None:
+            model.setup(algorithm, index)
+        if model.seed is not None:
+            # 从同一个种子派生出各岛屿相互独立的随机数流，结果只取决于seed和岛屿的序号
+            algorithm.seed = None
+            algorithm.rng = np.random.default_rng(np.random.SeedSequence(model.seed).spawn(model.NUM)[index])
+        else:
+            np.random.seed() # fork得到的子进程的随机数状态相同，必须重新设置种子
+        maxormins = np.array(model.problem.maxormins)
+        active = set(sources) # 尚未结束进化的来源岛屿
+        early = {source : [] for source in sources} # 各来源岛屿提前到达的、属于之后的迁移的个体
+        def migrate(algorithm, pop):
+            if model.migrationGap <= 0 or algorithm.currentGen == 0 or algorithm.currentGen % model.migrationGap != 0:
+                return
+            # 发送迁移个体
+            num = min(model.migrants, pop.sizes)
+            if num > 0:
+                for j in targets:
+                    if model.emigrate == 'best':
+                        chosen = _rank(pop, maxormins)[:num]
+                    else:
+                        chosen = ea.rng.choice(pop.sizes, num, replace = False)
+                    inboxes[j].put((index, pop[chosen].copy()))
+            # 接收迁移个体
+            arrived = []
+            waiting = set(active)
+            while len(waiting) > 0:
+                ready = [source for source in sources if source in waiting and len(early[source]) > 0]
+                if len(ready) > 0: # 先处理之前提前到达的个体
+                    source = ready[0]
+                    migrants = early[source].pop(0)
+                else:
+                    try:
+                        source, migrants = inboxes[index].get(model.sync)
+                    except queue.Empty:
+                        break
+                    if source not in waiting: # 来源岛屿进化得更快，这是它下一次发送的个体
+                        early[source].append(migrants)
+                        continue
+                if migrants is None: # 来源岛屿已结束进化
+                    active.discard(source)
+                else:
+                    arrived.append((source, migrants))
+                waiting.discard(source)
+            if len(arrived) == 0:
+                return
+            arrived.sort(key = lambda item : item[0]) # 按来源岛屿排序，使同步迁移的结果可以复现
+            arrived = [migrants for source, migrants in arrived]
+            immigrants = arrived[0]
+            for migrants in arrived[1:]:
+                immigrants = immigrants + migrants
+            num = min(immigrants.sizes, pop.sizes)
+            if model.replace == 'worst':
+                replaced = _rank(pop, maxormins)[::-1][:num]
+            else:
+                replaced = ea.rng.choice(pop.sizes, num, replace = False)
+            # 原地替换，使算法模板中引用该种群的变量都能看到新个体
+            pop.Chrom[replaced] = immigrants.Chrom[:num]
+            pop.Phen[replaced] = immigrants.Phen[:num]
+            pop.ObjV[replaced] = immigrants.ObjV[:num]
+            pop.CV[replaced] = immigrants.CV[:num]
+        def finish(algorithm, pop):
+            for j in targets:
+                inboxes[j].put((index, None)) # 通知相邻岛屿不再等待本岛屿
+        algorithm.addHook('generationEnd', migrate)
+        algorithm.addHook('finish', finish)
+        result = algorithm.run()
+        resultQueue.put((index, result, (algorithm.currentGen, algorithm.evalsNum)))
+    except BaseException:
+        model.problem.closePool() # 释放本岛屿并行评价所用的进程池
+        for j in targets:
+            inboxes[j].put((index, None))
+        resultQueue.put((index, None, traceback.format_exc()))
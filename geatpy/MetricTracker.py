@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from multiprocessing import Pool as ProcessPool
+import geatpy as ea
+
+class MetricTracker:
+
+    """
+MetricTracker : class - 多目标优化指标追踪器类
+
+描述:
+    指标追踪器对一代代的种群先找出满足约束条件的非支配个体，再计算metricName中的各个指标。
+    它有两种用法：
+    1. 在线追踪：把它赋给多目标算法模板的tracker属性，MoeaAlgorithm.stat()每记录一代就会调用update()，
+       指标随着进化过程逐代算出，进化结束时即可通过getMetrics()得到指标矩阵，
+       此时无需事后对整个种群记录器进行处理，也可以把traceMode设为'off'而不在内存中记录种群。
+    2. 事后追踪：调用track(pop_trace, poolSize)对种群记录器中的各代种群计算指标，
+       poolSize大于1时把各代种群分成若干块交给进程池并行计算。
+       ea.indicator.moea_tracking()（两种内核）即基于此实现。
+    PF的最近邻索引（详见PFIndex类）只在构造时建立一次，之后各代计算GD、IGD时都复用它。
+    用法:
+        tracker = ea.MetricTracker(PF, [['IGD'], ['HV']], problem.maxormins)
+        myAlgorithm.tracker = tracker # 在线追踪
+        NDSet = myAlgorithm.run()
+        Metrics = tracker.getMetrics()
+        或:
+        [NDSet_trace, Metrics] = tracker.track(myAlgorithm.pop_trace, 4) # 用4个进程事后追踪
+
+属性:
+    PF         : array   - 真实全局帕累托最优解的目标函数值矩阵（也可以是经验所得的非支配解的目标函数值矩阵）。
+
+    metricName : list    - 评价指标名称列表，形如[['GD'], ['IGD']]，可选的指标有'GD'、'IGD'、'HV'和'Spacing'。
+
+    maxormins  : array   - 优化目标的最大最小化标记，1表示最小化，-1表示最大化，缺省或为None时全为最小化。
+
+    gap        : int     - 在线追踪时每隔gap代计算一次指标，默认为1。
+
+    index      : PFIndex - PF的最近邻索引，不需要计算GD和IGD时为None。
+
+    gens       : list    - 在线追踪时已计算指标的各代的代数。
+
+    trace      : list    - 在线追踪时各代的指标值，每个元素是一行指标值。
+
+    NDSet      : Population - 在线追踪时最近一代的满足约束条件的非支配个体组成的种群。
+
+函数:
+    update(pop, gen)         : 在线追踪，计算第gen代的种群pop的指标。
+
+    getMetrics()             : 返回在线追踪得到的指标矩阵，每一行对应一代，每一列对应一个指标。
+
+    evaluate(pop)            : 计算一个种群的非支配个体及指标值。
+
+    track(pop_trace, poolSize) : 事后追踪，返回历代非支配个体集合组成的列表以及指标矩阵。
+
+    clear()                  : 清空在线追踪的记录。
+
+"""
+
+    def __init__(self, PF, metricName, maxormins = None, gap = 1):
+        self.names = [name for group in metricName for name in (group if isinstance(group, (list, tuple)) else [group])]
+        for name in self.names:
+            if name not in ['GD', 'IGD', 'HV', 'Spacing']:
+                raise RuntimeError('error in MetricTracker: No such metric: ' + str(name) + '. (没有名为' + str(name) + '的指标。)')
+        self.PF = PF.PF if isinstance(PF, ea.PFIndex) else np.asarray(PF, dtype = float)
+        self.metricName = metricName
+        self.maxormins = 1 if maxormins is None else np.asarray(maxormins)
+        self.gap = gap
+        self.index = None
+        if 'GD' in self.names or 'IGD' in self.names:
+            self.index = PF if isinstance(PF, ea.PFIndex) else ea.PFIndex(self.PF) # 建立PF的最近邻索引
+        self.clear()
+
+    def clear(self):
+        self.gens = []
+        self.trace = []
+        self.NDSet = None
+
+    def evaluate(self, pop):
+        """
+        描述: 找出种群pop中满足约束条件的非支配个体，并计算其各项指标值。
+        返回[NDSet, metrics]，没有可行个体时metrics的各元素都为nan。
+        """
+
+        pop = pop[np.where(np.all(pop.CV <= 0, 1))[0]] # 只保留可行个体
+        metrics = np.full(len(self.names), np.nan)
+        if pop.sizes > 0:
+            [levels, criLevel] = ea.ndsortSweep(self.maxormins * pop.ObjV, None, 1)
+            pop = pop[np.where(levels == 1)[0]]
+            for i, name in enumerate(self.names):
+                if name == 'GD':
+                    metrics[i] = self.index.GD(pop.ObjV)
+                elif name == 'IGD':
+                    metrics[i] = self.index.IGD(pop.ObjV)
+                elif name == 'HV':
+                    metrics[i] = ea.indicator.HV(pop.ObjV, self.PF)
+                else:
+                    metrics[i] = ea.indicator.Spacing(pop.ObjV)
+        return [pop, metrics]
+
+    def update(self, pop, gen):
+        """
+        描述: 在线追踪，计算第gen代的种群pop的指标值并记录下来，gen不是gap的整数倍时忽略该代。
+        """
+
+        if gen % self.gap != 0:
+            return
+        self.NDSet, metrics = self.evaluate(pop)
+        self.gens.append(gen)
+        self.trace.append(metrics)
+
+    def getMetrics(self):
+        """
+        描述: 返回在线追踪得到的指标矩阵，每一行对应一代，每一列对应一个指标。
+        """
+
+        return np.array(self.trace).reshape(-1, len(self.names))
+
+    def track(self, pop_trace, poolSize = None):
+        """
+        描述: 事后追踪，对种群记录器pop_trace中的每一代种群计算指标，
+        返回[NDSet_trace, Metrics]，即历代非支配个体集合组成的列表以及每一列对应一个指标的指标值矩阵。
+        poolSize为并行计算所用的进程数，为None或不大于1时在主进程中逐代计算；
+        否则把各代种群按顺序分成若干块，交给进程池并行计算，每个子进程只建立一次PF的最近邻索引。
+        """
+
+        pops = list(pop_trace)
+        if poolSize is None or poolSize <= 1 or len(pops) < 2:
+            results = [self.evaluate(pop) for pop in pops]
+        else:
+            chunks = [pops[start : end] for start, end in _bounds(len(pops), 4 * poolSize)] # 多分几块以平衡各进程的负载
+            with ProcessPool(poolSize, _initWorker, (self.PF, self.metricName, self.maxormins)) as pool:
+                results = [result for chunk in pool.map(_trackChunk, chunks) for result in chunk]
+        NDSet_trace = [result[0] for result in results]
+        Metrics = np.array([result[1] for result in results]).reshape(-1, len(self.names))
+        return [NDSet_trace, Metrics]
+
+_tracker = None # 子进程中的指标追踪器
+
+def _initWorker(PF, metricName, maxormins):
+    global _tracker
+    _tracker = MetricTracker(PF, metricName, maxormins)
+
+def _trackChunk(pops):
+    return [_tracker.evaluate(pop) for pop in pops]
+
+def _bounds(sizes, num):
+    bounds = np.linspace(0, sizes, min(num, sizes) + 1).astype(int)
+    return zip(bounds[:-1], bounds[1:])
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from scipy.spatial import cKDTree
+
+class PFIndex:
+
+    """
+PFIndex : class - 帕累托前沿最近邻索引类
+
+描述:
+    GD和IGD都需要求点到另一个点集的最小欧氏距离，直接计算距离矩阵的时间和内存开销都是O(n * |PF|)，
+    而Problem.getBest()得到的PF通常有10000个点。
+    PFIndex在构造时为PF建立一棵KD树，之后计算GD时每个点只需O(log |PF|)的时间即可找到PF中离它最近的点；
+    计算IGD时则为ObjV建立KD树，再让PF中的每个点在其中查找最近的点，
+    因此两者都不再需要生成距离矩阵，内存开销只与点数成正比。
+    对同一个PF反复计算指标（如moea_tracking对每一代种群计算指标）时，只需构造一次PFIndex。
+    indicator.GD和indicator.IGD（两种内核）的PF参数也可以直接传入PFIndex对象。
+    用法:
+        index = ea.PFIndex(PF)
+        gd = index.GD(ObjV)
+        igd = index.IGD(ObjV)
+
+属性:
+    PF   : array   - 帕累托前沿的目标函数值矩阵。
+
+    tree : cKDTree - 以PF建立的KD树。
+
+函数:
+    distances(ObjV) : 计算ObjV中每个点到PF的最小欧氏距离。
+
+    GD(ObjV)        : 计算世代距离(GD)。
+
+    IGD(ObjV)       : 计算反转世代距离(IGD)。
+
+"""
+
+    def __init__(self, PF):
+        self.PF = np.atleast_2d(np.asarray(PF, dtype = float))
+        self.tree = cKDTree(self.PF)
+
+    def distances(self, ObjV):
+        """
+        描述: 计算ObjV中每个点到PF的最小欧氏距离，返回一个Numpy array类型的行向量。
+        """
+
+        ObjV = np.atleast_2d(np.asarray(ObjV, dtype = float))
+        if ObjV.shape[1] != self.PF.shape[1]:
+            raise RuntimeError('error in PFIndex: The dimension of ObjV disagrees with PF. (ObjV的目标维数与PF不一致。)')
+        return self.tree.query(ObjV)[0]
+
+    def GD(self, ObjV):
+        """
+        描述: 计算ObjV相对于PF的世代距离，即ObjV中每个点到PF的最小欧氏距离的平均值。
+        """
+
+        return np.mean(self.distances(ObjV))
+
+    def IGD(self, ObjV):
+        """
+        描述: 计算ObjV相对于PF的反转世代距离，即PF中每个点到ObjV的最小欧氏距离的平均值。
+        """
+
+        ObjV = np.atleast_2d(np.asarray(ObjV, dtype = float))
+        if ObjV.shape[1] != self.PF.shape[1]:
+            raise RuntimeError('error in PFIndex: The dimension of ObjV disagrees with PF. (ObjV的目标维数与PF不一致。)')
+        return np.mean(cKDTree(ObjV).query(self.PF)[0])
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import geatpy as ea
+
+class ParetoArchive:
+
+    """
+ParetoArchive : class - 帕累托存档类
+
+描述:
+    帕累托存档用于在进化过程中增量地维护一个全局非支配个体集合，避免每一代都把种群与存档合并后重新进行非支配排序。
+    insert()先用ndsortSweep找出插入的种群自身的非支配个体，再只把它们与存档中的个体比较：
+    被存档支配的候选个体被丢弃，被候选个体支配的存档个体被删除。
+    双目标时该比较通过在“阶梯”上二分查找完成，时间复杂度为O((n + A) log A)；
+    其他目标数时分块进行n×A次两两比较（n、A分别为候选个体数与存档规模），
+    而原先合并后重新排序的做法需要O((n + A)^2)次比较。
+    约束的处理与非支配排序算子一致：可行个体支配所有不可行个体，不可行个体之间违反约束程度之和越小越优。
+    因此存档中的个体要么全是可行个体，要么全是违反约束程度之和最小且相等的不可行个体。
+    用法:
+        archive = ea.ParetoArchive(problem.maxormins, MAXSIZE)
+        archive.insert(population) # 每一代插入种群
+        NDSet = archive.NDSet # 得到全局非支配个体组成的种群
+
+属性:
+    maxormins : array - 优化目标的最大最小化标记，1表示最小化，-1表示最大化。
+
+    MAXSIZE   : int   - 存档的最大规模，为None时不限制。存档规模超出MAXSIZE时按拥挤距离进行筛选。
+
+    unique    : bool  - 是否拒绝与存档中的个体目标函数值完全相同的个体，默认为True。
+                        为False时与“合并后取第一层非支配个体”的做法完全一致，即目标函数值相同的个体都会被保留。
+
+    NDSet     : Population - 存档中的全局非支配个体组成的种群，存档为空时为None。
+
+函数:
+    insert(population) : 把种群插入存档，返回被存档接纳的个体的逻辑行向量。
+
+    truncate(MAXSIZE)  : 根据拥挤距离把存档截断为MAXSIZE个个体。
+
+    clear()            : 清空存档。
+
+"""
+
+    def __init__(self, maxormins = None, MAXSIZE = None, unique = True):
+        self.maxormins = np.array([1]) if maxormins is None else np.array(maxormins)
+        self.MAXSIZE = MAXSIZE
+        self.unique = unique
+        self.NDSet = None
+
+    def clear(self):
+        self.NDSet = None
+
+    def insert(self, population):
+        """
+        描述: 把种群插入存档，返回一个长度为population.sizes的逻辑行向量，
+        标记种群中的哪些个体进入了存档（在按MAXSIZE截断之前）。
+        """
+
+        accepted = np.zeros(population.sizes, dtype = bool)
+        if population.sizes == 0:
+            return accepted
+        if population.ObjV is None:
+            raise RuntimeError('error in ParetoArchive: ObjV is None. (种群的目标函数值矩阵未计算。)')
+        ObjV = self.maxormins * population.ObjV # 统一为最小化
+        # 候选个体为种群自身的非支配个体
+        [levels, criLevel] = ea.ndsortSweep(ObjV, None, 1, population.CV)
+        candIdx = np.where(levels == 1)[0]
+        if self.unique: # 相同的目标函数值只保留第一个
+            candIdx = candIdx[np.sort(np.unique(ObjV[candIdx], axis = 0, return_index = True)[1])]
+        candVio = _violation(population.CV[candIdx])
+        if self.NDSet is None or self.NDSet.sizes == 0:
+            accepted[candIdx] = True
+            self.NDSet = population[candIdx]
+        else:
+            archObjV = self.maxormins * self.NDSet.ObjV
+            archVio = _violation(self.NDSet.CV)
+            if candVio < archVio: # 候选个体的违反约束程度更小（包括候选个体可行而存档不可行），它们直接取代整个存档
+                accepted[candIdx] = True
+                self.NDSet = population[candIdx]
+            elif candVio == archVio:
+                if candVio == 0: # 都是可行个体，按帕累托支配关系比较
+                    survive = ~_dominated(ObjV[candIdx], archObjV, self.unique)
+                    candIdx = candIdx[survive]
+                    keep = ~_dominated(archObjV, ObjV[candIdx], False) if len(candIdx) > 0 else np.ones(self.NDSet.sizes, dtype = bool)
+                elif self.unique: # 违反约束程度相同的不可行个体互不支配
+                    candIdx = candIdx[~_dominated(ObjV[candIdx], archObjV, True, True)]
+                    keep = np.ones(self.NDSet.sizes, dtype = bool)
+                else:
+                    keep = np.ones(self.NDSet.sizes, dtype = bool)
+                if len(candIdx) > 0:
+                    accepted[candIdx] = True
+                    self.NDSet = population[candIdx] + (self.NDSet if np.all(keep) else self.NDSet[np.where(keep)[0]])
+        if self.MAXSIZE is not None and self.NDSet.sizes > self.MAXSIZE:
+            self.truncate(self.MAXSIZE)
+        return accepted
+
+    def truncate(self, MAXSIZE):
+        """
+        描述: 根据拥挤距离把存档截断为MAXSIZE个个体，拥挤距离越大的个体越优先被保留。
+        """
+
+        if self.NDSet is None or self.NDSet.sizes <= MAXSIZE:
+            return
+        dis = ea.crowdis(self.NDSet.ObjV, np.ones(self.NDSet.sizes)) # 计算拥挤距离
+        self.NDSet = self.NDSet[ea.selecting('dup', dis.reshape(-1, 1), MAXSIZE)] # 进行筛选
+
+def _violation(CV):
+    # 违反约束程度之和，对于存档中的个体或同一层的候选个体，它们的违反约束程度之和都相等，因此只取第一个
+    return np.sum(np.maximum(CV[0], 0)) if CV.shape[0] > 0 else 0
+
+def _dominated(X, Y, weak, equalOnly = False):
+    """
+    描述: 返回X中的哪些点被Y中的某个点支配（最小化）。
+    weak为True时把与Y中某个点完全相同的点也视为被支配；equalOnly为True时只判断是否与Y中某个点完全相同。
+    Y中的点应互不支配。
+    """
+
+    if equalOnly or X.shape[1] != 2:
+        return _dominatedBlock(X, Y, weak, equalOnly)
+    # 双目标时把Y按第一个目标排序，则第一个目标值不超过x的点中第二个目标值的最小值即为前缀最小值
+    order = np.lexsort((Y[:, 1], Y[:, 0]))
+    Y1 = Y[order, 0]
+    prefixMin = np.minimum.accumulate(Y[order, 1])
+    strict = np.searchsorted(Y1, X[:, 0], 'left') - 1 # 第一个目标值严格小于x的点
+    loose = np.searchsorted(Y1, X[:, 0], 'right') - 1 # 第一个目标值不大于x的点
+    strictMin = np.where(strict >= 0, prefixMin[np.maximum(strict, 0)], np.inf)
+    looseMin = np.where(loose >= 0, prefixMin[np.maximum(loose, 0)], np.inf)
+    if weak:
+        return looseMin <= X[:, 1]
+    return (strictMin <= X[:, 1]) | (looseMin < X[:, 1])
+
+def _dominatedBlock(X, Y, weak, equalOnly, blockSize = 4000000):
+    # 分块进行两两比较，每块比较的元素个数不超过blockSize
+    result = np.zeros(X.shape[0], dtype = bool)
+    step = max(1, blockSize // max(1, Y.shape[0] * Y.shape[1]))
+    for start in range(0, X.shape[0], step):
+        x = X[start : start + step, None, :]
+        if equalOnly:
+            result[start : start + step] = np.any(np.all(Y == x, 2), 1)
+            continue
+        noWorse = np.all(Y <= x, 2)
+        if weak:
+            result[start : start + step] = np.any(noWorse, 1)
+        else:
+            result[start : start + step] = np.any(noWorse & np.any(Y < x, 2), 1)
+    return result
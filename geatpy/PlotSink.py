@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import os
+import queue
+import threading
+import warnings
+import multiprocessing
+import numpy as np
+
+class PlotSink:
+
+    """
+PlotSink : class - 动态图绘图接收器类
+
+描述:
+    drawing为2时，算法模板每一代都要绘制动态图，而在进化的主循环中直接调用moeaplot等绘图函数时，
+    matplotlib的重绘（以及每帧plt.pause()的停顿）会拖慢进化。
+    绘图接收器在单独的进程（或线程）中绘图，进化过程只需把绘制一帧所需的矩阵的副本放入一个容量为1的队列：
+    若绘图进程还没取走上一帧，则直接丢弃这一帧而不等待，因此实时监控不会拖慢优化，绘图进程总是绘制它来得及绘制的最新一帧。
+    调用close()时会补发最后被丢弃的一帧（即进化结束时的状态），并等待它绘制完毕。主进程无需导入matplotlib。
+    saveDir非None时绘图进程采用不需要显示器的Agg后端，并把每一帧保存为saveDir中的png图片，适用于没有图形界面的服务器。
+    用法:
+        sink = ea.PlotSink()
+        sink.send(gen, [['moeaplot', ObjV, 'objective values'], ['varplot', Phen, 'decision variables']])
+        ...
+        sink.close()
+    算法模板在drawing为2时会自动创建并关闭绘图接收器（详见Algorithm类的plotSink属性）。
+
+属性:
+    mode     : str   - 绘图所用的并发方式，'Process'表示进程（默认），'Thread'表示线程。
+                       matplotlib的图形界面通常只能在主线程中使用，因此'Thread'一般只与saveDir配合使用。
+
+    saveDir  : str   - 保存每一帧图片的文件夹，为None时不保存而是直接显示。
+
+    interval : float - 每帧之间的停顿时间（单位：秒），缺省或为None时为0.1，与绘图函数的默认值相同，保存图片时不停顿。
+
+    sent     : int   - 已放入队列的帧数。
+
+    dropped  : int   - 因绘图来不及而被丢弃的帧数。
+
+函数:
+    send(gen, frames) : 把第gen代的一帧放入队列，返回是否被接受；队列已满时丢弃该帧。
+
+    close()           : 等待最后一帧绘制完毕并关闭绘图进程（线程）。
+
+"""
+
+    def __init__(self, mode = 'Process', saveDir = None, interval = None):
+        if mode != 'Process' and mode != 'Thread':
+            raise RuntimeError('error in PlotSink: mode must be ''Process'' or ''Thread''. (mode必须为''Process''或''Thread''。)')
+        self.mode = mode
+        self.saveDir = saveDir
+        self.interval = interval
+        self.sent = 0
+        self.dropped = 0
+        self.pending = None # 最近被丢弃的一帧（不复制），若它是最后一帧则在close()时补发
+        if saveDir is not None and os.path.exists(saveDir) == False:
+            os.makedirs(saveDir)
+        if mode == 'Process':
+            self.queue = multiprocessing.Queue(1)
+            self.worker = multiprocessing.Process(target = _plotLoop, args = (self.queue, saveDir, interval), daemon = True)
+        else:
+            self.queue = queue.Queue(1)
+            self.worker = threading.Thread(target = _plotLoop, args = (self.queue, saveDir, interval), daemon = True)
+        self.worker.start()
+
+    def send(self, gen, frames):
+        """
+        描述: 把第gen代的一帧放入队列。frames是一个列表，其每个元素形如[绘图函数名, 数据矩阵, 标签]，
+        绘图函数名可以是'moeaplot'、'varplot'或'soeaplot'，同一帧中的各张图要么全部绘制，要么全部丢弃。
+        若绘图进程还没取走上一帧或已经退出，则丢弃这一帧并返回False，否则返回True。
+        数据矩阵只在这一帧被接受时才复制，因此被丢弃的帧几乎没有开销。
+        """
+
+        if self.queue.full() or not self.worker.is_alive():
+            self.dropped += 1
+            self.pending = (gen, frames)
+            return False
+        try:
+            self.queue.put_nowait(_snapshot(gen, frames))
+        except queue.Full:
+            self.dropped += 1
+            self.pending = (gen, frames)
+            return False
+        self.sent += 1
+        self.pending = None
+        return True
+
+    def close(self):
+        """
+        描述: 补发最后被丢弃的一帧，等待它绘制完毕，然后关闭绘图进程（线程）。
+        """
+
+        if self.worker.is_alive():
+            try:
+                if self.pending is not None:
+                    self.queue.put(_snapshot(*self.pending), timeout = 10)
+                    self.sent += 1
+                    self.dropped -= 1
+                self.queue.put(None, timeout = 10) # 结束标记
+            except queue.Full:
+                pass
+            self.worker.join()
+        self.pending = None
+        if self.mode == 'Process':
+            self.queue.cancel_join_thread() # 绘图进程异常退出时队列中可能还有数据，不等待它们被取走
+            self.queue.close()
+
+def _snapshot(gen, frames):
+    # 种群的矩阵可能在之后被原地修改（如PopArena复用缓冲区），因此必须放入副本
+    return (gen, [[name, np.array(data), label] for name, data, label in frames])
+
+def _plotLoop(frameQueue, saveDir, interval):
+    # 绘图进程（线程）的主循环：逐帧取出数据并绘图，直到取到结束标记None
+    import geatpy as ea
+    if saveDir is not None:
+        import matplotlib
+        matplotlib.use('Agg')
+        warnings.simplefilter('ignore', UserWarning) # Agg后端下plt.pause()会给出警告
+    axes = {} # 每种图各自的坐标轴，用于在其上绘制下一帧
+    while True:
+        item = frameQueue.get()
+        if item is None:
+            break
+        gen, frames = item
+        for name, data, label in frames:
+            key = (name, label)
+            # 保存图片时不需要停顿，但plt.pause()的停顿时间不能为0（为0时会一直等待）
+            axes[key] = getattr(ea, name)(data, label, False, axes.get(key), gen, 0.001 if saveDir is not None else interval)
+            if saveDir is not None:
+                axes[key].figure.savefig(os.path.join(saveDir, name + '_' + str(gen) + '.png'))
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import geatpy as ea
+
+class PopArena:
+
+    """
+PopArena : class - 种群缓冲区类
+
+描述:
+    种群缓冲区用于在采用父子合并选择((mu+lambda)选择)的算法模板中避免每一代都重新分配内存。
+    它预先为Chrom、Phen、ObjV、CV和FitnV各分配两块能容纳capacity个个体的缓冲区（双缓冲）：
+    merge()把父代种群和子代种群依次写入当前缓冲区的前半部分和后半部分，直接得到合并的种群；
+    select()把被选中的个体从当前缓冲区紧凑地收集到另一块缓冲区的开头，然后交换两块缓冲区。
+    若父代种群本身就是上一次select()的结果，则merge()时无需再写入父代，只需写入子代。
+    这样在进化过程中除了进化算子本身产生的矩阵外，合并与选择都不再分配新的内存。
+    用法:
+        arena = ea.PopArena(2 * NIND)
+        population = arena.merge(population, offspring) # 相当于 population = population + offspring
+        population = arena.select(population, chooseFlag) # 相当于 population = population[chooseFlag]
+    注意: merge()和select()返回的种群的各矩阵都是缓冲区的视图，
+         它们会在之后的第二次select()时被覆盖，因此若需要长期保存某一代的种群，应先调用其copy()方法。
+         当种群超出容量或各矩阵的形状、类型与缓冲区不符时，会重新分配缓冲区。
+
+属性:
+    capacity : int   - 缓冲区能容纳的个体数，为None时在第一次合并时取父子两代个体数之和。
+
+    buffers  : list  - 两块缓冲区，每块都是矩阵名到矩阵的字典，buffers[0]为当前缓冲区。
+
+    current  : dict  - 上一次select()得到的种群的各个矩阵（即当前缓冲区开头的视图）。
+
+函数:
+    merge(population, offspring) : 合并父子两代种群。
+
+    select(population, index)    : 从种群中选出index对应的个体组成新的种群。
+
+"""
+
+    def __init__(self, capacity = None):
+        self.capacity = capacity
+        self.buffers = None
+        self.current = None
+
+    def _names(self):
+        return ['Chrom', 'Phen', 'ObjV', 'FitnV', 'CV']
+
+    def _fits(self, pops):
+        # 判断缓冲区能否容纳pops中各种群的各个矩阵
+        if self.buffers is None:
+            return False
+        for name in self._names():
+            buffer = self.buffers[0][name]
+            for pop in pops:
+                data = getattr(pop, name)
+                if data is None or data.shape[1:] != buffer.shape[1:] or not np.can_cast(data.dtype, buffer.dtype):
+                    return False
+        return True
+
+    def _allocate(self, pops, NIND):
+        # 根据pops中各种群的矩阵形状与类型分配两块缓冲区
+        if self.capacity is None or self.capacity < NIND:
+            self.capacity = NIND
+        self.buffers = [{}, {}]
+        for name in self._names():
+            shape = (self.capacity,) + getattr(pops[0], name).shape[1:]
+            dtype = np.result_type(*[getattr(pop, name) for pop in pops])
+            self.buffers[0][name] = np.empty(shape, dtype)
+            self.buffers[1][name] = np.empty(shape, dtype)
+        self.current = None
+
+    def _view(self, population, NIND):
+        # 生成以当前缓冲区前NIND行为各矩阵的种群
+        buffer = self.buffers[0]
+        return ea.Population(population.Encoding,
+                             population.Field,
+                             NIND,
+                             buffer['Chrom'][:NIND],
+                             buffer['ObjV'][:NIND],
+                             buffer['FitnV'][:NIND],
+                             buffer['CV'][:NIND],
+                             buffer['Phen'][:NIND],
+                             True)
+
+    def merge(self, population, offspring):
+        """
+        描述: 合并父子两代种群，得到的种群与population + offspring相同（适应度被重置为1），
+        但其各矩阵都位于当前缓冲区中。
+        若population正是上一次select()的结果，则它与合并后的种群共用内存，其FitnV也会随之被重置为1。
+        """
+
+        NIND = population.sizes + offspring.sizes
+        if population.Chrom is None or offspring.Chrom is None:
+            raise RuntimeError('error in PopArena: Chrom is None. (种群染色体矩阵未初始化。)')
+        if population.Encoding != offspring.Encoding:
+            raise RuntimeError('error in PopArena: Encoding disagree. (两种群染色体的编码方式必须一致。)')
+        if self.capacity is None or NIND > self.capacity or not self._fits([population, offspring]):
+            self._allocate([population, offspring], NIND)
+        buffer = self.buffers[0]
+        written = False
+        for name in self._names():
+            if name == 'FitnV':
+                buffer[name][:NIND] = 1 # 重置适应度
+                continue
+            data = getattr(population, name)
+            if self.current is None or data is not self.current[name]: # 父代种群不在当前缓冲区的开头时才需要写入
+                buffer[name][:population.sizes] = data
+                written = True
+            buffer[name][population.sizes:NIND] = getattr(offspring, name)
+        if written:
+            self.current = None
+        return self._view(population, NIND)
+
+    def select(self, population, index):
+        """
+        描述: 从种群中选出index对应的个体组成新的种群，得到的种群与population[index]相同，
+        但其各矩阵都位于缓冲区中。index是一个Numpy array类型的下标行向量或逻辑行向量。
+        """
+
+        index = np.asarray(index)
+        if index.dtype == bool: # 逻辑下标（如refselect返回的chooseFlag）转换为整数下标
+            index = np.where(index)[0]
+        NIND = len(index)
+        if self.capacity is None or NIND > self.capacity or not self._fits([population]):
+            self.current = None
+            return population[index]
+        back = self.buffers[1]
+        for name in self._names():
+            data = getattr(population, name)
+            out = back[name][:NIND]
+            # 正常情况下data位于当前缓冲区而out位于另一块缓冲区，两者不重叠，此时无需让np.take()另开缓冲
+            np.take(data, index, axis = 0, out = out, mode = 'raise' if np.may_share_memory(data, out) else 'clip')
+        self.buffers.reverse() # 交换两块缓冲区
+        newPop = self._view(population, NIND)
+        self.current = {'Chrom' : newPop.Chrom, 'Phen' : newPop.Phen, 'ObjV' : newPop.ObjV, 'FitnV' : newPop.FitnV, 'CV' : newPop.CV}
+        return newPop
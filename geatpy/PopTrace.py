@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import os
+import numpy as np
+import geatpy as ea
+
+class PopTrace(list):
+
+    """
+PopTrace : class - 种群记录器类
+
+描述:
+    种群记录器用于在多目标进化过程中记录每一代的种群，它本身是一个由种群对象组成的列表，
+    因此可以直接传给ea.indicator.moea_tracking()进行指标追踪分析。
+    与直接记录每一代完整的种群相比，种群记录器可以按需控制所占用的内存：
+    只记录目标函数值、每隔若干代才记录一次、只保留最近若干代的记录，
+    或者把每一代的记录以追加的方式流式写入磁盘文件，之后再用PopTrace.load()读回来。
+
+属性:
+    mode     : str   - 内存中的记录方式，
+                       'full'：记录完整种群的副本（默认）；
+                       'objv'：只记录目标函数值矩阵ObjV和违反约束程度矩阵CV，
+                               此时记录下来的种群的Chrom和Phen都是列数为0的矩阵；
+                       'off' ：不在内存中记录。
+
+    gap      : int   - 每隔gap代记录一次，默认为1，即每一代都记录。
+
+    maxLen   : int   - 内存中最多保留的记录数，超出时丢弃最早的记录（环形缓冲），为None时不限制。
+
+    fileName : str   - 流式记录文件的路径，为None时不写文件。
+                       设置后每记录一代，就把该代的代数、ObjV和CV（以及可选的Phen）以.npy的格式追加到该文件末尾。
+
+    filePhen : bool  - 流式记录文件中是否也记录种群表现型矩阵Phen，默认为False。
+
+    gens     : list  - 内存中每条记录所对应的进化代数。
+
+函数:
+    record(pop, gen) : 记录第gen代的种群pop。
+
+    load(fileName)   : 从流式记录文件中读取记录，返回一个PopTrace对象。
+
+"""
+
+    def __init__(self, mode = 'full', gap = 1, maxLen = None, fileName = None, filePhen = False):
+        list.__init__(self)
+        if mode != 'full' and mode != 'objv' and mode != 'off':
+            raise RuntimeError('error in PopTrace: mode must be ''full'', ''objv'' or ''off''. (mode必须为''full''、''objv''或''off''。)')
+        self.mode = mode
+        self.gap = gap
+        self.maxLen = maxLen
+        self.fileName = fileName
+        self.filePhen = filePhen
+        self.gens = []
+        if fileName is not None:
+            dirName = os.path.dirname(fileName)
+            if dirName != '' and os.path.exists(dirName) == False:
+                os.makedirs(dirName)
+            open(fileName, 'wb').close() # 清空旧文件
+
+    def record(self, pop, gen):
+        """
+        描述: 记录第gen代的种群pop，gen不是gap的整数倍时忽略该代。
+        """
+
+        if gen % self.gap != 0:
+            return
+        if self.mode != 'off':
+            if self.mode == 'full':
+                self.append(pop.copy()) # pop的矩阵可能是种群缓冲区的视图（详见PopArena类），之后会被覆盖
+            else:
+                self.append(_objvPop(pop.ObjV, pop.CV)) # 种群的构造方法会复制ObjV和CV
+            self.gens.append(gen)
+            if self.maxLen is not None and len(self) > self.maxLen: # 丢弃最早的记录
+                del self[0]
+                del self.gens[0]
+        if self.fileName is not None:
+            with open(self.fileName, 'ab') as file:
+                np.save(file, np.array([gen, self.filePhen]))
+                np.save(file, pop.ObjV)
+                np.save(file, pop.CV)
+                if self.filePhen:
+                    np.save(file, pop.Phen)
+
+    @staticmethod
+    def load(fileName):
+        """
+        描述: 读取由PopTrace流式写入的记录文件，返回一个mode为'objv'的PopTrace对象，
+        其中每条记录都是一个只含ObjV和CV（若文件中有记录Phen，则也包含Phen）的种群。
+        """
+
+        trace = PopTrace('objv')
+        size = os.path.getsize(fileName)
+        with open(fileName, 'rb') as file:
+            while file.tell() < size:
+                gen, hasPhen = np.load(file)
+                ObjV = np.load(file)
+                CV = np.load(file)
+                pop = _objvPop(ObjV, CV)
+                if hasPhen:
+                    pop.Phen = np.load(file)
+                trace.append(pop)
+                trace.gens.append(int(gen))
+        return trace
+
+def _objvPop(ObjV, CV):
+    # 生成一个只含ObjV和CV的种群，其Chrom和Phen都是列数为0的矩阵
+    NIND = ObjV.shape[0]
+    return ea.Population('RI', np.zeros((3, 0)), NIND, np.zeros((NIND, 0)), ObjV, None, CV, np.zeros((NIND, 0)))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
+import json
 import numpy as np
 import geatpy as ea
 
@@ -42,7 +43,7 @@ Population : class - 种群类
 
 """
 
-    def __init__(self, Encoding, Field, NIND, Chrom = None, ObjV = None, FitnV = None, CV = None, Phen = None):
+    def __init__(self, Encoding, Field, NIND, Chrom = None, ObjV = None, FitnV = None, CV = None, Phen = None, share = False):
         """
         描述: 种群类的构造方法，用于实例化种群对象，例如：
              import geatpy as ea
@@ -52,17 +53,28 @@ Population : class - 种群类
              该构造方法必须传入Chrom，才算是完成种群真正的初始化。
              一开始可以只传入Encoding, Field以及NIND来完成种群对象的实例化，
              其他属性可以后面再通过计算进行赋值。
+             share默认为False，此时构造方法会复制传入的各个矩阵；
+             share为True时不作任何复制，新种群直接引用传入的矩阵（与之共享内存），
+             种群的切片与合并都采用这种方式来避免多余的复制。
         """
         
         self.sizes = NIND
         self.Lind = Chrom.shape[1] if Chrom is not None else 0
         self.Encoding = Encoding
-        self.Field = Field.copy()
-        self.Chrom = Chrom.copy() if Chrom is not None else Chrom
-        self.ObjV = ObjV.copy() if ObjV is not None else ObjV
-        self.FitnV = FitnV.copy() if FitnV is not None else np.ones((self.sizes, 1))
-        self.CV = CV.copy() if CV is not None else np.zeros((self.sizes, 1))
-        self.Phen = Phen.copy() if Phen is not None else Phen
+        if share:
+            self.Field = Field
+            self.Chrom = Chrom
+            self.ObjV = ObjV
+            self.FitnV = FitnV if FitnV is not None else np.ones((self.sizes, 1))
+            self.CV = CV if CV is not None else np.zeros((self.sizes, 1))
+            self.Phen = Phen
+        else:
+            self.Field = Field.copy()
+            self.Chrom = Chrom.copy() if Chrom is not None else Chrom
+            self.ObjV = ObjV.copy() if ObjV is not None else ObjV
+            self.FitnV = FitnV.copy() if FitnV is not None else np.ones((self.sizes, 1))
+            self.CV = CV.copy() if CV is not None else np.zeros((self.sizes, 1))
+            self.Phen = Phen.copy() if Phen is not None else Phen
     
     def initChrom(self, NIND = None):
         """
@@ -81,6 +93,8 @@ Population : class - 种群类
     def decoding(self):
         """
         描述: 种群染色体解码。
+        注意: 对于'RI'和'P'编码，染色体即为表现型，此时返回Chrom的副本，
+             因此aimFunc原地修改Phen（如取整、修复）不会改变染色体。
         """
     
         if self.Encoding == 'BG': # 此时Field实际上为FieldD
@@ -96,6 +110,7 @@ Population : class - 种群类
         copy : function - 种群的复制
         用法:
             假设pop是一个种群矩阵，那么：pop1 = pop.copy()即可完成对pop种群的复制。
+            复制得到的种群与原种群不共享任何矩阵。
         """
         
         return Population(self.Encoding, 
@@ -113,20 +128,23 @@ Population : class - 种群类
         用法: 假设pop是一个包含多于2个个体的种群矩阵，那么：
              pop1 = pop[[0,1]]即可得到由pop种群的第1、2个个体组成的种群。
         注意: index必须是一个Numpy array类型的行向量。
+             由于用下标向量索引得到的矩阵本身就是新的矩阵，因此新种群直接使用它们而不再复制；
+             若index是切片(slice)，则新种群的各矩阵是原种群矩阵的视图，与原种群共享内存。
         """
         
-        NewChrom = self.Chrom[index]
-        NIND = NewChrom.shape[0]
         if self.Chrom is None:
             raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
+        NewChrom = self.Chrom[index]
+        NIND = NewChrom.shape[0]
         return Population(self.Encoding, 
                           self.Field, 
                           NIND,
                           NewChrom, 
-                          self.ObjV[index], 
+                          self.ObjV[index] if self.ObjV is not None else None, 
                           self.FitnV[index], 
                           self.CV[index], 
-                          self.Phen[index])
+                          self.Phen[index] if self.Phen is not None else None,
+                          True)
     
     def shuffle(self):
         """
@@ -134,7 +152,7 @@ Population : class - 种群类
         用法: 假设pop是一个种群矩阵，那么，pop.shuffle()即可完成对pop种群个体顺序的打乱
         """
         
-        shuff = np.argsort(np.random.rand(self.sizes))
+        shuff = np.argsort(ea.rng.rand(self.sizes))
         
         if self.Chrom is None:
             raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
@@ -176,7 +194,7 @@ Population : class - 种群类
         
         if self.Encoding != pop.Encoding:
             raise RuntimeError('error in Population: Encoding disagree. (两种群染色体的编码方式必须一致。)')
-        if np.all(self.Field == pop.Field) == False:
+        if self.Field is not pop.Field and np.all(self.Field == pop.Field) == False:
             raise RuntimeError('error in Population: Field disagree. (两者的译码矩阵必须一致。)')
         if self.Chrom is None or pop.Chrom is None:
             raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
@@ -188,7 +206,8 @@ Population : class - 种群类
                           np.vstack([self.ObjV, pop.ObjV]), 
                           np.ones((NIND, 1)), # 重置适应度
                           np.vstack([self.CV, pop.CV]), 
-                          np.vstack([self.Phen, pop.Phen]))
+                          np.vstack([self.Phen, pop.Phen]),
+                          True) # 合并得到的矩阵都是新的矩阵，无需再复制
 
     def __len__(self):
         """
@@ -199,10 +218,10 @@ Population : class - 种群类
         
         return self.sizes
     
-    def save(self):
+    def save(self, dirName = 'Result', binary = False):
         """
-        描述: 把种群的信息保存到文件中。
-        该函数将在"Result"文件夹下保存种群的信息，其中：
+        描述: 把种群的信息保存到dirName文件夹（默认为"Result"）中。
+        binary为False（默认）时以文本形式保存，其中：
         "Encoding.txt"保存种群的染色体编码；
         "Field.csv"保存种群染色体的译码矩阵；
         "Chrom.csv"保存种群的染色体矩阵；
@@ -210,18 +229,60 @@ Population : class - 种群类
         "FitnV.csv"保存种群个体的适应度列向量；
         "CV.csv"保存种群个体的违反约束程度矩阵；
         "Phen.csv"保存种群染色体表现型矩阵；
+        binary为True时改为以Numpy的.npy二进制格式保存上述各矩阵（"Field.npy"、"Chrom.npy"等），
+        并用"Population.json"记录编码方式、种群规模等信息。二进制格式不损失精度，读写都远快于文本格式，
+        且可以用Population.load()以内存映射的方式打开。
+        值为None的矩阵不保存。
         注意：该函数不会对种群的合法性进行检查。
         """
         
-        if os.path.exists('Result') == False:
-            os.makedirs('Result')
-        with open('Result/Encoding.txt','w') as file:
-            file.write(self.Encoding)
-        np.savetxt('Result/Field.csv', self.Field, delimiter=',')
-        np.savetxt('Result/Chrom.csv', self.Chrom, delimiter=',')
-        np.savetxt('Result/ObjV.csv', self.ObjV, delimiter=',')
-        np.savetxt('Result/FitnV.csv', self.FitnV, delimiter=',')
-        np.savetxt('Result/CV.csv', self.CV, delimiter=',')
-        np.savetxt('Result/Phen.csv', self.Phen, delimiter=',')
+        if os.path.exists(dirName) == False:
+            os.makedirs(dirName)
+        matrices = [('Field', self.Field), ('Chrom', self.Chrom), ('ObjV', self.ObjV), ('FitnV', self.FitnV), ('CV', self.CV), ('Phen', self.Phen)]
+        if binary:
+            with open(os.path.join(dirName, 'Population.json'), 'w') as file:
+                json.dump({'Encoding' : self.Encoding, 'sizes' : self.sizes}, file)
+            for name, data in matrices:
+                if data is not None:
+                    np.save(os.path.join(dirName, name + '.npy'), data)
+        else:
+            with open(os.path.join(dirName, 'Encoding.txt'), 'w') as file:
+                file.write(self.Encoding)
+            for name, data in matrices:
+                if data is not None:
+                    np.savetxt(os.path.join(dirName, name + '.csv'), data, delimiter=',')
         print('种群信息导出完毕。')
+    
+    @staticmethod
+    def load(dirName = 'Result', mmap = False):
+        """
+        描述: 从dirName文件夹（默认为"Result"）中读取由save()保存的种群，返回一个种群对象。
+        文件夹中有"Population.json"时按二进制格式读取，否则按文本格式读取。
+        mmap为True时（仅适用于二进制格式）以只读的内存映射方式打开各矩阵，此时无论矩阵多大都能立即打开，
+        数据只在被访问时才从磁盘读入；若需要修改种群，请先调用其copy()方法。
+        """
+        
+        header = os.path.join(dirName, 'Population.json')
+        if os.path.exists(header):
+            with open(header, 'r') as file:
+                info = json.load(file)
+            Encoding = info['Encoding']
+            def read(name):
+                fileName = os.path.join(dirName, name + '.npy')
+                return np.load(fileName, mmap_mode = 'r' if mmap else None) if os.path.exists(fileName) else None
+        else:
+            if mmap:
+                raise RuntimeError('error in Population.load: Only the binary format can be memory-mapped. (只有二进制格式的种群文件才能以内存映射的方式打开。)')
+            with open(os.path.join(dirName, 'Encoding.txt'), 'r') as file:
+                Encoding = file.read().strip()
+            info = {}
+            def read(name):
+                fileName = os.path.join(dirName, name + '.csv')
+                return np.loadtxt(fileName, delimiter=',', ndmin = 2) if os.path.exists(fileName) else None
+        Field = read('Field')
+        Chrom = read('Chrom')
+        Phen = read('Phen')
+        ObjV = read('ObjV')
+        sizes = info['sizes'] if 'sizes' in info else (Chrom.shape[0] if Chrom is not None else ObjV.shape[0])
+        return Population(Encoding, Field, sizes, Chrom, ObjV, read('FitnV'), read('CV'), Phen, True)
     
\ No newline at end of file
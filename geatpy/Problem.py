@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 import os
+import copy
+import time
 import numpy as np
+from multiprocessing import Pool as ProcessPool
+from multiprocessing.dummy import Pool as ThreadPool
 
 class Problem:
     
@@ -27,6 +31,14 @@ Problem : Class - 问题类
     
     borders   : array - 决策变量范围的边界矩阵，第一行对应决策变量的下边界，第二行对应决策变量的上边界，
                         0表示范围中不含边界，1表示范围包含边界。
+    
+    poolType  : str   - 并行评价所用的池类型，'Process'表示进程池（默认），'Thread'表示线程池。
+                        若aimFunc主要调用Numpy/BLAS或会释放GIL的C扩展，则宜采用'Thread'，
+                        此时各线程直接读取Phen的切片，并把结果写到同一个预先分配的ObjV/CV矩阵中，
+                        省去了进程间传递数据的开销。
+    
+    pool      : Pool  - 并行评价所用的进程池或线程池，由evaluation()按需创建并在多代之间复用，
+                        调用closePool()后释放。
 
 函数:
     aimFunc(pop) : 目标函数，需要在继承类即自定义的问题类中实现，或是传入已实现的函数。
@@ -40,7 +52,16 @@ Problem : Class - 问题类
     
     calBest()   : 计算理论最优值的函数，需要在继承类中实现，或是传入已实现的函数。
     
-    getBest()   : 获取全局最优解。
+    getBest()   : 获取全局最优解，结果在本进程内缓存并以二进制文件保存在Real_Best文件夹内。
+    
+    evaluation(pop, poolSize) : 评价种群。poolSize大于1时，把种群按行切分成若干块，
+                                放到进程池或线程池中并行调用aimFunc()，再把各块的ObjV和CV拼接回pop中。
+    
+    openPool(poolSize) : 按poolType打开（或复用）大小为poolSize的进程池或线程池。
+    
+    submit(pop, poolSize, callback, errorCallback) : 把种群pop提交到池中异步评价，不等待评价完成（详见AsyncEvaluator类）。
+    
+    closePool() : 关闭并释放并行评价所用的进程池或线程池。
 
 """
 
@@ -54,6 +75,16 @@ Problem : Class - 问题类
         self.borders = np.array([lbin, ubin]) # 初始化borders（决策变量范围边界矩阵）
         self.aimFunc = aimFunc if aimFunc is not None else self.aimFunc # 初始化目标函数接口
         self.calBest = calBest if calBest is not None else self.calBest # 初始化理论最优值计算函数接口
+        self.poolType = 'Process' # 并行评价所用的池类型
+        self.pool = None # 并行评价所用的进程池或线程池
+        self.poolState = None # 当前所开的池的类型及大小
+    
+    def __getstate__(self):
+        # 进程池无法被序列化，在把问题对象传给子进程时将其剔除
+        state = self.__dict__.copy()
+        state['pool'] = None
+        state['poolState'] = None
+        return state
     
     def aimFunc(self, pop):
         raise RuntimeError('error in Problem: aimFunc has not been initialized. (未在问题子类中设置目标函数！)')
@@ -61,27 +92,184 @@ Problem : Class - 问题类
     def calBest(self):
         return None
     
-    def getBest(self, reCalculate = False):
+    def evaluation(self, pop, poolSize = None):
+        """
+        描述: 评价种群pop，计算其ObjV和CV。
+        poolSize为并行评价的进程/线程数，为None或不大于1时直接在主进程中调用aimFunc(pop)；
+        否则把pop按行切分成poolSize块，按poolType用进程池或线程池并行计算各块的目标函数值，
+        然后把各块的ObjV和CV按原顺序合并回pop中。
+        池在第一次并行评价时创建，之后每一代都复用该池，直到调用closePool()为止。
+        注意: 采用进程池时问题对象会被传给子进程，因此aimFunc必须是可序列化的（不能是lambda等匿名函数）；
+             采用线程池时各块的Phen和ObjV、CV均为原矩阵的切片，aimFunc若直接修改pop.ObjV[:]等，
+             其结果会原地写入预先分配的矩阵中。
+        """
+        
+        if poolSize is None or poolSize <= 1 or pop.sizes < 2:
+            self.aimFunc(pop)
+            return
+        self.openPool(poolSize)
+        if self.poolType == 'Process':
+            subPops = _split(pop, poolSize)
+            results = self.pool.map(_subEvaluation, subPops)
+            pop.ObjV = np.vstack([result[0] for result in results])
+            pop.CV = np.vstack([result[1] for result in results])
+        else:
+            # 预先分配ObjV和CV，各线程把结果写到其中互不重叠的切片上
+            ObjV = np.empty((pop.sizes, self.M))
+            CV = pop.CV.copy() if pop.CV is not None and pop.CV.shape[0] == pop.sizes else np.zeros((pop.sizes, 1))
+            subPops = _views(pop, poolSize, ObjV, CV)
+            results = self.pool.map(self._threadEvaluation, subPops)
+            pop.ObjV = ObjV
+            if any(result is not None for result in results): # aimFunc改变了CV的列数，此时只能把各块拼接起来
+                pop.CV = np.vstack([subPop.CV for subPop in subPops])
+            else:
+                pop.CV = CV
+    
+    def openPool(self, poolSize):
+        """
+        描述: 按poolType打开大小为poolSize的进程池或线程池并返回。若已打开的池的类型及大小与之相同，则直接复用它。
+        """
+        
+        if self.poolType != 'Process' and self.poolType != 'Thread':
+            raise RuntimeError('error in Problem: poolType must be ''Process'' or ''Thread''. (poolType必须为''Process''或''Thread''。)')
+        if self.pool is None or self.poolState != (self.poolType, poolSize):
+            self.closePool()
+            if self.poolType == 'Process':
+                self.pool = ProcessPool(poolSize, _initWorker, (self,)) # 在子进程中保存问题对象，使其只需传递一次
+            else:
+                self.pool = ThreadPool(poolSize)
+            self.poolState = (self.poolType, poolSize)
+        return self.pool
+    
+    def submit(self, pop, poolSize, callback, errorCallback = None):
+        """
+        描述: 把种群pop（通常只含一个个体）提交到大小为poolSize的池中异步评价，立即返回而不等待评价完成。
+        评价完成后，池的结果处理线程会调用callback([ObjV, CV, elapsed])，其中elapsed为在子进程（线程）中
+        调用aimFunc的用时（单位：秒）；aimFunc出错时则调用errorCallback(异常)。
+        pop本身不会被修改，评价结果需要由callback写回。异步稳态算法模板通过AsyncEvaluator类使用该函数。
+        """
+        
+        self.openPool(poolSize)
+        subPop = _split(pop, 1)[0]
+        args = (subPop,) if self.poolType == 'Process' else (subPop, self) # 子进程中的问题对象已由_initWorker保存
+        self.pool.apply_async(_timedEvaluation, args, callback = callback, error_callback = errorCallback)
+    
+    def _threadEvaluation(self, subPop):
+        # 线程池中评价一块子种群，返回None表示结果已写入预先分配的矩阵中
+        ObjV, CV = subPop.ObjV, subPop.CV
+        self.aimFunc(subPop)
+        if subPop.ObjV is not ObjV:
+            ObjV[:] = subPop.ObjV
+        if subPop.CV is not CV:
+            if subPop.CV.shape != CV.shape:
+                return subPop.CV
+            CV[:] = subPop.CV
+        return None
+    
+    def closePool(self):
+        """
+        描述: 关闭并释放并行评价所用的进程池或线程池。
+        """
+        
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.poolState = None
+    
+    def getBest(self, reCalculate = False, N = None):
         """
         描述: 该函数用于读取/计算问题的理论全局最优解。
         reCalculate是一个bool变量，用于判断是否需要重新计算理论全局最优解。
-        默认情况下reCalculate是False，此时将先尝试读取理论全局最优解的数据，
-        若读取不到，则尝试调用calBest()来计算理论全局最优解。
+        N为所要生成的理论全局最优解的个数，为None时采用calBest()的默认值，否则调用calBest(N)。
+        默认情况下reCalculate是False，此时先在本进程的缓存中查找以(问题名称, 目标维数, 决策变量个数, N)为键的数据，
+        再尝试从Real_Best文件夹读取二进制的.npy文件（旧版本保存的.csv文件也能读取，读取后会转存为.npy文件），
+        若都读取不到，则调用calBest()来计算理论全局最优解。
         在计算理论全局最优解后，
-        将结果按照“问题名称_目标维数_决策变量个数.csv”的文件命名把数据保存到Real_Best文件夹内。
+        将结果按照“问题名称_目标维数_决策变量个数[_N个数].npy”的文件命名把数据保存到Real_Best文件夹内。
+        返回的矩阵在同一进程内被共享，因此是只读的，需要修改时请先复制。
         """
         
+        key = (self.name, self.M, self.Dim, N)
+        if reCalculate == False and key in _bestCache:
+            return _bestCache[key]
         if os.path.exists('Real_Best') == False:
             os.makedirs('Real_Best')
+        fileName = 'Real_Best/' + self.name + '_M' + str(self.M) + '_D' + str(self.Dim) + ('' if N is None else '_N' + str(N))
+        golobalBestObjV = None
         if reCalculate == False:
             # 尝试读取数据
-            if os.path.exists('Real_Best/' + self.name + '_M' + str(self.M) + '_D' + str(self.Dim) + '.csv'):
-                return np.loadtxt('Real_Best/' + self.name + '_M' + str(self.M) + '_D' + str(self.Dim) + '.csv', delimiter=',')
-        # 若找不到数据，则调用calBest()计算全局最优数据
-        golobalBestObjV = self.calBest()
-        if golobalBestObjV is not None:
-            # 保存数据
-            np.savetxt('Real_Best/' + self.name + '_M' + str(self.M) + '_D' + str(self.Dim) + '.csv', golobalBestObjV, delimiter=',')
-        else:
-            print('未找到理论全局最优数据！')
+            if os.path.exists(fileName + '.npy'):
+                golobalBestObjV = np.load(fileName + '.npy')
+            elif os.path.exists(fileName + '.csv'):
+                golobalBestObjV = np.atleast_2d(np.loadtxt(fileName + '.csv', delimiter=','))
+                np.save(fileName + '.npy', golobalBestObjV) # 转存为二进制文件，下次读取时无需再解析文本
+        if golobalBestObjV is None:
+            # 若找不到数据，则调用calBest()计算全局最优数据
+            golobalBestObjV = self.calBest() if N is None else self.calBest(N)
+            if golobalBestObjV is not None:
+                # 保存数据
+                np.save(fileName + '.npy', golobalBestObjV)
+            else:
+                print('未找到理论全局最优数据！')
+                return golobalBestObjV
+        golobalBestObjV.flags.writeable = False
+        _bestCache[key] = golobalBestObjV
         return golobalBestObjV
+
+_bestCache = {} # 本进程内已读取/计算的理论全局最优解，键为(问题名称, 目标维数, 决策变量个数, N)
+
+_problem = None # 子进程中的问题对象
+
+def _initWorker(problem):
+    global _problem
+    _problem = problem
+
+def _subEvaluation(subPop):
+    _problem.aimFunc(subPop)
+    return subPop.ObjV, subPop.CV
+
+def _timedEvaluation(subPop, problem = None):
+    problem = _problem if problem is None else problem
+    start = time.perf_counter()
+    problem.aimFunc(subPop)
+    return [subPop.ObjV, subPop.CV, time.perf_counter() - start]
+
+def _bounds(sizes, num):
+    num = min(num, sizes)
+    bounds = np.linspace(0, sizes, num + 1).astype(int)
+    return zip(bounds[:-1], bounds[1:])
+
+def _split(pop, num):
+    """
+    描述: 把种群按行切分成num块连续的子种群，子种群只携带aimFunc需要的Chrom、Phen和CV。
+    """
+    
+    subPops = []
+    for start, end in _bounds(pop.sizes, num):
+        subPops.append(pop.__class__(pop.Encoding,
+                                     pop.Field,
+                                     end - start,
+                                     pop.Chrom[start:end] if pop.Chrom is not None else None,
+                                     None,
+                                     None,
+                                     pop.CV[start:end] if pop.CV is not None and pop.CV.shape[0] == pop.sizes else None,
+                                     pop.Phen[start:end]))
+    return subPops
+
+def _views(pop, num, ObjV, CV):
+    """
+    描述: 把种群按行切分成num块连续的子种群，子种群的各矩阵都是pop（以及ObjV、CV）的切片，不发生复制。
+    """
+    
+    subPops = []
+    for start, end in _bounds(pop.sizes, num):
+        subPop = copy.copy(pop) # 浅复制，只替换其中的矩阵为切片
+        subPop.sizes = end - start
+        subPop.Chrom = pop.Chrom[start:end] if pop.Chrom is not None else None
+        subPop.Phen = pop.Phen[start:end]
+        subPop.FitnV = pop.FitnV[start:end] if pop.FitnV is not None and pop.FitnV.shape[0] == pop.sizes else None
+        subPop.ObjV = ObjV[start:end]
+        subPop.CV = CV[start:end]
+        subPops.append(subPop)
+    return subPops
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import time
+import numpy as np
+
+class Profiler:
+
+    """
+Profiler : class - 进化过程分阶段计时器类
+
+描述:
+    算法模板本身只记录总用时passTime，无法看出一次较慢的运行把时间花在了选择、重组、变异、解码、
+    评价（aimFunc）、非支配排序还是重插入上。把Profiler对象赋给算法模板的profiler属性后，
+    算法模板在每个阶段结束时调用tick(阶段名)，Profiler就把从上一次tick到现在的用时计入该阶段，
+    从而得到各阶段的累计用时、调用次数以及每一代的用时。
+    每次tick只需读取一次时钟并更新几个列表元素，因此可以在生产环境中一直开启；
+    未设置profiler时算法模板的tick()直接返回，几乎没有开销。
+    内置算法模板使用的阶段名有：
+    'selection'     : 选择（包括差分进化中选择基向量）；
+    'recombination' : 重组；
+    'mutation'      : 变异；
+    'decoding'      : 染色体解码；
+    'evaluation'    : 评价，即调用call_aimFunc()；
+    'fitness'       : 计算适应度；
+    'ndsort'        : 非支配排序；
+    'reinsertion'   : 重插入，即从父子合并种群中选择个体保留到下一代（不含其中的非支配排序）；
+    'stat'          : 保存检查点、更新进化记录器、指标追踪器及绘制动态图等统计工作，即terminated()；
+    'other'         : 其他没有单独计时的用时，第0代的'other'包括初始化种群及其评价的用时。
+    第gen代的用时是产生并记录第gen代种群的各阶段用时之和。
+    用法:
+        myAlgorithm.profiler = ea.Profiler()
+        myAlgorithm.run()
+        print(myAlgorithm.profiler.report())
+        result = myAlgorithm.profiler.getResult()
+
+属性:
+    perGen  : bool  - 是否记录每一代各阶段的用时，默认为True。
+
+    phases  : list  - 各阶段的名称，按第一次出现的顺序排列。
+
+    time    : list  - 各阶段的累计用时（单位：秒），与phases一一对应。
+
+    calls   : list  - 各阶段的计时次数，与phases一一对应。
+
+    gens    : list  - 已记录用时的各代的代数。
+
+    genTime : list  - 每一代各阶段的用时，每个元素是一行，与gens一一对应。
+
+函数:
+    start()        : 清空记录并开始计时，由算法模板的initialization()调用。
+
+    tick(phase)    : 把从上一次计时到现在的用时计入阶段phase。
+
+    endGen(gen)    : 结束第gen代的计时，由算法模板的terminated()调用。
+
+    getResult()    : 以字典的形式返回计时结果。
+
+    report()       : 返回一个便于阅读的计时结果表格字符串。
+
+"""
+
+    def __init__(self, perGen = True):
+        self.perGen = perGen
+        self.clear()
+
+    def clear(self):
+        self.phases = []
+        self.index = {} # 阶段名到其在phases中的下标的映射
+        self.time = []
+        self.calls = []
+        self.gens = []
+        self.genTime = []
+        self.current = [] # 当代各阶段的用时
+        self.last = None # 上一次计时的时刻
+
+    def start(self):
+        self.clear()
+        self.last = time.perf_counter()
+
+    def tick(self, phase):
+        now = time.perf_counter()
+        if self.last is not None: # 尚未开始计时（如未调用start()）时只记下时刻
+            i = self.index.get(phase)
+            if i is None:
+                i = self.index[phase] = len(self.phases)
+                self.phases.append(phase)
+                self.time.append(0.0)
+                self.calls.append(0)
+                self.current.append(0.0)
+            elapsed = now - self.last
+            self.time[i] += elapsed
+            self.calls[i] += 1
+            self.current[i] += elapsed
+        self.last = now
+
+    def endGen(self, gen):
+        if self.perGen:
+            self.gens.append(gen)
+            self.genTime.append(self.current)
+        self.current = [0.0] * len(self.phases)
+
+    def getResult(self):
+        """
+        描述: 以字典的形式返回计时结果，各键的含义如下：
+        'phases'  : 各阶段的名称列表；
+        'time'    : 各阶段的累计用时（单位：秒）组成的行向量；
+        'calls'   : 各阶段的计时次数组成的行向量；
+        'gens'    : 已记录用时的各代的代数组成的行向量；
+        'genTime' : 每一代各阶段的用时矩阵，每一行对应一代，每一列对应一个阶段（某代没有出现的阶段用时为0）。
+        """
+
+        genTime = np.zeros((len(self.genTime), len(self.phases)))
+        for row, times in enumerate(self.genTime):
+            genTime[row, :len(times)] = times
+        return {'phases' : list(self.phases),
+                'time' : np.array(self.time),
+                'calls' : np.array(self.calls, dtype = int),
+                'gens' : np.array(self.gens, dtype = int),
+                'genTime' : genTime}
+
+    def report(self):
+        """
+        描述: 返回各阶段的累计用时、占比、计时次数及平均每次用时的表格字符串，按累计用时从大到小排列。
+        """
+
+        total = sum(self.time)
+        header = ['phase', 'time (s)', 'ratio', 'calls', 'mean (ms)']
+        rows = []
+        for i in np.argsort(self.time)[::-1]:
+            rows.append([self.phases[i], '%.4f' % self.time[i], '%.1f%%' % (100 * self.time[i] / total if total > 0 else 0),
+                         str(self.calls[i]), '%.4f' % (1000 * self.time[i] / self.calls[i])])
+        rows.append(['total', '%.4f' % total, '100.0%', '', ''])
+        widths = [max([len(header[j])] + [len(row[j]) for row in rows]) for j in range(len(header))]
+        lines = ['  '.join(h.ljust(w) for h, w in zip(header, widths))]
+        for row in rows:
+            lines.append('  '.join(r.ljust(w) for r, w in zip(row, widths)))
+        return '\n'.join(lines)
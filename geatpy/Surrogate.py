@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import geatpy as ea
+try:
+    from scipy.interpolate import RBFInterpolator # Scipy 1.7及以上版本才有
+except ImportError:
+    from scipy.interpolate import Rbf
+    RBFInterpolator = None
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.special import ndtr
+
+class Surrogate:
+
+    """
+Surrogate : class - 代理模型预筛选类
+
+描述:
+    当aimFunc评价一个个体就要花费数分钟（如调用仿真程序）时，评价次数就是最宝贵的资源。
+    代理模型预筛选类用所有真正评价过的个体（表现型Phen及其目标函数值ObjV、违反约束程度之和）组成的存档
+    拟合一个廉价的回归模型，算法模板每一代先按1 / fraction倍的规模通过选择、重组、变异生成候选子代，
+    再用代理模型预测各候选子代的目标函数值，只把最有希望的NIND个候选子代交给aimFunc真正评价，
+    其余的候选子代直接丢弃，从而在真实评价次数相同的情况下得到质量更高的子代。
+    用法: 设置算法模板对象的surrogate属性即可启用，例如：
+         myAlgorithm.surrogate = ea.Surrogate('kriging', 'EI', 0.25)
+    支持预筛选的算法模板有soea_SEGA_templet、soea_EGA_templet、soea_SGA_templet、moea_NSGA2_templet、
+    moea_NSGA3_templet、moea_RVEA_templet、moea_RVEA_RES_templet和moea_awGA_templet，
+    差分进化、进化策略等子代与父代一一对应的模板以及异步模板不进行预筛选（其surrogate属性不起作用）。
+    存档中的个体数不足minSize时不进行预筛选，此时直接评价前NIND个候选子代。
+    模型：
+        'rbf'     : 薄板样条径向基函数插值（scipy.interpolate.RBFInterpolator，Scipy低于1.7时改用scipy.interpolate.Rbf），只给出预测值。
+        'kriging' : 高斯核的简单克里金模型（高斯过程回归），核宽度按极大似然从一组候选值中选取，同时给出预测值的标准差。
+    排序准则：
+        'value'   : 单目标时按预测的违反约束程度之和与目标函数值排序；
+                    多目标时按预测的目标函数值与违反约束程度进行非支配排序，同一层中拥挤距离大者优先。
+        'EI'      : 按期望改进量（expected improvement）排序，只能用于单目标问题且需要'kriging'模型，
+                    预测为可行的候选子代优先，期望改进量大者优先。
+    违反约束程度之和与各目标一起建模，存档中所有个体都满足约束时则认为所有候选子代都满足约束。
+
+属性:
+    model     : str   - 代理模型，'rbf'或'kriging'。
+
+    criterion : str   - 排序准则，'value'或'EI'。
+
+    fraction  : float - 真正评价的子代数占候选子代数的比例，取值为(0, 1]。
+
+    MAXSIZE   : int   - 存档最多保存的个体数，超过时丢弃最早的个体（模型的拟合时间随存档规模的立方增长）。
+
+    minSize   : int   - 开始预筛选所需的最少存档个体数（重复个体只算一个），为None时取决策变量个数的2倍。
+
+    Phen      : array - 存档中个体的表现型矩阵。
+
+    ObjV      : array - 存档中个体的目标函数值矩阵。
+
+    vio       : array - 存档中个体的违反约束程度之和组成的列向量。
+
+    screened  : int   - 经过代理模型预测的候选子代总数。
+
+    saved     : int   - 被代理模型筛掉、因而省下的真实评价次数。
+
+    fits      : int   - 拟合模型的次数。
+
+函数:
+    candidateNum(NUM) : 返回为了得到NUM个子代需要生成的候选子代数。
+
+    update(pop)       : 把评价完的种群pop加入存档，由算法模板的call_aimFunc()调用。
+
+    predict(Phen)     : 返回[ObjV, vio, std]，即预测的目标函数值、违反约束程度之和以及目标函数值的标准差（'rbf'模型时为None）。
+
+    screen(pop, NUM, maxormins) : 返回候选种群pop中最有希望的NUM个个体的下标，存档个体数不足时返回None。
+
+    clear()           : 清空存档及计数器。
+
+"""
+
+    def __init__(self, model = 'kriging', criterion = 'value', fraction = 0.25, MAXSIZE = 500, minSize = None):
+        if model != 'rbf' and model != 'kriging':
+            raise RuntimeError('error in Surrogate: model must be ''rbf'' or ''kriging''. (model必须为''rbf''或''kriging''。)')
+        if criterion != 'value' and criterion != 'EI':
+            raise RuntimeError('error in Surrogate: criterion must be ''value'' or ''EI''. (criterion必须为''value''或''EI''。)')
+        if criterion == 'EI' and model != 'kriging':
+            raise RuntimeError('error in Surrogate: criterion ''EI'' requires the ''kriging'' model. (EI准则需要使用''kriging''模型。)')
+        if not 0 < fraction <= 1:
+            raise RuntimeError('error in Surrogate: fraction must be in (0, 1]. (fraction的取值必须在(0, 1]内。)')
+        self.model = model
+        self.criterion = criterion
+        self.fraction = fraction
+        self.MAXSIZE = MAXSIZE
+        self.minSize = minSize
+        self.clear()
+
+    def __len__(self):
+        return 0 if self.Phen is None else self.Phen.shape[0]
+
+    def clear(self):
+        """
+        描述: 清空存档、计数器及已拟合的模型。
+        """
+
+        self.Phen = None
+        self.ObjV = None
+        self.vio = None
+        self.screened = 0
+        self.saved = 0
+        self.fits = 0
+        self.fitted = None # 已拟合的模型，存档更新后置为None，在下一次预测时重新拟合
+
+    def candidateNum(self, NUM):
+        return int(np.ceil(NUM / self.fraction))
+
+    def update(self, pop):
+        """
+        描述: 把评价完的种群pop（其ObjV和CV已是真实的评价结果）加入存档。
+        """
+
+        if pop.sizes == 0:
+            return
+        vio = np.sum(np.maximum(pop.CV, 0), 1, keepdims = True) if pop.CV is not None else np.zeros((pop.sizes, 1))
+        if self.Phen is None:
+            self.Phen, self.ObjV, self.vio = pop.Phen.astype(float), pop.ObjV.astype(float), vio
+        else:
+            self.Phen = np.vstack([self.Phen, pop.Phen])[-self.MAXSIZE:]
+            self.ObjV = np.vstack([self.ObjV, pop.ObjV])[-self.MAXSIZE:]
+            self.vio = np.vstack([self.vio, vio])[-self.MAXSIZE:]
+        self.fitted = None
+
+    def fit(self):
+        """
+        描述: 用存档拟合代理模型。决策变量按存档的范围归一化到[0, 1]，各输出标准化为零均值、单位方差。
+        重复的个体只保留最后一次的评价结果。
+        """
+
+        Phen = self.Phen[::-1]
+        idx = np.sort(len(Phen) - 1 - np.unique(Phen, axis = 0, return_index = True)[1]) # 重复个体只保留最后评价的那个
+        Y = np.hstack([self.ObjV, self.vio])[idx]
+        if np.all(self.vio == 0):
+            Y = Y[:, :-1] # 存档中都是可行个体时不对违反约束程度建模
+        lower = np.min(self.Phen, 0)
+        scale = np.max(self.Phen, 0) - lower
+        scale[scale == 0] = 1
+        X = (self.Phen[idx] - lower) / scale
+        mean = np.mean(Y, 0)
+        std = np.std(Y, 0)
+        std[std == 0] = 1
+        Y = (Y - mean) / std
+        fitted = {'lower' : lower, 'scale' : scale, 'mean' : mean, 'std' : std}
+        if self.model == 'rbf':
+            if RBFInterpolator is not None:
+                fitted['rbf'] = RBFInterpolator(X, Y, kernel = 'thin_plate_spline', smoothing = 1e-10)
+            else: # 旧版Scipy的Rbf只支持单个输出，对每个输出分别插值
+                models = [Rbf(*X.T, Y[:, j], function = 'thin_plate', smooth = 1e-10) for j in range(Y.shape[1])]
+                fitted['rbf'] = lambda Xc : np.column_stack([model(*Xc.T) for model in models])
+        else:
+            fitted.update(_fitKriging(X, Y))
+        self.fitted = fitted
+        self.fits += 1
+
+    def predict(self, Phen):
+        """
+        描述: 预测表现型矩阵Phen中各个体的目标函数值ObjV、违反约束程度之和vio（列向量，不小于0）
+        以及目标函数值的标准差std（'rbf'模型时为None）。
+        """
+
+        if self.fitted is None:
+            self.fit()
+        fitted = self.fitted
+        X = (Phen - fitted['lower']) / fitted['scale']
+        std = None
+        if self.model == 'rbf':
+            Y = fitted['rbf'](X)
+        else:
+            Y, std = _predictKriging(fitted, X)
+            std = std * fitted['std']
+        Y = Y * fitted['std'] + fitted['mean']
+        M = self.ObjV.shape[1]
+        vio = np.maximum(Y[:, [M]], 0) if Y.shape[1] > M else np.zeros((X.shape[0], 1))
+        return [Y[:, :M], vio, None if std is None else std[:, :M]]
+
+    def screen(self, pop, NUM, maxormins):
+        """
+        描述: 用代理模型预测候选种群pop中各个体的表现，返回其中最有希望的NUM个个体的下标。
+        存档中的个体数（重复个体只算一个）不足minSize时不进行预测，返回None。
+        maxormins为问题类的maxormins，用于把各目标统一为最小化。
+        """
+
+        minSize = self.minSize if self.minSize is not None else 2 * pop.Phen.shape[1]
+        if pop.sizes <= NUM or len(self) == 0 or len(np.unique(self.Phen, axis = 0)) < minSize:
+            return None
+        ObjV, vio, std = self.predict(pop.Phen)
+        ObjV = maxormins * ObjV # 统一为最小化
+        if ObjV.shape[1] == 1:
+            if self.criterion == 'EI':
+                feasible = np.where(self.vio[:, 0] == 0)[0]
+                best = np.min(maxormins * self.ObjV[feasible if len(feasible) > 0 else slice(None)], 0)
+                s = np.maximum(std[:, 0], 1e-12)
+                z = (best - ObjV[:, 0]) / s
+                key = -((best - ObjV[:, 0]) * ndtr(z) + s * np.exp(-0.5 * z ** 2) / np.sqrt(2 * np.pi)) # 期望改进量的相反数
+            else:
+                key = ObjV[:, 0]
+            chosen = np.lexsort([key, vio[:, 0]])[:NUM]
+        else:
+            if self.criterion == 'EI':
+                raise RuntimeError('error in Surrogate: criterion ''EI'' only supports single-objective problems. (EI准则只能用于单目标问题。)')
+            [levels, criLevel] = ea.ndsortSweep(ObjV, NUM, None, vio) # 按预测值进行非支配分层
+            dis = ea.crowdis(ObjV, levels)
+            chosen = np.lexsort([-dis, levels])[:NUM]
+        self.screened += pop.sizes
+        self.saved += pop.sizes - NUM
+        return np.sort(chosen)
+
+def _kernel(A, B, theta):
+    # 高斯核矩阵
+    D = np.sum(A ** 2, 1)[:, None] + np.sum(B ** 2, 1)[None, :] - 2 * A @ B.T
+    return np.exp(-np.maximum(D, 0) / (2 * theta ** 2))
+
+def _fitKriging(X, Y):
+    """
+    描述: 拟合零均值的简单克里金模型，各输出共用同一个高斯核，
+    核宽度theta按集中对数似然从一组候选值中选取，各输出的过程方差sigma2取其极大似然估计。
+    """
+
+    n, k = Y.shape
+    nugget = 1e-8 * n # 防止核矩阵奇异
+    best = None
+    for theta in np.sqrt(X.shape[1]) * np.logspace(-1.5, 0.5, 9):
+        K = _kernel(X, X, theta) + nugget * np.eye(n)
+        try:
+            factor = cho_factor(K, lower = True)
+        except np.linalg.LinAlgError:
+            continue
+        alpha = cho_solve(factor, Y)
+        sigma2 = np.maximum(np.sum(Y * alpha, 0) / n, 1e-12)
+        logLike = -0.5 * n * np.sum(np.log(sigma2)) - k * np.sum(np.log(np.diag(factor[0])))
+        if best is None or logLike > best[0]:
+            best = [logLike, theta, factor, alpha, sigma2]
+    if best is None:
+        raise RuntimeError('error in Surrogate: Failed to fit the kriging model. (克里金模型拟合失败。)')
+    return {'X' : X, 'theta' : best[1], 'L' : best[2][0], 'alpha' : best[3], 'sigma2' : best[4], 'nugget' : nugget}
+
+def _predictKriging(fitted, X):
+    """
+    描述: 返回克里金模型在X处的（标准化的）预测值及其标准差。
+    """
+
+    Ks = _kernel(X, fitted['X'], fitted['theta'])
+    v = solve_triangular(fitted['L'], Ks.T, lower = True)
+    var = np.maximum(1 + fitted['nugget'] - np.sum(v ** 2, 0), 0)
+    return [Ks @ fitted['alpha'], np.sqrt(var[:, None] * fitted['sigma2'])]
@@ -2,9 +2,15 @@
 """
 geatpy  -  import all libs of geatpy
 
+为了加快import geatpy的速度，这里只导入常用的基础类，
+算法模板、绘图函数、各算子以及依赖scipy的类都在第一次被访问时才导入（详见__getattr__），
+例如第一次访问ea.moea_NSGA2_templet时才导入该模板，之后的访问与直接导入无异。
+Python 3.7之前模块不支持__getattr__，此时在import geatpy时就导入所有这些类、模板和算子。
+
 """
 
 import sys
+from importlib import import_module
 
 __author__ = "Geatpy Team"
 __version__ = "2.1.0"
@@ -16,93 +22,92 @@ if lib_path not in sys.path:
 from Algorithm import Algorithm
 from Algorithm import MoeaAlgorithm
 from Algorithm import SoeaAlgorithm
+from EvalCache import EvalCache
 from Population import Population
+from PopTrace import PopTrace
+from PopArena import PopArena
+from ParetoArchive import ParetoArchive
+from Profiler import Profiler
 from Problem import Problem
+from ndsortSweep import ndsortSweep
+from . import rng # 以包内模块的形式导入，避免被工作目录中同名的rng.py遮蔽
+from .rng import getRng, setRng
+
+# classes that are imported on first access (they depend on scipy or are rarely used)
+_classes = ['PFIndex', 'MetricTracker', 'PlotSink', 'IslandModel', 'Experiment', 'AsyncEvaluator', 'Surrogate']
 
-# import templates
-from templates.soeas.DE.DE_best_1_bin.soea_DE_best_1_bin_templet import soea_DE_best_1_bin_templet
-from templates.soeas.DE.DE_best_1_L.soea_DE_best_1_L_templet import soea_DE_best_1_L_templet
-from templates.soeas.DE.DE_rand_1_bin.soea_DE_rand_1_bin_templet import soea_DE_rand_1_bin_templet
-from templates.soeas.DE.DE_rand_1_L.soea_DE_rand_1_L_templet import soea_DE_rand_1_L_templet
-from templates.soeas.ES.ES_1_plus_1_templet.soea_ES_1_plus_1_templet import soea_ES_1_plus_1_templet
-from templates.soeas.GA.EGA.soea_EGA_templet import soea_EGA_templet
-from templates.soeas.GA.SEGA.soea_SEGA_templet import soea_SEGA_templet
-from templates.soeas.GA.SGA.soea_SGA_templet import soea_SGA_templet
-from templates.soeas.GA.studGA.soea_studGA_templet import soea_studGA_templet
+# templates that are imported on first access
+_templates = {'soea_DE_best_1_bin_templet' : 'templates.soeas.DE.DE_best_1_bin',
+              'soea_DE_best_1_L_templet' : 'templates.soeas.DE.DE_best_1_L',
+              'soea_DE_rand_1_bin_templet' : 'templates.soeas.DE.DE_rand_1_bin',
+              'soea_DE_rand_1_L_templet' : 'templates.soeas.DE.DE_rand_1_L',
+              'soea_ES_1_plus_1_templet' : 'templates.soeas.ES.ES_1_plus_1_templet',
+              'soea_EGA_templet' : 'templates.soeas.GA.EGA',
+              'soea_asyncSSGA_templet' : 'templates.soeas.GA.asyncSSGA',
+              'soea_SEGA_templet' : 'templates.soeas.GA.SEGA',
+              'soea_SGA_templet' : 'templates.soeas.GA.SGA',
+              'soea_studGA_templet' : 'templates.soeas.GA.studGA',
+              'moea_awGA_templet' : 'templates.moeas.awGA',
+              'moea_asyncNSGA2_templet' : 'templates.moeas.nsga2',
+              'moea_NSGA2_DE_templet' : 'templates.moeas.nsga2',
+              'moea_NSGA2_templet' : 'templates.moeas.nsga2',
+              'moea_NSGA3_DE_templet' : 'templates.moeas.nsga3',
+              'moea_NSGA3_templet' : 'templates.moeas.nsga3',
+              'moea_RVEA_templet' : 'templates.moeas.rvea',
+              'moea_RVEA_RES_templet' : 'templates.moeas.rvea'}
 
-from templates.moeas.awGA.moea_awGA_templet import moea_awGA_templet
-from templates.moeas.nsga2.moea_NSGA2_DE_templet import moea_NSGA2_DE_templet
-from templates.moeas.nsga2.moea_NSGA2_templet import moea_NSGA2_templet
-from templates.moeas.nsga3.moea_NSGA3_DE_templet import moea_NSGA3_DE_templet
-from templates.moeas.nsga3.moea_NSGA3_templet import moea_NSGA3_templet
-from templates.moeas.rvea.moea_RVEA_templet import moea_RVEA_templet
-from templates.moeas.rvea.moea_RVEA_RES_templet import moea_RVEA_RES_templet
+# the core, whose operators are imported on first access
+_core = ['awGA', 'boundfix', 'bs2int', 'bs2real', 'bs2ri', 'crowdis', 'crtfld', 'crtip', 'crtpc', 'crtpp', 'crtrp', 'crtup',
+         'dup', 'ecs', 'etour', 'indexing', 'indicator', 'meshrng', 'moeaplot', 'mutate', 'mutbga', 'mutbin', 'mutde', 'mutgau',
+         'mutinv', 'mutmove', 'mutpolyn', 'mutpp', 'mutswap', 'mutuni', 'ndsortDED', 'ndsortESS', 'otos', 'powing', 'ranking',
+         'recdis', 'recint', 'reclin', 'recndx', 'recombin', 'recsbx', 'refgselect', 'refselect', 'rps', 'rwGA', 'rws',
+         'scaling', 'selecting', 'soeaplot', 'sus', 'tour', 'trcplot', 'urs', 'varplot', 'xovbd', 'xovdp', 'xovexp', 'xovmp',
+         'xovox', 'xovpmx', 'xovsec', 'xovsh', 'xovsp', 'xovud']
 
-# import the core
+# choose the core (fall back to the pure-Numpy core when no compiled core matches this platform)
 lib_path = __file__[:-11] + 'core/'
 if lib_path not in sys.path:
     sys.path.append(lib_path)
-from awGA import awGA
-from boundfix import boundfix
-from bs2int import bs2int
-from bs2real import bs2real
-from bs2ri import bs2ri
-from crowdis import crowdis
-from crtfld import crtfld
-from crtip import crtip
-from crtpc import crtpc
-from crtpp import crtpp
-from crtrp import crtrp
-from crtup import crtup
-from dup import dup
-from ecs import ecs
-from etour import etour
-from indexing import indexing
-import indicator
-from meshrng import meshrng
-from moeaplot import moeaplot
-from mutate import mutate
-from mutbga import mutbga
-from mutbin import mutbin
-from mutde import mutde
-from mutgau import mutgau
-from mutinv import mutinv
-from mutmove import mutmove
-from mutpolyn import mutpolyn
-from mutpp import mutpp
-from mutswap import mutswap
-from mutuni import mutuni
-from ndsortDED import ndsortDED
-from ndsortESS import ndsortESS
-from otos import otos
-from powing import powing
-from ranking import ranking
-from recdis import recdis
-from recint import recint
-from reclin import reclin
-from recndx import recndx
-from recombin import recombin
-from recsbx import recsbx
-from refgselect import refgselect
-from refselect import refselect
-from rps import rps
-from rwGA import rwGA
-from rws import rws
-from scaling import scaling
-from selecting import selecting
-from soeaplot import soeaplot
-from sus import sus
-from tour import tour
-from trcplot import trcplot
-from urs import urs
-from varplot import varplot
-from xovbd import xovbd
-from xovdp import xovdp
-from xovexp import xovexp
-from xovmp import xovmp
-from xovox import xovox
-from xovpmx import xovpmx
-from xovsec import xovsec
-from xovsh import xovsh
-from xovsp import xovsp
-from xovud import xovud
\ No newline at end of file
+try:
+    import_module('crtfld') # 只导入一个编译版算子来检测编译版内核是否可用
+    __core__ = 'compiled'
+except ImportError:
+    from . import pycore
+    _core = pycore.__all__
+    __core__ = 'pycore'
+
+__all__ = ['Algorithm', 'MoeaAlgorithm', 'SoeaAlgorithm', 'EvalCache', 'Population', 'PopTrace', 'PopArena',
+           'ParetoArchive', 'Profiler', 'Problem', 'ndsortSweep', 'rng', 'getRng', 'setRng'] + _classes + list(_templates) + list(_core)
+
+def __getattr__(name):
+    # 第一次访问延迟导入的类、模板或算子时导入它，并把它保存到模块的命名空间中，之后的访问不再经过这里
+    if name in _templates:
+        value = getattr(import_module(_templates[name] + '.' + name), name)
+    elif name in _classes:
+        value = getattr(import_module(name), name)
+    elif name in _core:
+        if __core__ == 'pycore':
+            value = getattr(pycore, name)
+        elif name == 'indicator':
+            value = import_module(name)
+            # 超体积计算引擎及基于它的HV、基于PFIndex的GD和IGD、基于MetricTracker的moea_tracking对两种内核通用，
+            # 纯Numpy内核的indicator已包含这些函数（详见hypervolume.py、PFIndex.py及MetricTracker.py）
+            from hypervolume import calHV, hv2D, hv3D, hvWFG, hvMC
+            from .pycore.indicator import GD, IGD, HV, moea_tracking
+            value.calHV, value.hv2D, value.hv3D, value.hvWFG, value.hvMC = calHV, hv2D, hv3D, hvWFG, hvMC
+            value.GD, value.IGD, value.HV, value.moea_tracking = GD, IGD, HV, moea_tracking
+        else:
+            value = getattr(import_module(name), name)
+    else:
+        raise AttributeError("module 'geatpy' has no attribute '" + name + "'")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+if sys.version_info < (3, 7):
+    # Python 3.7之前模块不支持__getattr__（PEP 562），因此在导入时就导入所有延迟导入的类、模板和算子
+    for name in _classes + list(_templates) + list(_core):
+        __getattr__(name)
+    del name
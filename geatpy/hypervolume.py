@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+hypervolume.py - 超体积(Hypervolume)计算引擎
+
+包含: calHV, hv2D, hv3D, hvWFG, hvMC
+
+这些函数都遵循“最小化目标”的约定，计算点集相对于参考点refPoint所支配的区域的体积，
+超出参考点（即某一维不小于参考点）的点不贡献超体积。
+两种内核（编译版内核与纯Numpy内核）都可以通过ea.indicator访问这些函数，indicator.HV也基于它们实现。
+
+"""
+
+import numpy as np
+from geatpy import rng
+from bisect import bisect_left, bisect_right
+
+def calHV(ObjV, refPoint, method = None, sampleNum = None, errBound = None):
+
+    """
+calHV : function - 超体积的计算
+
+语法:
+    hv = calHV(ObjV, refPoint)
+    hv = calHV(ObjV, refPoint, method)
+    hv = calHV(ObjV, refPoint, method, sampleNum, errBound)
+
+描述:
+    根据method选择超体积的计算方法：
+    'exact' : 精确计算，目标维数为2、3时采用扫描法（hv2D、hv3D），大于等于4时采用WFG算法（hvWFG）；
+    'mc'    : 采用蒙特卡洛法估计（hvMC），sampleNum与errBound的含义见hvMC；
+    None    : （默认）目标维数小于等于3时精确计算；大于等于4时，若点数N与目标维数M满足N * 3^(M-4) <= 1000则精确计算，
+              否则用蒙特卡洛法估计。这是因为WFG算法的耗时随点数和目标维数增长很快，而蒙特卡洛法的耗时基本只与采样点数有关。
+
+输入参数:
+    ObjV      : array - 目标函数值矩阵，每一行对应一个点。
+
+    refPoint  : array - 参考点，长度等于目标维数。
+
+    method    : str   - (可选参数)计算方法，'exact'、'mc'或None。
+
+    sampleNum : int   - (可选参数)蒙特卡洛法的最大采样点数。
+
+    errBound  : float - (可选参数)蒙特卡洛法的误差限。
+
+输出参数:
+    hv        : float - 超体积。
+
+"""
+
+    points, refPoint = _prepare(ObjV, refPoint)
+    if points.shape[0] == 0:
+        return 0.0
+    M = points.shape[1]
+    if method is None:
+        method = 'exact' if M <= 3 or points.shape[0] * 3 ** (M - 4) <= 1000 else 'mc'
+    if method == 'exact':
+        if M == 1:
+            return float(refPoint[0] - np.min(points))
+        if M == 2:
+            return _hv2D(points, refPoint)
+        if M == 3:
+            return _hv3D(points, refPoint)
+        return _wfg(_nds(points), refPoint)
+    elif method == 'mc':
+        return _mc(points, refPoint, sampleNum, errBound)[0]
+    raise RuntimeError('error in calHV: No such method: ' + str(method) + '. (没有名为' + str(method) + '的超体积计算方法。)')
+
+def hv2D(ObjV, refPoint):
+
+    """
+hv2D : function - 双目标超体积的精确计算
+
+描述:
+    先按第一个目标排序，则每个点只贡献第二个目标值比它前面的点都小的部分，时间复杂度为O(N log N)。
+
+"""
+
+    points, refPoint = _prepare(ObjV, refPoint, 2)
+    return _hv2D(points, refPoint) if points.shape[0] > 0 else 0.0
+
+def hv3D(ObjV, refPoint):
+
+    """
+hv3D : function - 三目标超体积的精确计算
+
+描述:
+    沿第三个目标从小到大扫描（文献[1]），维护已扫描的点在前两个目标上的“阶梯”及其支配的面积，
+    每插入一个点只需在阶梯上二分查找并删除被它支配的点，同时增量地更新面积，
+    超体积等于各段面积与第三个目标上的间隔的乘积之和。
+
+参考文献:
+    [1] Fonseca C M, Paquete L, Lopez-Ibanez M. An Improved Dimension-Sweep
+    Algorithm for the Hypervolume Indicator[J]. Evolutionary Computation. cec.
+    ieee Congress on, 2006:1157 - 1163.
+
+"""
+
+    points, refPoint = _prepare(ObjV, refPoint, 3)
+    return _hv3D(points, refPoint) if points.shape[0] > 0 else 0.0
+
+def hvWFG(ObjV, refPoint):
+
+    """
+hvWFG : function - 基于WFG算法的超体积精确计算
+
+描述:
+    WFG算法（文献[1]）把超体积分解为各点的独占超体积之和：
+    把点按最后一个目标从大到小排序，第k个点的独占超体积等于它自身支配的体积减去
+    后面各点被它“限制”（逐维取与它的较大值）后所支配的体积。
+    由于后面各点最后一个目标值都不大于第k个点的，限制后的点在最后一个目标上都相同，
+    因此只需在少一维的空间中递归计算，递归到三维时改用hv3D。
+    每次递归前都会删去被支配的点，这使得实际需要计算的点数通常远少于原点数。
+
+参考文献:
+    [1] While L, Bradstreet L, Barone L. A Fast Way of Calculating Exact
+    Hypervolumes[J]. IEEE Transactions on Evolutionary Computation, 2012, 16(1):86-95.
+
+"""
+
+    points, refPoint = _prepare(ObjV, refPoint)
+    if points.shape[0] == 0:
+        return 0.0
+    if points.shape[1] == 1:
+        return float(refPoint[0] - np.min(points))
+    return _wfg(_nds(points), refPoint)
+
+def hvMC(ObjV, refPoint, sampleNum = None, errBound = None):
+
+    """
+hvMC : function - 基于蒙特卡洛法的超体积估计
+
+语法:
+    [hv, err] = hvMC(ObjV, refPoint)
+    [hv, err] = hvMC(ObjV, refPoint, sampleNum, errBound)
+
+描述:
+    在以各点各维的最小值和参考点为对角的盒子里均匀随机撒点，用被支配的采样点所占的比例估计超体积。
+    采样分批进行，每批之后计算估计值的95%置信区间的半宽err，
+    当err不超过errBound或采样点数达到sampleNum时停止。
+
+输入参数:
+    sampleNum : int   - (可选参数)最大采样点数，缺省或为None时为1000000。
+
+    errBound  : float - (可选参数)允许的误差（95%置信区间的半宽，与超体积同单位），缺省或为None时采满sampleNum个点。
+
+输出参数:
+    hv        : float - 超体积的估计值。
+
+    err       : float - 估计值的95%置信区间的半宽。
+
+"""
+
+    points, refPoint = _prepare(ObjV, refPoint)
+    if points.shape[0] == 0:
+        return [0.0, 0.0]
+    return _mc(points, refPoint, sampleNum, errBound)
+
+def _prepare(ObjV, refPoint, M = None):
+    # 检查输入并删去超出参考点的点
+    points = np.atleast_2d(np.asarray(ObjV, dtype = float))
+    refPoint = np.asarray(refPoint, dtype = float).reshape(-1)
+    if points.shape[1] != len(refPoint) or (M is not None and len(refPoint) != M):
+        raise RuntimeError('error in hypervolume: The dimension of refPoint disagrees with ObjV. (参考点的维数与目标维数不一致。)')
+    return points[np.all(points < refPoint, 1)], refPoint
+
+def _nds(points):
+    # 删去重复的点以及被支配的点（最小化）
+    points = np.unique(points, axis = 0)
+    n = points.shape[0]
+    if n <= 1:
+        return points
+    keep = np.ones(n, dtype = bool)
+    step = max(1, 4000000 // (n * points.shape[1])) # 分块比较，控制内存占用
+    for start in range(0, n, step):
+        x = points[start : start + step, None, :]
+        # np.unique后不存在相同的点，因此各维都不大于即为支配
+        keep[start : start + step] = np.sum(np.all(points <= x, 2), 1) == 1
+    return points[keep]
+
+def _hv2D(points, refPoint):
+    points = points[np.argsort(points[:, 0], kind = 'mergesort')]
+    best = np.minimum.accumulate(points[:, 1]) # 按第一维排序后，每个点只贡献第二维比前面所有点都小的部分
+    widths = np.diff(np.hstack([points[:, 0], refPoint[0]]))
+    return float(np.sum(widths * (refPoint[1] - best)))
+
+def _hv3D(points, refPoint):
+    points = points[np.argsort(points[:, 2], kind = 'mergesort')]
+    rx, ry, rz = refPoint.tolist()
+    xs = [] # 阶梯上各点的第一个目标值，升序
+    ys = [] # 阶梯上各点的第二个目标值，降序
+    area = 0.0 # 阶梯支配的面积
+    volume = 0.0
+    zs = points[:, 2].tolist() + [rz]
+    for i, (x, y) in enumerate(points[:, :2].tolist()):
+        j = bisect_right(xs, x)
+        if j == 0 or ys[j - 1] > y: # 当前点不被阶梯支配
+            start = bisect_left(xs, x)
+            top = ys[start - 1] if start > 0 else ry # 当前点左侧的阶梯高度
+            end = start
+            while end < len(xs) and ys[end] >= y: # 被当前点支配的阶梯点
+                end += 1
+            # 增加的面积：从x到第一个被删除的点（或下一个保留的点）之间高为top - y的部分，以及各被删除点下方的部分
+            nextX = xs[start] if start < len(xs) else rx
+            area += (nextX - x) * (top - y)
+            for k in range(start, end):
+                area += ((xs[k + 1] if k + 1 < len(xs) else rx) - xs[k]) * (ys[k] - y)
+            xs[start : end] = [x]
+            ys[start : end] = [y]
+        volume += area * (zs[i + 1] - zs[i])
+    return volume
+
+def _wfg(points, refPoint):
+    # points中的点互不支配且都不超出参考点
+    n, M = points.shape
+    if n == 1:
+        return float(np.prod(refPoint - points[0]))
+    if M == 2:
+        return _hv2D(points, refPoint)
+    if M == 3:
+        return _hv3D(points, refPoint)
+    points = points[np.argsort(-points[:, -1], kind = 'mergesort')] # 按最后一个目标从大到小排序
+    front = points[:, :-1]
+    subRef = refPoint[:-1]
+    volume = 0.0
+    for k in range(n):
+        p = front[k]
+        exclusive = np.prod(subRef - p)
+        if k + 1 < n:
+            limited = np.maximum(front[k + 1:], p) # 后面各点被当前点限制后的点
+            limited = limited[np.all(limited < subRef, 1)]
+            if limited.shape[0] > 0:
+                exclusive -= _wfg(_nds(limited), subRef)
+        volume += exclusive * (refPoint[-1] - points[k, -1])
+    return float(volume)
+
+def _mc(points, refPoint, sampleNum, errBound):
+    sampleNum = 1000000 if sampleNum is None else int(sampleNum)
+    points = _nds(points)
+    n, M = points.shape
+    low = np.min(points, 0)
+    boxVolume = float(np.prod(refPoint - low))
+    points = points[np.argsort(-np.prod(refPoint - points, 1))] # 支配体积大的点先参与判断，可以更早地排除被支配的采样点
+    chunk = min(sampleNum, 100000) # 每批的采样点数
+    dominated = 0
+    sampled = 0
+    err = np.inf
+    while sampled < sampleNum:
+        size = min(chunk, sampleNum - sampled)
+        remain = (low + rng.rand(size, M) * (refPoint - low)).T.copy() # 按维存放，每一维的数据在内存中连续
+        for p in points: # 逐个点排除被它支配的采样点，剩下的采样点越来越少
+            flag = remain[0] < p[0]
+            for j in range(1, M):
+                flag |= remain[j] < p[j]
+            remain = remain[:, flag]
+            if remain.shape[1] == 0:
+                break
+        dominated += size - remain.shape[1]
+        sampled += size
+        ratio = dominated / sampled
+        err = 1.96 * boxVolume * np.sqrt(ratio * (1 - ratio) / sampled)
+        if errBound is not None and sampled >= 1000 and err <= errBound: # 采样点太少时方差的估计不可靠
+            break
+    return [boxVolume * dominated / sampled, float(err)]
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from bisect import bisect_left, bisect_right
+import geatpy as ea
+
+def ndsortSweep(ObjV, needNum = None, needLevel = None, CV = None):
+
+    """
+ndsortSweep : function - 基于扫描法的快速非支配层级划分
+
+描述:
+    该函数的用法及返回值与ndsortESS相同，可直接赋给多目标算法模板的ndSort属性。
+    对于双目标问题，先按字典序排序，再依次把每个个体放入第一个不支配它的层中，
+    由于各层最后放入的个体的第二个目标值随层数单调不减，可以用二分查找确定所在的层，时间复杂度为O(N log N)；
+    对于三目标问题，同样按字典序扫描，并用二分查找确定所在的层，
+    判断某一层是否支配当前个体时只需在该层在后两个目标上的“阶梯”中进行一次二分查找。
+    目标数为其他值时调用ndsortESS。
+    传入了CV时，可行个体支配所有不可行个体，不可行个体之间按违反约束程度之和从小到大分层。
+
+语法:
+    [levels, criLevel] = ndsortSweep(ObjV)
+    [levels, criLevel] = ndsortSweep(ObjV, needNum)
+    [levels, criLevel] = ndsortSweep(ObjV, needNum, needLevel)
+    [levels, criLevel] = ndsortSweep(ObjV, needNum, needLevel, CV)
+
+输入参数:
+    ObjV      : array - 种群个体的目标函数矩阵（遵循“最小化目标”的约定）。
+
+    needNum   : int   - (可选参数)表示需要对多少个个体进行分级，若缺省或为None，则默认为种群规模。
+
+    needLevel : int   - (可选参数)表示需要划分到多少层，缺省或为None时默认是等于种群规模。
+
+    CV        : array - (可选参数)种群个体违反约束程度矩阵，当缺省或为None时，默认种群所有个体都是可行的。
+
+输出参数:
+    levels    : array - Numpy array类型行向量，代表种群个体的非支配排序分级，未被分级的个体的levels值为Inf。
+
+    criLevel  : int   - 临界层所在的层数（层数从1开始数）。
+
+"""
+
+    Nind, M = ObjV.shape
+    if M != 2 and M != 3:
+        return ea.ndsortESS(ObjV, needNum, needLevel, CV)
+    needNum = Nind if needNum is None else needNum
+    needLevel = Nind if needLevel is None else needLevel
+    levels = np.full(Nind, np.inf)
+    vio = np.zeros(Nind) if CV is None else np.sum(np.maximum(CV, 0), 1)
+    feasible = np.where(vio == 0)[0]
+    infeasible = np.where(vio > 0)[0]
+    maxLevel = 0
+    if len(feasible) > 0:
+        levels[feasible] = _sweep(ObjV[feasible])
+        maxLevel = np.max(levels[feasible])
+    if len(infeasible) > 0: # 不可行个体排在所有可行个体之后，违反约束程度相同的个体处于同一层
+        levels[infeasible] = maxLevel + 1 + np.unique(vio[infeasible], return_inverse = True)[1].reshape(-1)
+    # 只保留能使已分级个体数达到needNum的最前面若干层
+    if Nind == 0:
+        return [levels, 0]
+    counts = np.cumsum(np.bincount(levels.astype(int)))
+    criLevel = min(int(np.searchsorted(counts, min(needNum, Nind))), int(needLevel), int(levels.max()))
+    levels[levels > criLevel] = np.inf
+    return [levels, criLevel]
+
+def _sweep(ObjV):
+    # 对可行个体进行非支配分层，相同的目标函数值只参与一次扫描
+    uniq, inverse = np.unique(ObjV, axis = 0, return_inverse = True) # uniq已按字典序排列
+    inverse = inverse.reshape(-1)
+    if uniq.shape[1] == 2:
+        ranks = _sweep2D(uniq)
+    else:
+        ranks = _sweep3D(uniq)
+    return ranks[inverse]
+
+def _sweep2D(points):
+    # points按字典序排列且互不相同，此时前面的点q支配当前点p当且仅当q的第二个目标值不大于p的
+    tails = [] # 每一层最后放入的点的第二个目标值（即该层目前的最小值），随层数单调不减
+    ranks = np.empty(points.shape[0])
+    for i, f2 in enumerate(points[:, 1].tolist()):
+        k = bisect_right(tails, f2) # 第一个不支配p的层
+        if k == len(tails):
+            tails.append(f2)
+        else:
+            tails[k] = f2
+        ranks[i] = k + 1
+    return ranks
+
+def _sweep3D(points):
+    # 每一层维护其成员在后两个目标上的阶梯（只保留在后两个目标上互不支配的点，按第二个目标升序、第三个目标降序排列）
+    stairs2 = [] # stairs2[k]为第k层阶梯上各点的第二个目标值
+    stairs3 = [] # stairs3[k]为第k层阶梯上各点的第三个目标值
+    ranks = np.empty(points.shape[0])
+    for i, (f2, f3) in enumerate(points[:, 1:].tolist()):
+        # 若某点被第k层支配，则它也被第k层之前的每一层支配，因此可以二分查找第一个不支配它的层
+        low, high = 0, len(stairs2)
+        while low < high:
+            mid = (low + high) // 2
+            j = bisect_right(stairs2[mid], f2) - 1 # 第二个目标值不大于f2的点中，第三个目标值最小的点
+            if j >= 0 and stairs3[mid][j] <= f3:
+                low = mid + 1
+            else:
+                high = mid
+        if low == len(stairs2):
+            stairs2.append([f2])
+            stairs3.append([f3])
+        else:
+            s2, s3 = stairs2[low], stairs3[low]
+            j = bisect_left(s2, f2)
+            # 删除阶梯上被当前点在后两个目标上支配的点（它们的第二个目标值不小于f2，且第三个目标值不小于f3）
+            end = j
+            while end < len(s2) and s3[end] >= f3:
+                end += 1
+            s2[j : end] = [f2]
+            s3[j : end] = [f3]
+        ranks[i] = low + 1
+    return ranks
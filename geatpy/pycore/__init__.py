@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+pycore  -  the pure-Numpy implementation of the core of geatpy
+
+当找不到与当前平台及Python版本匹配的编译版内核（geatpy/core/）时，geatpy会改为导入本包。
+本包中的函数与编译版内核同名，参数及返回值的约定也与之保持一致，
+但随机数的使用方式不同，因此在相同的随机种子下两者的结果不会完全相同。
+
+"""
+
+import sys
+from importlib import import_module
+
+# 各函数所在的模块，函数在第一次被访问时才导入其所在的模块（详见__getattr__）
+# 这些模块按包内模块（geatpy.pycore.xxx）导入，因此不会被工作目录中同名的selection.py、plot.py等文件遮蔽
+_modules = {'crt' : ['crtfld', 'crtpc', 'crtip', 'crtrp', 'crtpp', 'crtup', 'meshrng'],
+            'decode' : ['bs2int', 'bs2real', 'bs2ri'],
+            'fitness' : ['ranking', 'scaling', 'powing', 'indexing', 'awGA', 'rwGA'],
+            'selection' : ['selecting', 'dup', 'ecs', 'etour', 'otos', 'rcs', 'rps', 'rws', 'sus', 'tour', 'urs'],
+            'recombination' : ['recombin', 'xovmp', 'xovdp', 'xovsp', 'xovsh', 'xovud', 'xovbd', 'xovexp', 'xovsec',
+                               'recdis', 'recint', 'reclin', 'recndx', 'recsbx', 'xovox', 'xovpmx'],
+            'mutation' : ['mutate', 'boundfix', 'mutbin', 'mutbga', 'mutde', 'mutgau', 'mutuni', 'mutpolyn',
+                          'mutinv', 'mutswap', 'mutmove', 'mutpp'],
+            'ndsort' : ['ndsortESS', 'ndsortDED', 'crowdis', 'refselect', 'refgselect'],
+            'plot' : ['moeaplot', 'soeaplot', 'varplot', 'trcplot']}
+_index = {name : module for module, names in _modules.items() for name in names}
+
+__all__ = ['crtfld', 'crtpc', 'crtip', 'crtrp', 'crtpp', 'crtup', 'meshrng',
+           'bs2int', 'bs2real', 'bs2ri',
+           'ranking', 'scaling', 'powing', 'indexing', 'awGA', 'rwGA',
+           'selecting', 'dup', 'ecs', 'etour', 'otos', 'rcs', 'rps', 'rws', 'sus', 'tour', 'urs',
+           'recombin', 'xovmp', 'xovdp', 'xovsp', 'xovsh', 'xovud', 'xovbd', 'xovexp', 'xovsec',
+           'recdis', 'recint', 'reclin', 'recndx', 'recsbx', 'xovox', 'xovpmx',
+           'mutate', 'boundfix', 'mutbin', 'mutbga', 'mutde', 'mutgau', 'mutuni', 'mutpolyn',
+           'mutinv', 'mutswap', 'mutmove', 'mutpp',
+           'ndsortESS', 'ndsortDED', 'crowdis', 'refselect', 'refgselect',
+           'moeaplot', 'soeaplot', 'varplot', 'trcplot',
+           'indicator']
+
+def __getattr__(name):
+    if name == 'indicator':
+        value = import_module('.indicator', __name__)
+    elif name in _index:
+        value = getattr(import_module('.' + _index[name], __name__), name)
+    else:
+        raise AttributeError("module 'pycore' has no attribute '" + name + "'")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+if sys.version_info < (3, 7):
+    # Python 3.7之前模块不支持__getattr__（PEP 562），因此在导入本包时就导入所有的函数
+    for name in __all__:
+        __getattr__(name)
+    del name
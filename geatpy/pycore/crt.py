@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+crt.py - 纯Numpy实现的译码矩阵、种群染色体矩阵以及参考点的创建函数
+
+包含: crtfld, crtpc, crtip, crtrp, crtpp, crtup, meshrng
+
+"""
+
+import numpy as np
+from geatpy import rng
+from itertools import combinations, product
+
+def crtfld(Encoding, varTypes, ranges, borders = None, precisions = None, codes = None, scales = None):
+
+    """
+crtfld : function - 译码矩阵生成函数
+
+语法:
+    当Encoding为'RI'或'P'时：
+    FieldDR = crtfld(Encoding, varTypes, ranges, borders)
+    FieldDR = crtfld(Encoding, varTypes, ranges, borders, contraction)
+    当Encoding为'BG'时：
+    FieldD = crtfld(Encoding, varTypes, ranges, borders, precisions)
+    FieldD = crtfld(Encoding, varTypes, ranges, borders, precisions, codes)
+    FieldD = crtfld(Encoding, varTypes, ranges, borders, precisions, codes, scales)
+
+描述:
+    离散变量的范围会往里取整，不包含的边界会往里收缩一个单位；
+    'RI'编码下不包含的连续变量边界会往里收缩0.1^contraction（contraction默认为4）；
+    'BG'编码下连续变量的编码长度由精度precisions（默认为4）决定，
+    而是否包含边界则记录在FieldD的lbin和ubin两行中，由bs2ri在解码时处理。
+    FieldD的结构为[lens; lb; ub; codes; scales; lbin; ubin; varTypes]，
+    FieldDR的结构为[lb; ub; varTypes]（详见Geatpy数据结构）。
+
+"""
+
+    varTypes = np.array(varTypes, dtype = int).reshape(-1)
+    ranges = np.array(ranges, dtype = float)
+    Nvar = ranges.shape[1]
+    if varTypes.shape[0] != Nvar:
+        raise RuntimeError('error in crtfld: The length of varTypes must equal the number of columns of ranges. (varTypes的长度必须等于ranges的列数。)')
+    if np.any(ranges[0] > ranges[1]):
+        raise RuntimeError('error in crtfld: The upper bound must be greater than the lower bound. (ranges中的上界必须大于下界。)')
+    borders = np.ones((2, Nvar), dtype = int) if borders is None else np.array(borders, dtype = int)
+    lb, ub = ranges[0].copy(), ranges[1].copy()
+    lbin, ubin = borders[0].copy(), borders[1].copy()
+    if Encoding == 'P':
+        varTypes[:] = 1
+    # 离散变量的范围往里取整
+    discrete = varTypes == 1
+    lb[discrete] = np.where(lbin[discrete] == 1, np.ceil(lb[discrete]), np.floor(lb[discrete]) + 1)
+    ub[discrete] = np.where(ubin[discrete] == 1, np.floor(ub[discrete]), np.ceil(ub[discrete]) - 1)
+    lbin[discrete] = 1
+    ubin[discrete] = 1
+    if np.any(lb > ub):
+        raise RuntimeError('error in crtfld: There is no integer in the range of some discrete variables. (某些离散变量的范围内不存在整数。)')
+    if Encoding == 'RI' or Encoding == 'P':
+        contraction = np.full(Nvar, 4.0) if precisions is None else np.array(precisions, dtype = float).reshape(-1)
+        if Encoding == 'RI':
+            shrink = 0.1 ** contraction
+            lb = np.where(lbin == 0, lb + shrink, lb)
+            ub = np.where(ubin == 0, ub - shrink, ub)
+        return np.vstack([lb, ub, varTypes]).astype(float)
+    elif Encoding == 'BG':
+        precisions = np.full(Nvar, 4) if precisions is None else np.array(precisions, dtype = float).reshape(-1)
+        codes = np.zeros(Nvar) if codes is None else np.array(codes, dtype = float).reshape(-1)
+        scales = np.zeros(Nvar) if scales is None else np.array(scales, dtype = float).reshape(-1)
+        scales[discrete] = 0
+        if np.any((scales == 1) & (lb * ub <= 0)):
+            raise RuntimeError('error in crtfld: The range of a variable in logarithmic scale cannot contain 0. (采用对数刻度的变量的范围不能包含0。)')
+        # 离散变量的编码长度只需能表示范围内的所有整数，连续变量的编码长度由精度决定
+        levels = np.where(discrete, ub - lb, (ub - lb) * 10.0 ** precisions)
+        lens = np.maximum(np.ceil(np.log2(levels + 1)), 1)
+        return np.vstack([lens, lb, ub, codes, scales, lbin, ubin, varTypes]).astype(float)
+    else:
+        raise RuntimeError('error in crtfld: Encoding must be ''BG'', ''RI'' or ''P''. (编码方式必须为''BG''、''RI''或''P''。)')
+
+def crtpc(Encoding, Nind, Field):
+
+    """
+crtpc : function - (Create Population's Chromosomes)创建一个种群染色体矩阵
+
+语法:
+    Chrom = crtpc(Encoding, Nind, Field)
+
+描述:
+    'BG'编码时生成元素为0或1的矩阵；'RI'编码时连续变量取[lb, ub)内的均匀随机实数，
+    离散变量取[lb, ub]内的随机整数；'P'编码时生成排列编码的染色体矩阵（详见crtpp）。
+
+"""
+
+    if Encoding == 'BG':
+        return rng.randint(0, 2, (Nind, int(np.sum(Field[0]))))
+    elif Encoding == 'RI':
+        Chrom = crtrp(Nind, Field)
+        discrete = np.where(Field[2] == 1)[0]
+        if len(discrete) > 0:
+            Chrom[:, discrete] = crtip(Nind, Field[:, discrete])
+        return Chrom
+    elif Encoding == 'P':
+        return crtpp(Nind, Field)
+    else:
+        raise RuntimeError('error in crtpc: Encoding must be ''BG'', ''RI'' or ''P''. (编码方式必须为''BG''、''RI''或''P''。)')
+
+def crtip(Nind, FieldDR):
+
+    """
+crtip : function - (Create Integer Points)创建一个整数值种群染色体矩阵
+
+语法:
+    Chrom = crtip(Nind, FieldDR)
+
+描述:
+    每个元素都是FieldDR所规定的[lb, ub]范围内的随机整数。
+
+"""
+
+    lb = np.ceil(FieldDR[0])
+    ub = np.floor(FieldDR[1])
+    return np.floor(lb + rng.rand(Nind, FieldDR.shape[1]) * (ub - lb + 1)).astype(int)
+
+def crtrp(Nind, FieldDR):
+
+    """
+crtrp : function - (Create Real-number Points)创建一个实数值种群染色体矩阵
+
+语法:
+    Chrom = crtrp(Nind, FieldDR)
+
+描述:
+    每个元素都是FieldDR所规定的[lb, ub)范围内服从均匀分布的随机实数。
+
+"""
+
+    return FieldDR[0] + rng.rand(Nind, FieldDR.shape[1]) * (FieldDR[1] - FieldDR[0])
+
+def crtpp(Nind, FieldDR):
+
+    """
+crtpp : function - (Create Permutation Points)创建一个排列编码种群染色体矩阵
+
+语法:
+    Chrom = crtpp(Nind, FieldDR)
+
+描述:
+    FieldDR的第一行元素全为Lb，第二行元素全为Ub，若记其列数为Lind，
+    则每条染色体都是从{Lb, Lb+1, ..., Ub}中挑选出的Lind个互异的数组成的排列。
+
+"""
+
+    Lind = FieldDR.shape[1]
+    Lb = int(FieldDR[0, 0])
+    Ub = int(FieldDR[1, 0])
+    if Ub - Lb + 1 < Lind:
+        raise RuntimeError('error in crtpp: Ub - Lb + 1 must not be less than Lind. (Ub - Lb + 1必须不小于染色体长度。)')
+    # 对每行随机数排序得到的下标即为一个随机排列，取其前Lind个
+    return np.argsort(rng.rand(Nind, Ub - Lb + 1), 1)[:, :Lind] + Lb
+
+def crtup(Dim, NUM):
+
+    """
+crtup : function -(Create Uniform Points)创建在单位超平面内均匀分布的点集
+
+语法:
+    [Point, Sizes] = crtup(Dim, NUM)
+
+描述:
+    采用Das和Dennis的方法，取使点数不超过NUM的最大划分数H，生成单位超平面上的全部格点，
+    所得点集的大小有可能会小于NUM。
+
+"""
+
+    if Dim == 1:
+        return [np.ones((1, 1)), 1]
+    H = 1
+    while _ncr(H + Dim, Dim - 1) <= NUM:
+        H += 1
+    # 在H + Dim - 1个位置中选Dim - 1个隔板，相邻隔板之间的空位数即为各维度上的份数
+    bars = np.array(list(combinations(range(H + Dim - 1), Dim - 1))) - np.arange(Dim - 1)
+    Point = np.diff(np.hstack([np.zeros((bars.shape[0], 1)), bars, np.full((bars.shape[0], 1), H)]), axis = 1) / H
+    return [Point, Point.shape[0]]
+
+def _ncr(n, r):
+    # 计算组合数C(n, r)
+    result = 1
+    for i in range(r):
+        result = result * (n - i) // (i + 1)
+    return result
+
+def meshrng(ranges, gridnum = None):
+
+    """
+meshrng : function - 网格化决策变量范围
+
+语法:
+    newRanges = meshrng(ranges)
+    newRanges = meshrng(ranges, gridnum)
+
+描述:
+    把每个决策变量的范围等长地均分成gridnum份（默认为2），
+    再排列所有情况得到各网格对应的决策变量范围，返回由这些范围矩阵组成的列表。
+
+"""
+
+    if gridnum is None:
+        gridnum = 2
+    ranges = np.array(ranges, dtype = float)
+    cuts = np.linspace(ranges[0], ranges[1], gridnum + 1) # 每一列是一个变量的gridnum+1个分割点
+    newRanges = []
+    for cell in product(range(gridnum), repeat = ranges.shape[1]):
+        cell = np.array(cell)
+        cols = np.arange(ranges.shape[1])
+        newRanges.append(np.vstack([cuts[cell, cols], cuts[cell + 1, cols]]))
+    return newRanges
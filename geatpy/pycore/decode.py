@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+decode.py - 纯Numpy实现的二进制/格雷编码染色体解码函数
+
+包含: bs2int, bs2real, bs2ri
+
+"""
+
+import numpy as np
+
+def _bs2num(Chrom, FieldD):
+    # 把染色体中每个变量对应的二进制/格雷码子串转换为非负整数，返回整数矩阵及各子串所能表示的最大整数
+    lens = FieldD[0].astype(int)
+    starts = np.hstack([0, np.cumsum(lens)[:-1]])
+    Num = np.empty((Chrom.shape[0], len(lens)))
+    for i in range(len(lens)):
+        bits = Chrom[:, starts[i] : starts[i] + lens[i]]
+        if FieldD[3, i] == 1: # 格雷码转二进制码：第k位二进制码等于前k位格雷码的异或
+            bits = np.cumsum(bits, 1) % 2
+        Num[:, i] = bits.dot(2.0 ** np.arange(lens[i] - 1, -1, -1))
+    return Num, 2.0 ** lens - 1
+
+def _num2int(Num, Max, FieldD):
+    # 把子串所表示的整数在[0, Max]上均匀地映射到[lb, ub]并取整
+    return np.round(FieldD[1] + Num / Max * (FieldD[2] - FieldD[1]))
+
+def _num2real(Num, Max, FieldD):
+    # 把子串所表示的整数均匀地映射到[lb, ub]，不包含的边界不会被取到，scales为1的变量采用对数刻度
+    lb, ub, scales, lbin, ubin = FieldD[1], FieldD[2], FieldD[4], FieldD[5], FieldD[6]
+    # 按是否包含边界确定映射时的偏移和分母
+    Num = Num + (lbin == 0)
+    Max = Max + (lbin == 0) + (ubin == 0)
+    logScale = scales == 1
+    sign = np.where(logScale, np.sign(lb), 1)
+    low = np.where(logScale, np.log2(np.abs(np.where(logScale, lb, 1))), lb)
+    high = np.where(logScale, np.log2(np.abs(np.where(logScale, ub, 1))), ub)
+    Phen = low + Num / Max * (high - low)
+    return np.where(logScale, sign * 2 ** Phen, Phen)
+
+def bs2int(Chrom, FieldD):
+
+    """
+bs2int : function - 二进制/格雷编码矩阵到整数值矩阵的转换
+
+语法:
+    Phen = bs2int(Chrom, FieldD)
+
+描述:
+    每个子串所表示的整数在[0, 2^lens - 1]上均匀地映射到[lb, ub]，再四舍五入为整数，
+    因此解码结果一定落在FieldD所规定的范围之内。
+
+"""
+
+    Num, Max = _bs2num(Chrom, FieldD)
+    return _num2int(Num, Max, FieldD)
+
+def bs2real(Chrom, FieldD):
+
+    """
+bs2real : function - 二进制/格雷编码矩阵到实数值矩阵的转换
+
+语法:
+    Phen = bs2real(Chrom, FieldD)
+
+描述:
+    每个子串所表示的整数均匀地映射到[lb, ub]，不包含的边界（lbin或ubin为0）不会被取到；
+    scales为1的变量在对数刻度下进行映射。
+
+"""
+
+    Num, Max = _bs2num(Chrom, FieldD)
+    return _num2real(Num, Max, FieldD)
+
+def bs2ri(Chrom, FieldD):
+
+    """
+bs2ri : function - 二进制/格雷编码的矩阵到实整数值编码矩阵（包含实数和整数）的转换
+
+语法:
+    Phen = bs2ri(Chrom, FieldD)
+
+描述:
+    varTypes为0的变量按bs2real解码，varTypes为1的变量按bs2int解码。
+
+"""
+
+    Num, Max = _bs2num(Chrom, FieldD)
+    return np.where(FieldD[7] == 1, _num2int(Num, Max, FieldD), _num2real(Num, Max, FieldD))
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+fitness.py - 纯Numpy实现的适应度计算及多目标聚合函数
+
+包含: ranking, scaling, powing, indexing, awGA, rwGA
+
+这些函数都遵循“目标函数值越大适应度越小”以及“最小适应度为0”的约定。
+传入了CV时，不可行个体（CV存在大于0的元素）的适应度总是小于所有可行个体，
+且违反约束程度越大的不可行个体的适应度越小。
+
+"""
+
+import numpy as np
+from geatpy import rng
+
+def _violation(CV):
+    # 计算每个个体的违反约束程度之和，CV为None时返回None
+    if CV is None:
+        return None
+    return np.sum(np.maximum(CV, 0), 1)
+
+def _penalize(values, CV):
+    """
+    描述: 根据CV修正一维数组values（越小越好），使不可行个体的值大于所有可行个体，
+         并按违反约束程度之和从小到大排在可行个体之后。
+    """
+
+    vio = _violation(CV)
+    if vio is None or np.all(vio == 0):
+        return values
+    feasible = vio == 0
+    if not np.any(feasible): # 没有可行个体时只按违反约束程度比较
+        return vio
+    values = values.astype(float)
+    low, high = np.min(values[feasible]), np.max(values[feasible])
+    span = high - low if high > low else 1.0
+    values[~feasible] = high + span * (1 + vio[~feasible] / np.max(vio))
+    return values
+
+def _column(values):
+    # 把一维数组转化为列向量
+    return values.reshape(-1, 1)
+
+def ranking(ObjV, CV = None, RM = None, SP = None, Mask = None):
+
+    """
+ranking : function - 根据目标函数值排序的适应度分配
+
+语法:
+    FitnV = ranking(ObjV)
+    FitnV = ranking(ObjV, CV)
+    FitnV = ranking(ObjV, CV, RM)
+    FitnV = ranking(ObjV, CV, RM, SP)
+    FitnV = ranking(ObjV, CV, RM, SP, Mask)
+
+描述:
+    按ObjV从小到大排序后赋予适应度，RM为0（默认）时采用线性排序，为1时采用非线性排序，
+    SP为选择压差（默认为2）；给定Mask时，排序后的个体依次被赋予Mask中从大到小的值。
+    目标函数值相等的个体得到相等的适应度（取它们按位置得到的适应度的平均值）。
+
+"""
+
+    key = _penalize(ObjV[:, 0], CV)
+    Nind = len(key)
+    RM = 0 if RM is None else RM
+    SP = 2 if SP is None else SP
+    if Mask is not None:
+        posFitnV = np.array(Mask, dtype = float).reshape(-1)[::-1]
+    elif Nind == 1:
+        posFitnV = np.ones(1)
+    elif RM == 0:
+        posFitnV = 2 - SP + 2 * (SP - 1) * np.arange(Nind - 1, -1, -1) / (Nind - 1)
+    elif RM == 1:
+        # 非线性排序: 求解多项式(SP - Nind) * X^(Nind - 1) + SP * X^(Nind - 2) + ... + SP = 0的实根
+        roots = np.roots(np.hstack([SP - Nind, np.full(Nind - 1, SP)]))
+        X = np.max(np.real(roots[np.abs(np.imag(roots)) < 1e-8]))
+        powers = X ** np.arange(Nind - 1, -1, -1)
+        posFitnV = Nind * powers / np.sum(powers)
+    else:
+        raise RuntimeError('error in ranking: RM must be 0 or 1. (RM必须为0或1。)')
+    order = np.argsort(key, kind = 'mergesort')
+    FitnV = np.empty(Nind)
+    FitnV[order] = posFitnV
+    # 目标函数值相等的个体取平均适应度
+    uniq, inverse = np.unique(key, return_inverse = True)
+    if len(uniq) < Nind:
+        FitnV = (np.bincount(inverse, FitnV) / np.bincount(inverse))[inverse]
+    return _column(FitnV)
+
+def scaling(ObjV, CV = None, Smul = None):
+
+    """
+scaling : function - 线性尺度变换适应度计算
+
+语法:
+    FitnV = scaling(ObjV)
+    FitnV = scaling(ObjV, CV)
+    FitnV = scaling(ObjV, CV, Smul)
+
+描述:
+    先令F = max(ObjV) - ObjV，再对F作线性变换F' = aF + b，使F'的平均值等于F的平均值，
+    且F'的最大值等于平均值的Smul倍（Smul默认为2；若此时最小值会小于0，则改为令最小值为0），
+    最后把F'平移使其最小值为0。当所有个体的目标函数值相等时，适应度均为1。
+
+"""
+
+    key = _penalize(ObjV[:, 0], CV)
+    Smul = 2 if Smul is None or np.isnan(Smul) else Smul
+    F = np.max(key) - key
+    Favg, Fmax, Fmin = np.mean(F), np.max(F), np.min(F)
+    if Fmax == Fmin:
+        return np.ones((len(key), 1))
+    if Smul > 1 and Fmin > (Smul * Favg - Fmax) / (Smul - 1): # 此时变换后的最小值不会小于0
+        a = (Smul - 1) * Favg / (Fmax - Favg)
+        b = Favg * (Fmax - Smul * Favg) / (Fmax - Favg)
+    else:
+        a = Favg / (Favg - Fmin)
+        b = -Fmin * Favg / (Favg - Fmin)
+    FitnV = a * F + b
+    return _column(FitnV - np.min(FitnV))
+
+def powing(ObjV, CV = None, k = None, SUBPOP = None):
+
+    """
+powing : function - 幂尺度变换适应度计算
+
+语法:
+    FitnV = powing(ObjV)
+    FitnV = powing(ObjV, CV)
+    FitnV = powing(ObjV, CV, k)
+    FitnV = powing(ObjV, CV, k, SUBPOP)
+
+描述:
+    F' = (max(ObjV) - ObjV) ^ k，k默认为1。当所有个体的目标函数值相等时，适应度均为1。
+    给定SUBPOP时，种群被均分为SUBPOP个子种群，各子种群分别计算适应度。
+
+"""
+
+    key = _penalize(ObjV[:, 0], CV)
+    k = 1 if k is None else k
+    SUBPOP = 1 if SUBPOP is None else SUBPOP
+    key = key.reshape(SUBPOP, -1)
+    F = np.max(key, 1, keepdims = True) - key
+    FitnV = F ** k
+    same = np.all(F == 0, 1)
+    FitnV[same] = 1
+    return _column(FitnV)
+
+def indexing(ObjV, CV = None, Beta = None):
+
+    """
+indexing : function - 指数尺度变换适应度计算
+
+语法:
+    FitnV = indexing(ObjV)
+    FitnV = indexing(ObjV, CV)
+    FitnV = indexing(ObjV, CV, Beta)
+
+描述:
+    F' = exp(-Beta * ObjV) + 1（Beta默认为1），再把F'平移使其最小值为0。
+    当所有个体的目标函数值相等时，适应度均为1。
+
+"""
+
+    key = _penalize(ObjV[:, 0], CV)
+    Beta = 1 if Beta is None else Beta
+    if np.max(key) == np.min(key):
+        return np.ones((len(key), 1))
+    FitnV = np.exp(-Beta * (key - np.min(key))) # 先平移再取指数，以免溢出
+    return _column(FitnV - np.min(FitnV))
+
+def awGA(ObjV, CV = None):
+
+    """
+awGA : function - 适应性权重法多目标聚合函数
+
+语法:
+    [CombinObjV, weight] = awGA(ObjV)
+    [CombinObjV, weight] = awGA(ObjV, CV)
+
+描述:
+    以可行个体中各目标的最小值为正理想点、最大值为负理想点，
+    取各目标的权重为1 / (最大值 - 最小值)，把各目标到正理想点的距离加权求和得到聚合后的单目标值。
+
+"""
+
+    vio = _violation(CV)
+    feasible = np.ones(ObjV.shape[0], dtype = bool) if vio is None or np.all(vio > 0) else vio == 0
+    zmin = np.min(ObjV[feasible], 0)
+    zmax = np.max(ObjV[feasible], 0)
+    span = zmax - zmin
+    weight = 1 / np.where(span > 0, span, 1)
+    CombinObjV = np.sum((ObjV - zmin) * weight, 1)
+    return [_column(_penalize(CombinObjV, CV)), weight.reshape(1, -1)]
+
+def rwGA(ObjV, CV = None):
+
+    """
+rwGA : function - 随机权重法多目标聚合函数
+
+语法:
+    [CombinObjV, weight] = rwGA(ObjV)
+    [CombinObjV, weight] = rwGA(ObjV, CV)
+
+描述:
+    随机生成一组和为1的权重，把各目标函数值加权求和得到聚合后的单目标值。
+
+"""
+
+    weight = rng.rand(ObjV.shape[1])
+    weight /= np.sum(weight)
+    CombinObjV = ObjV.dot(weight)
+    return [_column(_penalize(CombinObjV, CV)), weight.reshape(1, -1)]
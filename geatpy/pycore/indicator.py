@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+indicator.py - 纯Numpy实现的多目标优化评价指标
+
+包含: GD, IGD, HV, Spacing, moea_tracking，以及超体积计算引擎中的calHV, hv2D, hv3D, hvWFG, hvMC（详见hypervolume.py）
+
+"""
+
+import numpy as np
+from scipy.spatial.distance import cdist
+from PFIndex import PFIndex
+from MetricTracker import MetricTracker
+from hypervolume import calHV, hv2D, hv3D, hvWFG, hvMC
+
+def GD(ObjV, PF):
+
+    """
+indicator.GD : function - 计算多目标优化世代距离(GD)评价指标的值
+
+语法:
+    gd = GD(ObjV, PF)
+
+描述:
+    GD是一种收敛性评价指标，其值越小越好。它等于ObjV中每个点到PF的最小欧氏距离的平均值。
+    PF可以是目标函数值矩阵，也可以是已建立好的PFIndex对象（对同一个PF反复计算时可避免重复建立索引，详见PFIndex类）。
+
+"""
+
+    return (PF if isinstance(PF, PFIndex) else PFIndex(PF)).GD(ObjV)
+
+def IGD(ObjV, PF):
+
+    """
+indicator.IGD : function - 计算多目标优化反转世代距离(IGD)评价指标的值
+
+语法:
+    igd = IGD(ObjV, PF)
+
+描述:
+    IGD是一个综合评价指标，其值越小越好。它等于PF中每个点到ObjV的最小欧氏距离的平均值。
+    与GD一样，PF也可以是PFIndex对象。
+
+"""
+
+    return (PF if isinstance(PF, PFIndex) else PFIndex(PF)).IGD(ObjV)
+
+def HV(ObjV, PF = None):
+
+    """
+indicator.HV : function - 超体积指标(Hypervolume)的计算
+
+语法:
+    hv = HV(ObjV)
+    hv = HV(ObjV, PF)
+
+描述:
+    先以PF（缺省时为ObjV）各维的最大值的1.1倍为上界对ObjV进行归一化，再以(1, 1, ..., 1)为参考点计算超体积，
+    HV的值越大越好。计算方法由calHV根据点数和目标维数自动选择：目标维数为2或3时采用扫描法精确计算，
+    大于等于4时采用WFG算法精确计算，点数和目标维数都较大时改用蒙特卡洛法估计（详见hypervolume.py）。
+
+"""
+
+    ObjV = np.asarray(ObjV, dtype = float)
+    PF = ObjV if PF is None else (PF.PF if isinstance(PF, PFIndex) else np.asarray(PF, dtype = float))
+    M = ObjV.shape[1]
+    fmin = np.minimum(np.min(ObjV, 0), 0)
+    fmax = np.max(PF, 0)
+    span = (fmax - fmin) * 1.1
+    points = (ObjV - fmin) / np.where(span > 0, span, 1)
+    return calHV(points, np.ones(M))
+
+def Spacing(ObjV, params1 = None):
+
+    """
+indicator.Spacing : function - 一个分布性指标的计算
+
+语法:
+    spacing = Spacing(ObjV)
+    spacing = Spacing(ObjV, params1)
+
+描述:
+    根据文献(Schott Jason, 1995)计算个体的分布性指标值：先求每个点到其他点的最小曼哈顿距离，
+    再求这些距离的标准差，该值越小，表示解的分布越均匀。params1为无用参数。
+
+"""
+
+    if ObjV.shape[0] < 2:
+        return 0.0
+    dis = cdist(ObjV, ObjV, 'cityblock')
+    np.fill_diagonal(dis, np.inf)
+    return np.std(np.min(dis, 1), ddof = 1)
+
+def moea_tracking(pop_trace, PF, metricName, maxormins = None, poolSize = None):
+
+    """
+indicator.moea_tracking : function - 多目标优化进化过程指标追踪分析
+
+语法:
+    [NDSet_trace, Metrics] = moea_tracking(pop_trace, PF, metricName)
+    [NDSet_trace, Metrics] = moea_tracking(pop_trace, PF, metricName, maxormins)
+    [NDSet_trace, Metrics] = moea_tracking(pop_trace, PF, metricName, maxormins, poolSize)
+
+描述:
+    对进化记录器中的每一代种群，先找出满足约束条件的非支配个体，再计算metricName中的各个指标，
+    metricName形如[['GD'], ['IGD']]。返回历代非支配个体集合组成的列表以及每一列对应一个指标的指标值矩阵。
+    poolSize大于1时用poolSize个进程并行计算各代的指标。
+    PF的最近邻索引（详见PFIndex类）只建立一次，之后各代计算GD、IGD时都复用它。
+    该函数基于MetricTracker类实现，若要在进化过程中逐代计算指标，请直接使用MetricTracker类。
+
+"""
+
+    return MetricTracker(PF, metricName, maxormins).track(pop_trace, poolSize)
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+"""
+mutation.py - 纯Numpy实现的变异算子
+
+包含: mutate, boundfix, mutbin, mutbga, mutde, mutgau, mutuni, mutpolyn, mutinv, mutswap, mutmove, mutpp
+
+Pm的含义与编译版本一致：对于逐个基因变异的算子（mutbin, mutbga, mutgau, mutuni, mutpolyn, mutpp），
+每个基因的变异概率为Pm / Lind；对于改变染色体片段的算子（mutinv, mutswap, mutmove），
+每条染色体以概率Pm发生变异。
+
+"""
+
+import numpy as np
+from geatpy import rng
+
+def _default(value, default):
+    # 参数缺省或为None或NaN时取默认值
+    if value is None or (np.isscalar(value) and not isinstance(value, (bool, np.bool_, str)) and np.isnan(value)):
+        return default
+    return value
+
+def _checkEncoding(name, Encoding, allowed):
+    if Encoding not in allowed:
+        raise RuntimeError('error in ' + name + ': Encoding must be ' + ' or '.join("'" + e + "'" for e in allowed) + '. (编码方式必须为' + '或'.join("'" + e + "'" for e in allowed) + '。)')
+
+def _repair(Chrom, FieldDR, Loop):
+    # 把离散变量四舍五入为整数，再用截断或循环的方式修复超出边界的元素
+    lb, ub = FieldDR[0], FieldDR[1]
+    discrete = FieldDR[2] == 1 if FieldDR.shape[0] > 2 else np.zeros(FieldDR.shape[1], dtype = bool)
+    Chrom = np.where(discrete, np.round(Chrom), Chrom)
+    if Loop:
+        span = np.where(discrete, ub - lb + 1, ub - lb)
+        out = ((Chrom < lb) | (Chrom > ub)) & (span > 0)
+        Chrom = np.where(out, lb + np.mod(Chrom - lb, np.where(span > 0, span, 1)), Chrom)
+    return np.clip(Chrom, lb, ub)
+
+def _geneFlag(OldChrom, Pm):
+    # 每个基因以概率Pm / Lind发生变异
+    return rng.rand(*OldChrom.shape) < Pm / OldChrom.shape[1]
+
+def boundfix(Encoding, OldChrom, FieldDR, Loop = None):
+
+    """
+boundfix : function - 修复超出边界范围的染色体
+
+语法:
+    NewChrom = boundfix(Encoding, OldChrom, FieldDR)
+    NewChrom = boundfix(Encoding, OldChrom, FieldDR, Loop)
+
+描述:
+    先把离散变量四舍五入为整数。Loop为False（默认）时采用截断修复，即对超出边界范围的元素取与其最近的边界值；
+    Loop为True时采用循环修复，即将超出边界范围的元素mod范围的区域长度得到修复值。
+
+"""
+
+    _checkEncoding('boundfix', Encoding, ['RI'])
+    return _repair(OldChrom, FieldDR, Loop)
+
+def mutbin(Encoding, OldChrom, params2 = None, Pm = None, params4 = None, params5 = None, params6 = None, params7 = None):
+
+    """
+mutbin : function - 二进制变异算子(Mutation for Binary Chromosomes)
+
+语法:
+    NewChrom = mutbin(Encoding, OldChrom)
+    NewChrom = mutbin(Encoding, OldChrom, params2)
+    NewChrom = mutbin(Encoding, OldChrom, params2, Pm)
+    NewChrom = mutbin(Encoding, OldChrom, params2, Pm, params4, params5, params6, params7)
+
+描述:
+    对二进制/格雷编码（Encoding为'BG'）的染色体按位取反，Pm为每条染色体的突变概率（默认为1）。
+
+"""
+
+    _checkEncoding('mutbin', Encoding, ['BG'])
+    Pm = _default(Pm, 1)
+    return np.where(_geneFlag(OldChrom, Pm), 1 - OldChrom, OldChrom)
+
+def mutbga(Encoding, OldChrom, FieldDR, Pm = None, MutShrink = None, Gradient = None, params6 = None, params7 = None):
+
+    """
+mutbga : function - Breeder GA算法突变算子(Mutation of Breeder Genetic Algorithm)
+
+语法:
+    NewChrom = mutbga(Encoding, OldChrom, FieldDR)
+    NewChrom = mutbga(Encoding, OldChrom, FieldDR, Pm)
+    NewChrom = mutbga(Encoding, OldChrom, FieldDR, Pm, MutShrink)
+    NewChrom = mutbga(Encoding, OldChrom, FieldDR, Pm, MutShrink, Gradient)
+
+描述:
+    变异距离 = ±MutShrink * (ub - lb) * sum(a_i * 2^-i)，i = 0, 1, ..., Gradient - 1，
+    其中每个a_i以1 / Gradient的概率取1（至少有一个取1）。MutShrink默认为0.5，Gradient默认为20。
+
+"""
+
+    _checkEncoding('mutbga', Encoding, ['RI'])
+    Pm = _default(Pm, 1)
+    MutShrink = _default(MutShrink, 0.5)
+    Gradient = int(_default(Gradient, 20))
+    flag = _geneFlag(OldChrom, Pm)
+    count = int(np.sum(flag))
+    chosen = rng.rand(count, Gradient) < 1 / Gradient
+    chosen[np.arange(count), rng.randint(0, Gradient, count)] |= ~np.any(chosen, 1)
+    delta = chosen.dot(2.0 ** -np.arange(Gradient))
+    sign = np.where(rng.rand(count) < 0.5, -1, 1)
+    span = np.broadcast_to(FieldDR[1] - FieldDR[0], OldChrom.shape)[flag]
+    NewChrom = OldChrom.astype(float)
+    NewChrom[flag] += sign * MutShrink * span * delta
+    return _repair(NewChrom, FieldDR, False)
+
+def _differentIndices(Nind, count, exclude):
+    # 为每个个体随机生成count个互异的索引，并尽可能不与exclude中的索引重复（种群规模过小时无法保证）
+    R = rng.randint(0, Nind, (Nind, count))
+    forbidden = len(exclude) + count - 1 # 每个索引需要避开的索引个数的上界
+    if Nind <= forbidden:
+        return R
+    for _ in range(100):
+        clash = np.zeros(R.shape, dtype = bool)
+        for j in range(count):
+            for other in exclude:
+                clash[:, j] |= R[:, j] == other
+            for k in range(j):
+                clash[:, j] |= R[:, j] == R[:, k]
+        if not np.any(clash):
+            break
+        R[clash] = rng.randint(0, Nind, np.sum(clash))
+    return R
+
+def mutde(Encoding, OldChrom, FieldDR, r0, F = None, DN = None, Loop = None, params7 = None):
+
+    """
+mutde : function - 差分变异(Mutation for Differential Evolution)
+
+语法:
+    NewChrom = mutde(Encoding, OldChrom, FieldDR, r0)
+    NewChrom = mutde(Encoding, OldChrom, FieldDR, r0, F)
+    NewChrom = mutde(Encoding, OldChrom, FieldDR, r0, F, DN)
+    NewChrom = mutde(Encoding, OldChrom, FieldDR, r0, F, DN, Loop)
+    或:
+    NewChrom = mutde(Encoding, OldChrom, FieldDR, Xr0, ...)
+
+描述:
+    变异结果 = Xr0 + F * (Xr1 - Xr2)（DN为1，默认）或 = Xr0 + F * (Xr1 - Xr2 + Xr3 - Xr4)（DN为2）。
+    r0为行向量时表示基向量的索引，为矩阵时表示基向量矩阵Xr0；差分向量的索引随机生成，
+    并尽可能保证与个体自身及r0互不相等。F为缩放因子，可以是标量或列向量，默认为0.5。
+
+"""
+
+    _checkEncoding('mutde', Encoding, ['RI'])
+    F = _default(F, 0.5)
+    DN = int(_default(DN, 1))
+    if DN not in (1, 2):
+        raise RuntimeError('error in mutde: DN must be 1 or 2. (DN必须为1或2。)')
+    Nind = OldChrom.shape[0]
+    r0 = np.asarray(r0)
+    if r0.ndim == 2 and r0.shape == OldChrom.shape:
+        Xr0 = r0
+        exclude = [np.arange(Nind)]
+    else:
+        r0 = r0.reshape(-1).astype(int)
+        if len(r0) != Nind:
+            raise RuntimeError('error in mutde: The length of r0 must equal the population size. (r0的长度必须等于种群规模。)')
+        Xr0 = OldChrom[r0]
+        exclude = [np.arange(Nind), r0]
+    R = _differentIndices(Nind, 2 * DN, exclude)
+    diff = OldChrom[R[:, 0]] - OldChrom[R[:, 1]]
+    if DN == 2:
+        diff = diff + OldChrom[R[:, 2]] - OldChrom[R[:, 3]]
+    return _repair(Xr0 + np.asarray(F) * diff, FieldDR, Loop)
+
+def _spread(name, value, OldChrom, FieldDR, MutShrink):
+    # 解析mutgau的Sigma或mutuni的Alpha：bool、标量、行向量或矩阵
+    lb, ub = FieldDR[0], FieldDR[1]
+    if value is None or isinstance(value, (bool, np.bool_)):
+        spread = np.minimum(ub - OldChrom, OldChrom - lb) if value else np.broadcast_to(0.5 * (ub - lb), OldChrom.shape)
+    else:
+        spread = np.asarray(value, dtype = float)
+        if spread.ndim == 2 and spread.shape[0] not in (1, OldChrom.shape[0]):
+            raise RuntimeError('error in ' + name + ': The number of rows must be 1 or equal the population size. (行数必须为1或等于种群规模。)')
+        spread = np.broadcast_to(spread, OldChrom.shape)
+    return spread * MutShrink
+
+def mutgau(Encoding, OldChrom, FieldDR, Pm = None, Sigma = None, MutShrink = None, Middle = None, Loop = None):
+
+    """
+mutgau : function - 高斯变异算子(Gaussian Mutation)
+
+语法:
+    NewChrom = mutgau(Encoding, OldChrom, FieldDR)
+    NewChrom = mutgau(Encoding, OldChrom, FieldDR, Pm)
+    NewChrom = mutgau(Encoding, OldChrom, FieldDR, Pm, Sigma)
+    NewChrom = mutgau(Encoding, OldChrom, FieldDR, Pm, Sigma, MutShrink)
+    NewChrom = mutgau(Encoding, OldChrom, FieldDR, Pm, Sigma, MutShrink, Middle)
+    NewChrom = mutgau(Encoding, OldChrom, FieldDR, Pm, Sigma, MutShrink, Middle, Loop)
+
+描述:
+    变异结果服从N(Miu, Sigma * MutShrink)，Middle为True时Miu为搜索域的中央，否则为变异前的值。
+    Sigma可以是标量、行向量或矩阵；为True时等于min(ub-x, x-lb)，为False或缺省时等于0.5*(ub-lb)。
+
+"""
+
+    _checkEncoding('mutgau', Encoding, ['RI'])
+    Pm = _default(Pm, 1)
+    MutShrink = _default(MutShrink, 1)
+    flag = _geneFlag(OldChrom, Pm)
+    sigma = _spread('mutgau', Sigma, OldChrom, FieldDR, MutShrink)
+    center = np.broadcast_to((FieldDR[0] + FieldDR[1]) / 2, OldChrom.shape) if Middle else OldChrom
+    return _repair(np.where(flag, center + sigma * rng.randn(*OldChrom.shape), OldChrom), FieldDR, Loop)
+
+def mutuni(Encoding, OldChrom, FieldDR, Pm = None, Alpha = None, MutShrink = None, Middle = None, Loop = None):
+
+    """
+mutuni : function - 均匀变异算子(Uniform Mutation)
+
+语法:
+    NewChrom = mutuni(Encoding, OldChrom, FieldDR)
+    NewChrom = mutuni(Encoding, OldChrom, FieldDR, Pm)
+    NewChrom = mutuni(Encoding, OldChrom, FieldDR, Pm, Alpha)
+    NewChrom = mutuni(Encoding, OldChrom, FieldDR, Pm, Alpha, MutShrink)
+    NewChrom = mutuni(Encoding, OldChrom, FieldDR, Pm, Alpha, MutShrink, Middle)
+    NewChrom = mutuni(Encoding, OldChrom, FieldDR, Pm, Alpha, MutShrink, Middle, Loop)
+
+描述:
+    变异结果服从[Miu - Alpha * MutShrink, Miu + Alpha * MutShrink]上的均匀分布，
+    Miu和Alpha的含义与mutgau中的Miu和Sigma相同。
+
+"""
+
+    _checkEncoding('mutuni', Encoding, ['RI'])
+    Pm = _default(Pm, 1)
+    MutShrink = _default(MutShrink, 1)
+    flag = _geneFlag(OldChrom, Pm)
+    alpha = _spread('mutuni', Alpha, OldChrom, FieldDR, MutShrink)
+    center = np.broadcast_to((FieldDR[0] + FieldDR[1]) / 2, OldChrom.shape) if Middle else OldChrom
+    return _repair(np.where(flag, center + alpha * (2 * rng.rand(*OldChrom.shape) - 1), OldChrom), FieldDR, Loop)
+
+def mutpolyn(Encoding, OldChrom, FieldDR, Pm = None, DisI = None, Loop = None, params6 = None, params7 = None):
+
+    """
+mutpolyn : function - 多项式变异算子(Polynomial Mutation)
+
+语法:
+    NewChrom = mutpolyn(Encoding, OldChrom, FieldDR)
+    NewChrom = mutpolyn(Encoding, OldChrom, FieldDR, Pm)
+    NewChrom = mutpolyn(Encoding, OldChrom, FieldDR, Pm, DisI)
+    NewChrom = mutpolyn(Encoding, OldChrom, FieldDR, Pm, DisI, Loop)
+
+描述:
+    Deb的多项式变异，DisI为分布指数（默认为20）。变异前会先修复越界的元素。
+
+"""
+
+    _checkEncoding('mutpolyn', Encoding, ['RI'])
+    Pm = _default(Pm, 1)
+    DisI = _default(DisI, 20)
+    Chrom = _repair(OldChrom, FieldDR, Loop)
+    lb, ub = FieldDR[0], FieldDR[1]
+    span = np.where(ub > lb, ub - lb, 1)
+    delta1 = (Chrom - lb) / span
+    delta2 = (ub - Chrom) / span
+    u = rng.rand(*Chrom.shape)
+    power = 1 / (DisI + 1)
+    low = (2 * u + (1 - 2 * u) * (1 - delta1) ** (DisI + 1)) ** power - 1
+    high = 1 - (2 * (1 - u) + 2 * (u - 0.5) * (1 - delta2) ** (DisI + 1)) ** power
+    deltaq = np.where(u < 0.5, low, high)
+    NewChrom = np.where(_geneFlag(Chrom, Pm) & (ub > lb), Chrom + deltaq * (ub - lb), Chrom)
+    return _repair(NewChrom, FieldDR, Loop)
+
+def _rangeGroups(FieldDR):
+    # 返回取值范围相同的变量的列索引分组（只保留包含至少两个变量的组）
+    keys = np.vstack([FieldDR[0], FieldDR[1]]).T
+    uniq, inverse = np.unique(keys, axis = 0, return_inverse = True)
+    inverse = inverse.reshape(-1)
+    groups = [np.where(inverse == i)[0] for i in range(len(uniq))]
+    return [cols for cols in groups if len(cols) > 1]
+
+def _twoPoints(rows, Lind):
+    # 为每一行随机生成两个互异的位置p1 < p2
+    p1 = rng.randint(0, Lind, rows)
+    p2 = (p1 + rng.randint(1, Lind, rows)) % Lind
+    return np.minimum(p1, p2), np.maximum(p1, p2)
+
+def mutinv(Encoding, OldChrom, FieldDR, Pm = None, params4 = None, params5 = None, params6 = None, params7 = None):
+
+    """
+mutinv : function - 染色体片段逆转变异算子(Invertion Mutation)
+
+语法:
+    NewChrom = mutinv(Encoding, OldChrom, FieldDR)
+    NewChrom = mutinv(Encoding, OldChrom, FieldDR, Pm)
+
+描述:
+    每条染色体以概率Pm（默认为1）把一个长度随机的片段逆转，逆转变异只发生在取值范围相同的变量之中。
+
+"""
+
+    _checkEncoding('mutinv', Encoding, ['RI', 'P'])
+    Pm = _default(Pm, 1)
+    NewChrom = OldChrom.copy()
+    for cols in _rangeGroups(FieldDR):
+        rows = np.where(rng.rand(OldChrom.shape[0]) < Pm)[0]
+        low, high = _twoPoints(len(rows), len(cols))
+        pos = np.arange(len(cols))
+        inside = (pos >= low[:, None]) & (pos <= high[:, None])
+        source = np.where(inside, low[:, None] + high[:, None] - pos, pos)
+        NewChrom[rows[:, None], cols[pos]] = OldChrom[rows[:, None], cols[source]]
+    return NewChrom
+
+def mutswap(Encoding, OldChrom, FieldDR, Pm = None, params4 = None, params5 = None, params6 = None, params7 = None):
+
+    """
+mutswap : function - 染色体两点互换变异算子(Swap Mutation)
+
+语法:
+    NewChrom = mutswap(Encoding, OldChrom, FieldDR)
+    NewChrom = mutswap(Encoding, OldChrom, FieldDR, Pm)
+
+描述:
+    每条染色体以概率Pm（默认为1）互换两个随机位置上的元素，互换变异只发生在取值范围相同的变量之中。
+
+"""
+
+    _checkEncoding('mutswap', Encoding, ['RI', 'P'])
+    Pm = _default(Pm, 1)
+    NewChrom = OldChrom.copy()
+    for cols in _rangeGroups(FieldDR):
+        rows = np.where(rng.rand(OldChrom.shape[0]) < Pm)[0]
+        low, high = _twoPoints(len(rows), len(cols))
+        NewChrom[rows, cols[low]] = OldChrom[rows, cols[high]]
+        NewChrom[rows, cols[high]] = OldChrom[rows, cols[low]]
+    return NewChrom
+
+def mutmove(Encoding, OldChrom, FieldDR, Pm = None, MoveLen = None, Pr = None, params6 = None, params7 = None):
+
+    """
+mutmove : function - 染色体片段移位变异算子(Move Mutation)
+
+语法:
+    NewChrom = mutmove(Encoding, OldChrom, FieldDR)
+    NewChrom = mutmove(Encoding, OldChrom, FieldDR, Pm)
+    NewChrom = mutmove(Encoding, OldChrom, FieldDR, Pm, MoveLen)
+    NewChrom = mutmove(Encoding, OldChrom, FieldDR, Pm, MoveLen, Pr)
+
+描述:
+    每条染色体以概率Pm（默认为1）把一个长度为MoveLen（缺省时随机）的片段移到另一个随机位置，
+    移位后的片段以概率Pr（默认为0）发生逆转。移位变异只发生在取值范围相同的变量之中。
+
+"""
+
+    _checkEncoding('mutmove', Encoding, ['RI', 'P'])
+    Pm = _default(Pm, 1)
+    Pr = _default(Pr, 0)
+    NewChrom = OldChrom.copy()
+    for cols in _rangeGroups(FieldDR):
+        Lind = len(cols)
+        for row in np.where(rng.rand(OldChrom.shape[0]) < Pm)[0]:
+            length = rng.randint(1, Lind) if MoveLen is None else min(max(int(MoveLen), 1), Lind - 1)
+            start = rng.randint(0, Lind - length + 1)
+            segment = np.arange(start, start + length)
+            others = np.hstack([np.arange(start), np.arange(start + length, Lind)])
+            if rng.rand() < Pr:
+                segment = segment[::-1]
+            target = rng.randint(0, len(others) + 1)
+            order = np.hstack([others[:target], segment, others[target:]])
+            NewChrom[row, cols] = OldChrom[row, cols[order]]
+    return NewChrom
+
+def mutpp(Encoding, OldChrom, FieldDR, Pm = None, params4 = None, params5 = None, params6 = None, params7 = None):
+
+    """
+mutpp : function - 排列编码种群染色体变异算子(Mutation of Permutation Chromosomes)
+
+语法:
+    NewChrom = mutpp(Encoding, OldChrom, FieldDR)
+    NewChrom = mutpp(Encoding, OldChrom, FieldDR, Pm)
+
+描述:
+    每个基因以概率Pm / Lind（Pm默认为1）变为[lb, ub]中的一个随机整数，
+    若该整数已在染色体中出现，则把原来的位置换成变异前的值，以保证染色体仍是一个排列。
+
+"""
+
+    _checkEncoding('mutpp', Encoding, ['P'])
+    Pm = _default(Pm, 1)
+    NewChrom = OldChrom.copy()
+    flag = _geneFlag(OldChrom, Pm)
+    lb, ub = int(FieldDR[0, 0]), int(FieldDR[1, 0])
+    for j in np.where(np.any(flag, 0))[0]:
+        rows = np.where(flag[:, j])[0]
+        values = rng.randint(lb, ub + 1, len(rows))
+        same = NewChrom[rows] == values[:, None]
+        exists = np.any(same, 1)
+        pos = np.argmax(same, 1)
+        NewChrom[rows[exists], pos[exists]] = NewChrom[rows[exists], j]
+        NewChrom[rows, j] = values
+    return NewChrom
+
+_MUTATORS = {'mutbin' : mutbin, 'mutbga' : mutbga, 'mutde' : mutde, 'mutgau' : mutgau, 'mutuni' : mutuni,
+             'mutpolyn' : mutpolyn, 'mutinv' : mutinv, 'mutswap' : mutswap, 'mutmove' : mutmove, 'mutpp' : mutpp}
+
+def mutate(MUT_F, Encoding, OldChrom, params2 = None, params3 = None, params4 = None, params5 = None, params6 = None, params7 = None):
+
+    """
+mutate : function - 高级变异函数
+
+语法:
+    NewChrom = mutate(MUT_F, Encoding, OldChrom)
+    NewChrom = mutate(MUT_F, Encoding, OldChrom, params2)
+    ...
+    NewChrom = mutate(MUT_F, Encoding, OldChrom, params2, params3, params4, params5, params6, params7)
+
+描述:
+    调用名为MUT_F的低级变异函数对种群染色体进行变异，params2至params7按顺序传入低级变异函数。
+
+"""
+
+    if MUT_F not in _MUTATORS:
+        raise RuntimeError('error in mutate: No such mutation operator: ' + str(MUT_F) + '. (没有名为' + str(MUT_F) + '的变异算子。)')
+    return _MUTATORS[MUT_F](Encoding, OldChrom, params2, params3, params4, params5, params6, params7)
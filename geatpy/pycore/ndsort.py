@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+ndsort.py - 纯Numpy实现的非支配排序、拥挤距离以及基于参考点的个体筛选
+
+包含: ndsortESS, ndsortDED, crowdis, refselect, refgselect
+
+这些函数都遵循“最小化目标”的约定。传入了CV时采用约束支配关系：
+可行个体支配所有不可行个体，不可行个体之间违反约束程度之和越小越优。
+
+"""
+
+import numpy as np
+from geatpy import rng
+
+def _violation(CV, Nind):
+    # 计算每个个体的违反约束程度之和，CV为None时全为0
+    if CV is None:
+        return np.zeros(Nind)
+    return np.sum(np.maximum(CV, 0), 1)
+
+def _dominance(ObjV, CV):
+    # 返回支配关系矩阵D，D[i, j]为True表示个体i（约束）支配个体j
+    Nind, M = ObjV.shape
+    noWorse = np.ones((Nind, Nind), dtype = bool)
+    better = np.zeros((Nind, Nind), dtype = bool)
+    for m in range(M): # 逐个目标比较，避免生成Nind x Nind x M的临时数组
+        col = ObjV[:, m]
+        noWorse &= col[:, None] <= col[None, :]
+        better |= col[:, None] < col[None, :]
+    D = noWorse & better
+    vio = _violation(CV, Nind)
+    if np.any(vio > 0):
+        feasible = vio == 0
+        D = np.where(feasible[:, None] & feasible[None, :], D, vio[:, None] < vio[None, :])
+    return D
+
+def _peel(ObjV, needNum, needLevel, CV):
+    # 逐层剥离非支配个体，直到已分级的个体数不少于needNum或层数达到needLevel
+    Nind = ObjV.shape[0]
+    levels = np.full(Nind, np.inf)
+    if Nind == 0:
+        return [levels, 0]
+    D = _dominance(ObjV, CV)
+    count = np.sum(D, 0) # 每个个体被多少个个体支配
+    remain = np.ones(Nind, dtype = bool)
+    ranked, level = 0, 0
+    while ranked < needNum and level < needLevel and np.any(remain):
+        level += 1
+        front = remain & (count == 0)
+        levels[front] = level
+        remain &= ~front
+        ranked += np.sum(front)
+        count -= np.sum(D[front], 0)
+    return [levels, level]
+
+def ndsortESS(ObjV, needNum = None, needLevel = None, CV = None):
+
+    """
+ndsortESS : function - 快速非支配层级划分
+
+语法:
+    [levels, criLevel] = ndsortESS(ObjV)
+    [levels, criLevel] = ndsortESS(ObjV, needNum)
+    [levels, criLevel] = ndsortESS(ObjV, needNum, needLevel)
+    [levels, criLevel] = ndsortESS(ObjV, needNum, needLevel, CV)
+
+描述:
+    对种群个体进行非支配分层（最小级是1），needNum为需要分级的个体数（默认为种群规模），
+    needLevel为最多划分的层数（默认为种群规模）。未被分级的个体的levels值为Inf，
+    criLevel为临界层（即最后划分出来的一层）所在的级数。
+
+"""
+
+    Nind = ObjV.shape[0]
+    needNum = Nind if needNum is None else needNum
+    needLevel = Nind if needLevel is None else needLevel
+    return _peel(ObjV, needNum, needLevel, CV)
+
+def ndsortDED(ObjV, needNum = None, needLevel = None, CV = None):
+
+    """
+ndsortDED : function - 非支配层级划分
+
+语法:
+    [levels, criLevel] = ndsortDED(ObjV)
+    [levels, criLevel] = ndsortDED(ObjV, needNum)
+    [levels, criLevel] = ndsortDED(ObjV, needNum, needLevel)
+    [levels, criLevel] = ndsortDED(ObjV, needNum, needLevel, CV)
+
+描述:
+    与ndsortESS相同，但needNum缺省时默认为种群规模的一半（向下取整）。
+
+"""
+
+    Nind = ObjV.shape[0]
+    needNum = Nind // 2 if needNum is None else needNum
+    needLevel = Nind if needLevel is None else needLevel
+    return _peel(ObjV, needNum, needLevel, CV)
+
+def crowdis(ObjV, levels = None, enhanceFlag = None):
+
+    """
+crowdis : function - (Crowding Distance)拥挤距离计算
+
+语法:
+    dis = crowdis(ObjV, levels)
+    dis = crowdis(ObjV, levels, enhanceFlag)
+
+描述:
+    在每一层内分别计算拥挤距离，各目标方向上处于边界的个体的拥挤距离为Inf，未被分级的个体的拥挤距离为0。
+    enhanceFlag为True时采用增强拥挤距离：每个目标方向上取与相邻个体间距的较小值而非两侧间距之和，
+    以免两个非常接近的个体同时得到较大的拥挤距离。
+
+"""
+
+    Nind, M = ObjV.shape
+    levels = np.ones(Nind) if levels is None else np.asarray(levels).reshape(-1)
+    dis = np.zeros(Nind)
+    for level in np.unique(levels[np.isfinite(levels)]):
+        idx = np.where(levels == level)[0]
+        F = ObjV[idx]
+        d = np.zeros(len(idx))
+        for m in range(M):
+            order = np.argsort(F[:, m], kind = 'mergesort')
+            values = F[order, m]
+            span = values[-1] - values[0]
+            gaps = np.diff(values) / (span if span > 0 else 1)
+            inner = np.minimum(gaps[:-1], gaps[1:]) if enhanceFlag else gaps[:-1] + gaps[1:]
+            d[order[1:-1]] += inner
+            d[order[[0, -1]]] = np.inf
+        dis[idx] = d
+    return dis
+
+def _normalize(ObjV):
+    # NSGA-III的自适应归一化：以理想点平移后，利用极端点构造的超平面截距进行归一化
+    Nind, M = ObjV.shape
+    F = ObjV - np.min(ObjV, 0)
+    weights = np.eye(M) + 1e-6
+    extreme = np.argmin(np.max(F[:, None, :] / weights[None, :, :], 2), 0)
+    try:
+        hyperplane = np.linalg.solve(F[extreme], np.ones(M))
+        intercepts = 1 / hyperplane
+        if np.any(~np.isfinite(intercepts)) or np.any(intercepts <= 1e-10):
+            raise np.linalg.LinAlgError
+    except np.linalg.LinAlgError:
+        intercepts = np.max(F, 0)
+    intercepts = np.where(intercepts > 1e-10, intercepts, 1)
+    return F / intercepts
+
+def _unitRows(refPoint):
+    # 把各参考向量单位化，返回单位向量及标记非零参考向量的逻辑向量（零向量保持为零，不参与关联）
+    norms = np.linalg.norm(refPoint, axis = 1, keepdims = True)
+    valid = norms[:, 0] > 0
+    return refPoint / np.where(norms > 0, norms, 1), valid
+
+def _associate(F, refPoint):
+    # 把个体关联到距离最近的参考线上，返回关联的参考点索引及到参考线的垂直距离
+    W, valid = _unitRows(refPoint)
+    proj = F.dot(W.T)
+    dist = np.sqrt(np.maximum(np.sum(F ** 2, 1, keepdims = True) - proj ** 2, 0))
+    dist[:, ~valid] = np.inf # 零参考向量不代表任何方向
+    pi = np.argmin(dist, 1)
+    return pi, dist[np.arange(F.shape[0]), pi]
+
+def refselect(ObjV, levels, criLevel, needNum, refPoint, pseudorandom = None):
+
+    """
+refselect : function - 根据参考点的个体筛选
+
+语法:
+    chooseFlag = refselect(ObjV, levels, criLevel, needNum, refPoint)
+    chooseFlag = refselect(ObjV, levels, criLevel, needNum, refPoint, pseudorandom)
+
+描述:
+    按NSGA-III（Deb et al, 2013）的方法选择needNum个个体：临界层之前的个体全部被选择，
+    临界层中的个体按参考点的小生境计数逐个选择。pseudorandom为True时，
+    多个候选者同时满足条件时直接取第一个，而不是随机选择。
+    当待选择的个体数目不大于needNum时直接返回全为True的chooseFlag。
+
+"""
+
+    levels = np.asarray(levels).reshape(-1)
+    Nind = ObjV.shape[0]
+    if Nind <= needNum:
+        return np.ones(Nind, dtype = bool)
+    chooseFlag = levels < criLevel
+    K = needNum - np.sum(chooseFlag)
+    if K <= 0:
+        return chooseFlag
+    St = np.where(levels <= criLevel)[0]
+    pi, dist = _associate(_normalize(ObjV[St]), refPoint)
+    chosen = chooseFlag[St]
+    rho = np.bincount(pi[chosen], minlength = refPoint.shape[0]).astype(float)
+    candidate = ~chosen # 临界层中的个体
+    pick = (lambda items : items[0]) if pseudorandom else rng.choice
+    while K > 0:
+        available = np.bincount(pi[candidate], minlength = refPoint.shape[0]) > 0
+        minRho = np.min(rho[available])
+        j = pick(np.where(available & (rho == minRho))[0])
+        members = np.where(candidate & (pi == j))[0]
+        if rho[j] == 0:
+            member = members[np.argmin(dist[members])]
+        else:
+            member = pick(members)
+        candidate[member] = False
+        chooseFlag[St[member]] = True
+        rho[j] += 1
+        K -= 1
+    return chooseFlag
+
+def refgselect(ObjV, refPoint, P_theta, CV = None, Gamma = None):
+
+    """
+refgselect : function - (Reference Point Guide Selection)根据参考点引导的个体筛选
+
+语法:
+    [chooseFlag, Gamma] = refgselect(ObjV, refPoint, P_theta)
+    [chooseFlag, Gamma] = refgselect(ObjV, refPoint, P_theta, CV)
+    [chooseFlag, Gamma] = refgselect(ObjV, refPoint, P_theta, CV, Gamma)
+
+描述:
+    按RVEA（Cheng R et al, 2016）的角度惩罚距离(APD)进行选择：每个个体被关联到与之夹角最小的参考向量，
+    每个参考向量只保留APD最小的个体（传入了CV时优先保留可行个体，没有可行个体时保留违反约束程度最小的个体）。
+    Gamma为每个参考向量与其他参考向量之间的最小夹角，为None时重新计算。
+
+"""
+
+    Nind = ObjV.shape[0]
+    F = ObjV - np.min(ObjV, 0)
+    V, valid = _unitRows(refPoint) # 目标的取值范围为0时参考向量可能为零向量，它们不参与关联
+    if Gamma is None:
+        cosine = V.dot(V.T)
+        np.fill_diagonal(cosine, -1)
+        cosine[:, ~valid] = -1
+        Gamma = np.arccos(np.clip(np.max(cosine, 1), -1, 1))
+        Gamma = np.where(Gamma > 0, Gamma, 1e-6)
+    norms = np.linalg.norm(F, axis = 1)
+    cosine = F.dot(V.T) / np.where(norms > 0, norms, 1)[:, None]
+    cosine[:, ~valid] = -np.inf
+    associate = np.argmax(cosine, 1)
+    theta = np.arccos(np.clip(cosine[np.arange(Nind), associate], -1, 1))
+    APD = (1 + P_theta * theta / Gamma[associate]) * norms
+    vio = _violation(CV, Nind)
+    # 先按违反约束程度、再按APD排序，每个参考向量保留排在最前面的个体
+    order = np.lexsort((APD, vio))
+    first = np.unique(associate[order], return_index = True)[1]
+    chooseFlag = np.zeros(Nind, dtype = bool)
+    chooseFlag[order[first]] = True
+    return [chooseFlag, Gamma]
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+plot.py - 基于matplotlib的绘图函数
+
+包含: moeaplot, soeaplot, varplot, trcplot
+
+matplotlib只在真正绘图时才导入，因此不绘图时不需要安装matplotlib。
+
+"""
+
+import numpy as np
+
+def _scatter(data, Label, saveFlag, ax, gen, interval, title, save_path, xlabel, fileName):
+    # moeaplot和varplot的公共部分：2维或3维时绘制散点图，否则绘制平行坐标图
+    import matplotlib.pyplot as plt
+    Label = '' if Label is None else Label
+    interval = 0.1 if interval is None else interval
+    title = Label if title is None else title
+    save_path = '' if save_path is None else save_path
+    dim = data.shape[1]
+    if ax is None:
+        fig = plt.figure()
+        ax = fig.add_subplot(111, projection = '3d') if dim == 3 else fig.add_subplot(111)
+    ax.cla()
+    if dim == 2:
+        ax.plot(data[:, 0], data[:, 1], 'o', color = 'r', markersize = 4, label = Label)
+        ax.set_xlabel(xlabel + ' 1')
+        ax.set_ylabel(xlabel + ' 2')
+    elif dim == 3:
+        ax.scatter(data[:, 0], data[:, 1], data[:, 2], marker = 'o', color = 'r', label = Label)
+        ax.set_xlabel(xlabel + ' 1')
+        ax.set_ylabel(xlabel + ' 2')
+        ax.set_zlabel(xlabel + ' 3')
+    else:
+        for row in data:
+            ax.plot(np.arange(1, dim + 1), row, color = 'b')
+        ax.set_xlabel('Dimension Number')
+        ax.set_ylabel('Value')
+    ax.set_title(title if gen is None else title + ' (gen: ' + str(gen) + ')')
+    if gen is not None:
+        plt.pause(interval)
+    else:
+        if saveFlag:
+            plt.savefig(save_path + fileName + '.svg', dpi = 600, bbox_inches = 'tight')
+        plt.show()
+    return ax
+
+def moeaplot(ObjV, Label = None, saveFlag = False, ax = None, gen = None, interval = None, title = None, save_path = None):
+
+    """
+moeaplot : function - 多目标优化目标空间绘图函数
+
+语法:
+    newAx = moeaplot(ObjV, Label, saveFlag)
+    newAx = moeaplot(ObjV, Label, saveFlag, ax, gen, interval, title, save_path)
+
+描述:
+    目标维数为2或3时绘制目标空间中的点，否则绘制各目标维度下的目标函数值。
+    gen为非None时绘制动态图（传入上一帧返回的ax），否则绘制静态图，saveFlag为True时保存为svg文件。
+
+"""
+
+    return _scatter(ObjV, Label, saveFlag, ax, gen, interval, title, save_path, 'f', 'Pareto Front Plot')
+
+def varplot(Vars, Label = None, saveFlag = False, ax = None, gen = None, interval = None, title = None, save_path = None):
+
+    """
+varplot : function - 决策空间绘图函数
+
+语法:
+    newAx = varplot(Vars, Label, saveFlag)
+    newAx = varplot(Vars, Label, saveFlag, ax, gen, interval, title, save_path)
+
+描述:
+    决策变量维数为2或3时绘制决策空间中的点，否则绘制各决策变量在各维度上的值，其余参数与moeaplot相同。
+
+"""
+
+    return _scatter(Vars, Label, saveFlag, ax, gen, interval, title, save_path, 'x', 'Decision Variables Plot')
+
+def soeaplot(ValueSet, Label = None, saveFlag = False, ax = None, gen = None, interval = None, title = None, save_path = None):
+
+    """
+soeaplot : function - 单目标优化进化过程绘图函数
+
+语法:
+    newAx = soeaplot(ValueSet)
+    newAx = soeaplot(ValueSet, Label, saveFlag, ax, gen, interval, title, save_path)
+
+描述:
+    绘制数据集列向量ValueSet随进化代数变化的曲线，gen为非None时绘制动态图。
+
+"""
+
+    import matplotlib.pyplot as plt
+    Label = '' if Label is None else Label
+    interval = 0.1 if interval is None else interval
+    title = Label if title is None else title
+    save_path = '' if save_path is None else save_path
+    if ax is None:
+        ax = plt.figure().add_subplot(111)
+    ax.cla()
+    ax.plot(np.asarray(ValueSet)[:, 0], '.-', label = Label)
+    ax.set_xlabel('Number of Generation')
+    ax.set_ylabel('Value')
+    ax.set_title(title)
+    if gen is not None:
+        plt.pause(interval)
+    else:
+        if saveFlag:
+            plt.savefig(save_path + title + '.svg', dpi = 600, bbox_inches = 'tight')
+        plt.show()
+    return ax
+
+def trcplot(trace, labels, titles = None, save_path = None):
+
+    """
+trcplot : function - 进化记录器绘图函数
+
+语法:
+    trcplot(trace, labels)
+    trcplot(trace, labels, titles)
+    trcplot(trace, labels, titles, save_path)
+
+描述:
+    trace的每一列对应一个参数，每一行对应一代。labels为二维列表，其每个元素对应一张图片中的图例，
+    labels的元素总数必须等于trace的列数。titles为各图片的标题，缺省或为None时不保存图片。
+
+"""
+
+    import matplotlib.pyplot as plt
+    trace = np.asarray(trace)
+    if sum(len(label) for label in labels) != trace.shape[1]:
+        raise RuntimeError('error in trcplot: The number of labels must equal the number of columns of trace. (labels的元素总数必须等于trace的列数。)')
+    save_path = '' if save_path is None else save_path
+    col = 0
+    for i, label in enumerate(labels):
+        plt.figure()
+        for name in label:
+            plt.plot(trace[:, col], label = name)
+            col += 1
+        plt.xlabel('Number of Generation')
+        plt.legend()
+        if titles is not None:
+            plt.title(titles[i])
+            plt.savefig(save_path + (titles[i] if titles[i] != '' else 'trace ' + str(i)) + '.svg', dpi = 600, bbox_inches = 'tight')
+    plt.show()
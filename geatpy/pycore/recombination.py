@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+"""
+recombination.py - 纯Numpy实现的重组（交叉）算子
+
+包含: recombin, xovmp, xovdp, xovsp, xovsh, xovud, xovbd, xovexp, xovsec,
+      recdis, recint, reclin, recndx, recsbx, xovox, xovpmx
+
+除xovpmx外，交配的一对都是有序的：种群的前一半个体和后一半个体进行配对，若个体数是奇数，则最后一个个体不参与配对。
+Half为True时每对交叉结果只保留第一条染色体，此时返回的染色体矩阵的行数为原来的一半（向下取整）。
+
+"""
+
+import numpy as np
+from geatpy import rng
+
+def _pair(OldChrom):
+    # 把种群染色体矩阵拆分为前一半、后一半以及不参与配对的最后一个个体
+    half = OldChrom.shape[0] // 2
+    return OldChrom[:half], OldChrom[half : 2 * half], OldChrom[2 * half:]
+
+def _assemble(NewA, NewB, rest, Half):
+    # 按“前一半、后一半、不参与配对的个体”的顺序拼接交叉结果
+    if Half:
+        return NewA
+    return np.vstack([NewA, NewB, rest])
+
+def _units(Lind, GeneID):
+    # 根据基因ID把染色体划分为整体交叉的单元，返回单元数及每个基因所属单元的索引（GeneID为None时每个基因自成一个单元）
+    if GeneID is None:
+        return Lind, None
+    GeneID = np.array(GeneID).reshape(-1)
+    if len(GeneID) != Lind:
+        raise RuntimeError('error in recombin: The length of GeneID must equal the length of the chromosome. (GeneID的长度必须等于染色体长度。)')
+    uniq, inverse = np.unique(GeneID, return_inverse = True)
+    return len(uniq), inverse
+
+def _expand(mask, inverse):
+    # 把以单元为列的交换标记矩阵展开为以基因为列的交换标记矩阵
+    return mask if inverse is None else mask[:, inverse]
+
+def _pairFlag(half, XOVR):
+    # 每对个体以概率XOVR发生交叉
+    return rng.rand(half, 1) < XOVR
+
+def _randomSubset(relevant, sizes):
+    # 对每一行，在relevant为True的位置中等概率地随机选取sizes个位置，返回选中标记矩阵
+    keys = np.where(relevant, rng.rand(*relevant.shape), np.inf)
+    ranks = np.argsort(np.argsort(keys, 1), 1)
+    return ranks < sizes.reshape(-1, 1)
+
+def _randomPoints(lengths, npt):
+    # 对每一行在[1, lengths-1]中随机选取npt个互异的交叉点（不足时尽量选取），返回升序排列的交叉点矩阵
+    cuts = np.maximum(lengths - 1, 0)
+    keys = rng.rand(len(lengths), max(int(np.max(cuts)) if len(cuts) else 0, npt))
+    keys[np.arange(keys.shape[1]) >= cuts.reshape(-1, 1)] = np.inf
+    points = np.sort(np.argsort(keys, 1)[:, :npt] + 1, 1)
+    return np.where(np.arange(npt) < cuts.reshape(-1, 1), points, lengths.reshape(-1, 1))
+
+def xovmp(OldChrom, XOVR = None, Npt = None, Rs = None, Half = None, GeneID = None):
+
+    """
+xovmp : function - 多点交叉
+
+语法:
+    NewChrom =  xovmp(OldChrom)
+    NewChrom =  xovmp(OldChrom, XOVR)
+    NewChrom =  xovmp(OldChrom, XOVR, Npt)
+    NewChrom =  xovmp(OldChrom, XOVR, Npt, Rs)
+    NewChrom =  xovmp(OldChrom, XOVR, Npt, Rs, Half)
+    NewChrom =  xovmp(OldChrom, XOVR, Npt, Rs, Half, GeneID)
+
+描述:
+    每对个体以概率XOVR（默认为0.7）发生交叉。Npt为0（默认）时执行洗牌交叉，为1时执行单点交叉，为2时执行两点交叉。
+    Rs为True时采用减少代理(reduced surrogate)，即只在两个父代染色体不相同的基因之间选择交叉点。
+    设置了基因ID（GeneID）时，具有相同基因ID的基因作为一个整体进行交叉。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    Npt = 0 if Npt is None else int(Npt)
+    if Npt not in (0, 1, 2):
+        raise RuntimeError('error in xovmp: Npt must be 0, 1 or 2. (Npt必须为0、1或2。)')
+    A, B, rest = _pair(OldChrom)
+    half = A.shape[0]
+    nUnits, inverse = _units(OldChrom.shape[1], GeneID)
+    if Rs:
+        # 只有不相同的单元才被视为有效的交叉位置
+        differ = A != B
+        relevant = differ if inverse is None else np.column_stack([np.any(differ[:, inverse == i], 1) for i in range(nUnits)])
+    else:
+        relevant = np.ones((half, nUnits), dtype = bool)
+    lengths = np.sum(relevant, 1)
+    if Npt == 0: # 洗牌交叉等价于在随机打乱后的位置上进行单点交叉
+        sizes = _randomPoints(lengths, 1)[:, 0]
+        mask = _randomSubset(relevant, np.where(lengths > 1, sizes, 0))
+    else:
+        coord = np.cumsum(relevant, 1) - 1 # 每个单元在有效交叉位置中的序号
+        points = _randomPoints(lengths, Npt)
+        if Npt == 1:
+            mask = coord >= points[:, [0]]
+        else:
+            mask = (coord >= points[:, [0]]) & (coord < points[:, [1]])
+        mask &= relevant
+    mask = _expand(mask & _pairFlag(half, XOVR), inverse)
+    return _assemble(np.where(mask, B, A), np.where(mask, A, B), rest, Half)
+
+def xovsp(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovsp : function - 单点交叉
+
+语法:
+    NewChrom = xovsp(OldChrom)
+    NewChrom = xovsp(OldChrom, XOVR)
+    NewChrom = xovsp(OldChrom, XOVR, Half)
+    NewChrom = xovsp(OldChrom, XOVR, Half, GeneID)
+    NewChrom = xovsp(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    调用xovmp实现单点交叉。params4为无用参数。
+
+"""
+
+    return xovmp(OldChrom, XOVR, 1, False, Half, GeneID)
+
+def xovdp(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovdp : function - 两点交叉
+
+语法:
+    NewChrom = xovdp(OldChrom)
+    NewChrom = xovdp(OldChrom, XOVR)
+    NewChrom = xovdp(OldChrom, XOVR, Half)
+    NewChrom = xovdp(OldChrom, XOVR, Half, GeneID)
+    NewChrom = xovdp(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    调用xovmp实现两点交叉。params4为无用参数。
+
+"""
+
+    return xovmp(OldChrom, XOVR, 2, False, Half, GeneID)
+
+def xovsh(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovsh : function - 洗牌交叉
+
+语法:
+    NewChrom = xovsh(OldChrom)
+    NewChrom = xovsh(OldChrom, XOVR)
+    NewChrom = xovsh(OldChrom, XOVR, Half)
+    NewChrom = xovsh(OldChrom, XOVR, Half, GeneID)
+    NewChrom = xovsh(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    调用xovmp实现洗牌交叉。params4为无用参数。
+
+"""
+
+    return xovmp(OldChrom, XOVR, 0, False, Half, GeneID)
+
+def xovud(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovud : function - 均匀分布交叉(Uniform Distribution Crossover)
+
+语法:
+    NewChrom =  xovud(OldChrom)
+    NewChrom =  xovud(OldChrom, XOVR)
+    NewChrom =  xovud(OldChrom, XOVR, Half)
+    NewChrom =  xovud(OldChrom, XOVR, Half, GeneID)
+    NewChrom =  xovud(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    每对个体以概率XOVR（默认为0.7）发生交叉，交叉时每个基因（或基因ID相同的整体）以0.5的概率互换。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    A, B, rest = _pair(OldChrom)
+    nUnits, inverse = _units(OldChrom.shape[1], GeneID)
+    mask = _expand((rng.rand(A.shape[0], nUnits) < 0.5) & _pairFlag(A.shape[0], XOVR), inverse)
+    return _assemble(np.where(mask, B, A), np.where(mask, A, B), rest, Half)
+
+def recdis(OldChrom, RecOpt = None, Half = None, GeneID = None, params4 = None):
+
+    """
+recdis : function - 离散重组
+
+语法:
+    NewChrom = recdis(OldChrom)
+    NewChrom = recdis(OldChrom, RecOpt)
+    NewChrom = recdis(OldChrom, RecOpt, Half)
+    NewChrom = recdis(OldChrom, RecOpt, Half, GeneID)
+    NewChrom = recdis(OldChrom, RecOpt, Half, GeneID, params4)
+
+描述:
+    每对个体以概率RecOpt（默认为0.7）发生重组，重组时子代的每个基因（或基因ID相同的整体）
+    等概率地独立来自两个父代之一。
+
+"""
+
+    RecOpt = 0.7 if RecOpt is None else RecOpt
+    A, B, rest = _pair(OldChrom)
+    half = A.shape[0]
+    nUnits, inverse = _units(OldChrom.shape[1], GeneID)
+    flag = _pairFlag(half, RecOpt)
+    maskA = _expand((rng.rand(half, nUnits) < 0.5) & flag, inverse)
+    maskB = _expand((rng.rand(half, nUnits) < 0.5) & flag, inverse)
+    return _assemble(np.where(maskA, B, A), np.where(maskB, A, B), rest, Half)
+
+def xovbd(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovbd : function - 二项式分布交叉(Binomial Distribution Crossover)
+
+语法:
+    NewChrom =  xovbd(OldChrom)
+    NewChrom =  xovbd(OldChrom, XOVR)
+    NewChrom =  xovbd(OldChrom, XOVR, Half)
+    NewChrom =  xovbd(OldChrom, XOVR, Half, GeneID)
+    NewChrom =  xovbd(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    即差分进化中的二项式交叉：每个基因（或基因ID相同的整体）以概率XOVR（默认为0.7）互换，
+    并且每对个体中一定有一个随机的基因发生互换。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    A, B, rest = _pair(OldChrom)
+    half = A.shape[0]
+    nUnits, inverse = _units(OldChrom.shape[1], GeneID)
+    mask = rng.rand(half, nUnits) < XOVR
+    mask[np.arange(half), rng.randint(0, nUnits, half)] = True
+    mask = _expand(mask, inverse)
+    return _assemble(np.where(mask, B, A), np.where(mask, A, B), rest, Half)
+
+def _expLengths(rows, nUnits, XOVR):
+    # 指数交叉中互换的基因个数服从截断的几何分布：至少为1，每多互换一个基因的概率为XOVR
+    if XOVR >= 1:
+        return np.full(rows, nUnits)
+    return np.minimum(rng.geometric(1 - XOVR, rows), nUnits)
+
+def xovexp(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovexp : function - 指数交叉(Exponential Crossover)
+
+语法:
+    NewChrom =  xovexp(OldChrom)
+    NewChrom =  xovexp(OldChrom, XOVR)
+    NewChrom =  xovexp(OldChrom, XOVR, Half)
+    NewChrom =  xovexp(OldChrom, XOVR, Half, GeneID)
+    NewChrom =  xovexp(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    从随机位置开始，循环地互换连续的L个基因（或基因ID相同的整体），
+    L至少为1，且每多互换一个基因的概率为XOVR（默认为0.7）。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    A, B, rest = _pair(OldChrom)
+    half = A.shape[0]
+    nUnits, inverse = _units(OldChrom.shape[1], GeneID)
+    starts = rng.randint(0, nUnits, (half, 1))
+    mask = (np.arange(nUnits) - starts) % nUnits < _expLengths(half, nUnits, XOVR).reshape(-1, 1)
+    mask = _expand(mask, inverse)
+    return _assemble(np.where(mask, B, A), np.where(mask, A, B), rest, Half)
+
+def xovsec(OldChrom, XOVR = None, Half = None, GeneID = None, params4 = None):
+
+    """
+xovsec : function - 洗牌指数交叉(Shuffled Exponential Crossover)
+
+语法:
+    NewChrom =  xovsec(OldChrom)
+    NewChrom =  xovsec(OldChrom, XOVR)
+    NewChrom =  xovsec(OldChrom, XOVR, Half)
+    NewChrom =  xovsec(OldChrom, XOVR, Half, GeneID)
+    NewChrom =  xovsec(OldChrom, XOVR, Half, GeneID, params4)
+
+描述:
+    先随机打乱基因的位置再进行指数交叉，即随机互换L个基因（或基因ID相同的整体），L的分布与xovexp相同。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    A, B, rest = _pair(OldChrom)
+    half = A.shape[0]
+    nUnits, inverse = _units(OldChrom.shape[1], GeneID)
+    mask = _randomSubset(np.ones((half, nUnits), dtype = bool), _expLengths(half, nUnits, XOVR))
+    mask = _expand(mask, inverse)
+    return _assemble(np.where(mask, B, A), np.where(mask, A, B), rest, Half)
+
+def recint(OldChrom, RecOpt = None, Half = None, params3 = None, params4 = None):
+
+    """
+recint : function - 中间重组
+
+语法:
+    NewChrom = recint(OldChrom)
+    NewChrom = recint(OldChrom, RecOpt)
+    NewChrom = recint(OldChrom, RecOpt, Half)
+    NewChrom = recint(OldChrom, RecOpt, Half, params3)
+    NewChrom = recint(OldChrom, RecOpt, Half, params3, params4)
+
+描述:
+    每对个体以概率RecOpt（默认为0.7）发生重组：NewChrom = OldChrom1 + a * (OldChrom2 - OldChrom1)，
+    a为[-0.25, 1.25]之间的随机数组成的与染色体等长的向量，每个子代的a都是不同的。
+
+"""
+
+    RecOpt = 0.7 if RecOpt is None else RecOpt
+    A, B, rest = _pair(OldChrom)
+    flag = _pairFlag(A.shape[0], RecOpt)
+    alphaA = np.where(flag, rng.rand(*A.shape) * 1.5 - 0.25, 0)
+    alphaB = np.where(flag, rng.rand(*A.shape) * 1.5 - 0.25, 0)
+    return _assemble(A + alphaA * (B - A), B + alphaB * (A - B), rest, Half)
+
+def reclin(OldChrom, RecOpt = None, Half = None, params3 = None, params4 = None):
+
+    """
+reclin : function - 线性重组
+
+语法:
+    NewChrom = reclin(OldChrom)
+    NewChrom = reclin(OldChrom, RecOpt)
+    NewChrom = reclin(OldChrom, RecOpt, Half)
+    NewChrom = reclin(OldChrom, RecOpt, Half, params3)
+    NewChrom = reclin(OldChrom, RecOpt, Half, params3, params4)
+
+描述:
+    与recint相同，但每个子代只使用一个[-0.25, 1.25]之间的随机数a。
+
+"""
+
+    RecOpt = 0.7 if RecOpt is None else RecOpt
+    A, B, rest = _pair(OldChrom)
+    flag = _pairFlag(A.shape[0], RecOpt)
+    alphaA = np.where(flag, rng.rand(A.shape[0], 1) * 1.5 - 0.25, 0)
+    alphaB = np.where(flag, rng.rand(A.shape[0], 1) * 1.5 - 0.25, 0)
+    return _assemble(A + alphaA * (B - A), B + alphaB * (A - B), rest, Half)
+
+def recndx(OldChrom, XOVR = None, Half = None, A = None, params4 = None):
+
+    """
+recndx : function - 正态分布交叉(Normal Distribution Crossover)
+
+语法:
+    NewChrom = recndx(OldChrom)
+    NewChrom = recndx(OldChrom, XOVR)
+    NewChrom = recndx(OldChrom, XOVR, Half)
+    NewChrom = recndx(OldChrom, XOVR, Half, A)
+    NewChrom = recndx(OldChrom, XOVR, Half, A, params4)
+
+描述:
+    每对个体以概率XOVR（默认为0.7）发生交叉：
+    NewChrom1,2 = (OldChrom1 + OldChrom2) / 2 ± A * |N(0, 1)| * (OldChrom1 - OldChrom2) / 2，
+    A默认为1.4826，此时交叉的开发概率为0.5。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    A = 1.4826 if A is None else A
+    P1, P2, rest = _pair(OldChrom)
+    flag = _pairFlag(P1.shape[0], XOVR)
+    middle = (P1 + P2) / 2
+    delta = A * np.abs(rng.randn(*P1.shape)) * (P1 - P2) / 2
+    return _assemble(np.where(flag, middle + delta, P1), np.where(flag, middle - delta, P2), rest, Half)
+
+def recsbx(OldChrom, XOVR = None, Half = None, n = None, params4 = None):
+
+    """
+recsbx : function - 模拟二进制交叉(Simulated Binary Crossover)
+
+语法:
+    NewChrom =  recsbx(OldChrom)
+    NewChrom =  recsbx(OldChrom, XOVR)
+    NewChrom =  recsbx(OldChrom, XOVR, Half)
+    NewChrom =  recsbx(OldChrom, XOVR, Half, n)
+    NewChrom =  recsbx(OldChrom, XOVR, Half, n, params4)
+
+描述:
+    每对个体以概率XOVR（默认为0.7）发生交叉，n为分布指数（默认为20），n越大，交叉结果越接近双亲。
+    与Deb的实现一致，每个基因在两个子代之间的分配是随机的。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    n = 20 if n is None or np.isnan(n) else n
+    A, B, rest = _pair(OldChrom)
+    flag = _pairFlag(A.shape[0], XOVR)
+    u = rng.rand(*A.shape)
+    beta = np.where(u <= 0.5, (2 * u) ** (1 / (n + 1)), (1 / (2 * (1 - u))) ** (1 / (n + 1)))
+    beta *= np.where(rng.rand(*A.shape) < 0.5, -1, 1) # 每个基因以0.5的概率互换两个子代的取值
+    beta = np.where(flag, beta, 1)
+    return _assemble(0.5 * ((1 + beta) * A + (1 - beta) * B), 0.5 * ((1 - beta) * A + (1 + beta) * B), rest, Half)
+
+def _segments(rows, Lind):
+    # 为每一行随机生成一个非空的交叉片段[p1, p2)，返回片段标记矩阵
+    p1 = rng.randint(0, Lind, (rows, 1))
+    p2 = rng.randint(0, Lind, (rows, 1))
+    low, high = np.minimum(p1, p2), np.maximum(p1, p2) + 1
+    cols = np.arange(Lind)
+    return (cols >= low) & (cols < high)
+
+def _table(values, mask, offset, size):
+    # 构造成员表：table[i, v - offset]为True表示第i行中mask为True的位置上含有元素v
+    table = np.zeros((values.shape[0], size), dtype = bool)
+    rows = np.repeat(np.arange(values.shape[0]), values.shape[1]).reshape(values.shape)
+    table[rows[mask], values[mask] - offset] = True
+    return table
+
+def xovox(OldChrom, XOVR = None, Half = None, params3 = None, params4 = None):
+
+    """
+xovox : function - 顺序交叉(Order Crossover: OX)
+
+语法:
+    NewChrom =  xovox(OldChrom)
+    NewChrom =  xovox(OldChrom, XOVR)
+    NewChrom =  xovox(OldChrom, XOVR, Half)
+    NewChrom =  xovox(OldChrom, XOVR, Half, params3)
+    NewChrom =  xovox(OldChrom, XOVR, Half, params3, params4)
+
+描述:
+    每对个体以概率XOVR（默认为0.7）发生交叉：子代保留一个父代的一个随机片段，
+    其余位置按另一个父代中的顺序依次填入片段中没有的元素。要求每对父代是同一组元素的排列。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    A, B, rest = _pair(OldChrom)
+    half, Lind = A.shape
+    if half == 0:
+        return _assemble(A, B, rest, Half)
+    offset = int(min(np.min(A), np.min(B)))
+    size = int(max(np.max(A), np.max(B))) - offset + 1
+    keep = _segments(half, Lind) | ~_pairFlag(half, XOVR) # 不发生交叉的个体保留全部元素
+    def child(P, Q):
+        # 保留P在片段上的元素，其余位置按Q中的顺序填入
+        New = P.copy()
+        inSeg = _table(P, keep, offset, size)
+        rows = np.repeat(np.arange(half), Lind).reshape(half, Lind)
+        New[~keep] = Q[~inSeg[rows, Q - offset]] # 每一行中两者的个数相等，因此按行展开后恰好一一对应
+        return New
+    return _assemble(child(A, B), child(B, A), rest, Half)
+
+def xovpmx(OldChrom, XOVR = None, Half = None, params3 = None, params4 = None):
+
+    """
+xovpmx : function - 部分匹配交叉(Partially Mapped Crossover: PMX)
+
+语法:
+    NewChrom = xovpmx(OldChrom)
+    NewChrom = xovpmx(OldChrom, XOVR)
+    NewChrom = xovpmx(OldChrom, XOVR, Half)
+    NewChrom = xovpmx(OldChrom, XOVR, Half, params3)
+    NewChrom = xovpmx(OldChrom, XOVR, Half, params3, params4)
+
+描述:
+    奇数行和它的下一个行即偶数行配对（若个体数是奇数，则最后一个个体不进行交叉），每对个体以概率XOVR（默认为0.7）发生交叉：
+    子代在随机片段上取另一个父代的元素，片段外与之冲突的元素按片段上的映射关系反复替换，直到不再冲突。
+    Half为True时只保留每对交叉结果中的第一条染色体。
+
+"""
+
+    XOVR = 0.7 if XOVR is None else XOVR
+    N, Lind = OldChrom.shape
+    half = N // 2
+    A, B = OldChrom[0 : 2 * half : 2], OldChrom[1 : 2 * half : 2]
+    if half == 0:
+        return OldChrom.copy() if not Half else OldChrom[:0].copy()
+    offset = int(np.min(OldChrom))
+    size = int(np.max(OldChrom)) - offset + 1
+    seg = _segments(half, Lind) & _pairFlag(half, XOVR)
+    rows = np.repeat(np.arange(half), Lind).reshape(half, Lind)
+    def child(P, Q):
+        # 片段上取Q的元素，片段外的冲突元素通过映射Q[j] -> P[j]替换
+        New = np.where(seg, Q, P)
+        mapping = np.zeros((half, size), dtype = OldChrom.dtype)
+        mapping[rows[seg], Q[seg] - offset] = P[seg]
+        inSeg = _table(Q, seg, offset, size)
+        conflict = ~seg & inSeg[rows, New - offset]
+        while np.any(conflict):
+            New[conflict] = mapping[rows[conflict], New[conflict] - offset]
+            conflict = ~seg & inSeg[rows, New - offset]
+        return New
+    NewA, NewB = child(A, B), child(B, A)
+    if Half:
+        return NewA
+    NewChrom = OldChrom.copy()
+    NewChrom[0 : 2 * half : 2] = NewA
+    NewChrom[1 : 2 * half : 2] = NewB
+    return NewChrom
+
+_RECOMBINERS = {'xovmp' : xovmp, 'xovdp' : xovdp, 'xovsp' : xovsp, 'xovsh' : xovsh, 'xovud' : xovud,
+                'xovbd' : xovbd, 'xovexp' : xovexp, 'xovsec' : xovsec, 'recdis' : recdis, 'recint' : recint,
+                'reclin' : reclin, 'recndx' : recndx, 'recsbx' : recsbx, 'xovox' : xovox, 'xovpmx' : xovpmx}
+
+def recombin(REC_F, Chrom, RecOpt = None, params2 = None, params3 = None, params4 = None):
+
+    """
+recombin : function - 实现个体染色体的重组(高级重组函数)
+
+语法:
+    NewChrom = recombin(REC_F, Chrom)
+    NewChrom = recombin(REC_F, Chrom, RecOpt)
+    NewChrom = recombin(REC_F, Chrom, RecOpt, params2)
+    NewChrom = recombin(REC_F, Chrom, RecOpt, params2, params3)
+    NewChrom = recombin(REC_F, Chrom, RecOpt, params2, params3, params4)
+
+描述:
+    调用名为REC_F的低级重组函数对种群染色体进行重组，RecOpt为重组概率（默认为0.7），
+    params2, params3, params4按顺序传入低级重组函数。
+
+"""
+
+    if REC_F not in _RECOMBINERS:
+        raise RuntimeError('error in recombin: No such recombination operator: ' + str(REC_F) + '. (没有名为' + str(REC_F) + '的重组算子。)')
+    return _RECOMBINERS[REC_F](Chrom, RecOpt, params2, params3, params4)
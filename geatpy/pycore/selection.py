@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+selection.py - 纯Numpy实现的选择算子
+
+包含: selecting, dup, ecs, etour, otos, rcs, rps, rws, sus, tour, urs
+
+低级选择算子均返回被选择个体的索引行向量，可通过OldChrom[NewChrIx, :]得到被选择的个体。
+
+"""
+
+import numpy as np
+from geatpy import rng
+
+def _fitness(FitnV):
+    # 把适应度列向量转化为一维数组
+    FitnV = np.asarray(FitnV)
+    return FitnV.reshape(FitnV.shape[0], -1)[:, 0]
+
+def selecting(SEL_F, FitnV, GGAP = None):
+
+    """
+selecting - 高级选择函数
+
+语法:
+    NewChrIx = selecting(SEL_F, FitnV)
+    NewChrIx = selecting(SEL_F, FitnV, GGAP)
+    NewChrIx = selecting(SEL_F, FitnV, NSel)
+
+描述:
+    调用名为SEL_F的低级选择函数对种群个体进行选择。
+    第三个参数在[0, 1]之间时为代沟GGAP，表示被选择的个体在种群中的占比（默认为1），
+    为0时只选择1个个体；大于1时表示要选择的个体数NSel（向上取整）。
+
+"""
+
+    if SEL_F not in _SELECTORS:
+        raise RuntimeError('error in selecting: No such selection operator: ' + str(SEL_F) + '. (没有名为' + str(SEL_F) + '的选择算子。)')
+    Nind = np.asarray(FitnV).shape[0]
+    if GGAP is None:
+        NSel = Nind
+    elif GGAP == 0:
+        NSel = 1
+    elif GGAP <= 1:
+        NSel = int(np.ceil(Nind * GGAP))
+    else:
+        NSel = int(np.ceil(GGAP))
+    return _SELECTORS[SEL_F](FitnV, NSel)
+
+def dup(FitnV, Nsel):
+
+    """
+dup : function - (Duplication)基于适应度排序的直接复制选择
+
+语法:
+    NewChrIx = dup(FitnV, Nsel)
+
+描述:
+    按适应度从大到小依次选择个体，若个体总数小于Nsel，则重新从大到小选择剩余的个体，以此类推。
+
+"""
+
+    order = np.argsort(-_fitness(FitnV), kind = 'mergesort')
+    return np.resize(order, Nsel)
+
+def ecs(FitnV, Nsel):
+
+    """
+ecs : function - (Elite Copy Selection)精英复制选择
+
+语法:
+    NewChrIx = ecs(FitnV, Nsel)
+
+描述:
+    返回Nsel个适应度最高的个体的索引。
+
+"""
+
+    return np.full(Nsel, np.argmax(_fitness(FitnV)))
+
+def tour(FitnV, Nsel, Tour = 2):
+
+    """
+tour : function - (Tournament)锦标赛选择
+
+语法:
+    NewChrIx = tour(FitnV, Nsel)
+    NewChrIx = tour(FitnV, Nsel, Tour)
+
+描述:
+    每轮随机选取Tour个（默认为2，超出[1, Nind]范围时也取2）个体参加锦标赛，选出其中适应度最高的个体。
+
+"""
+
+    FitnV = _fitness(FitnV)
+    Nind = len(FitnV)
+    if Tour is None or Tour < 1 or Tour > Nind:
+        Tour = 2
+    candidates = rng.randint(0, Nind, (Nsel, Tour))
+    return candidates[np.arange(Nsel), np.argmax(FitnV[candidates], 1)]
+
+def etour(FitnV, Nsel, Tour = 2):
+
+    """
+etour : function - 精英保留锦标赛选择(Elite-Tour)
+
+语法:
+    NewChrIx = etour(FitnV, Nsel)
+    NewChrIx = etour(FitnV, Nsel, Tour)
+
+描述:
+    与tour相同，但最优个体一定会被放入某一轮锦标赛中，因此一定会被选中。
+
+"""
+
+    FitnV = _fitness(FitnV)
+    Nind = len(FitnV)
+    if Tour is None or Tour < 1 or Tour > Nind:
+        Tour = 2
+    candidates = rng.randint(0, Nind, (Nsel, Tour))
+    candidates[rng.randint(Nsel), 0] = np.argmax(FitnV) # 让最优个体参加随机的一轮锦标赛
+    return candidates[np.arange(Nsel), np.argmax(FitnV[candidates], 1)]
+
+def otos(FitnV, Nsel):
+
+    """
+otos : function - (One-to-One Survivor Selection)一对一生存者选择
+
+语法:
+    NewChrIx = otos(FitnV, Nsel)
+
+描述:
+    把种群按顺序划分为Nind / Nsel个规模为Nsel的子种群，第i个被选择的个体是各子种群的第i个个体中适应度最高者，
+    适应度相等时选择排在前面的子种群中的个体。
+
+"""
+
+    FitnV = _fitness(FitnV)
+    Nind = len(FitnV)
+    if Nind % Nsel != 0:
+        raise RuntimeError('error in otos: Nsel must divide the population size. (Nsel必须能整除种群规模。)')
+    return np.argmax(FitnV.reshape(Nind // Nsel, Nsel), 0) * Nsel + np.arange(Nsel)
+
+def rcs(FitnV, params1 = None):
+
+    """
+rcs : function - (Random Compensation Selection)随机补偿选择
+
+语法:
+    NewChrIx = rcs(FitnV)
+    NewChrIx = rcs(FitnV, params1)
+
+描述:
+    返回(i + rg) % Nind，其中rg为随机补偿的整数。params1为无用参数。
+
+"""
+
+    Nind = np.asarray(FitnV).shape[0]
+    return (np.arange(Nind) + rng.randint(1, Nind) if Nind > 1 else np.arange(Nind)) % max(Nind, 1)
+
+def rps(FitnV, params1 = None):
+
+    """
+rps : function - (Random Permutation Selection)随机排列选择
+
+语法:
+    NewChrIx = rps(FitnV)
+    NewChrIx = rps(FitnV, params1)
+
+描述:
+    返回种群个体索引的一个随机排列。params1为无用参数。
+
+"""
+
+    return rng.permutation(np.asarray(FitnV).shape[0])
+
+def rws(FitnV, Nsel):
+
+    """
+rws : function - (Roulette Wheel Selection)轮盘赌选择
+
+语法:
+    NewChrIx = rws(FitnV, Nsel)
+
+描述:
+    每个个体被选中的概率与其适应度成正比，所有个体的适应度均为0时等概率选择。
+
+"""
+
+    cumFitnV = np.cumsum(_fitness(FitnV))
+    if cumFitnV[-1] <= 0:
+        return rng.randint(0, len(cumFitnV), Nsel)
+    return np.searchsorted(cumFitnV, rng.rand(Nsel) * cumFitnV[-1], 'right')
+
+def sus(FitnV, Nsel):
+
+    """
+sus : function - (Stochastic Universal Sampling)随机抽样选择
+
+语法:
+    NewChrIx = sus(FitnV, Nsel)
+
+描述:
+    在轮盘上放置Nsel个等距的指针，只转动一次轮盘，被指针指到的个体即被选中，最后打乱被选个体的顺序。
+
+"""
+
+    cumFitnV = np.cumsum(_fitness(FitnV))
+    if cumFitnV[-1] <= 0:
+        return rng.randint(0, len(cumFitnV), Nsel)
+    pointers = (rng.rand() + np.arange(Nsel)) * cumFitnV[-1] / Nsel
+    return rng.permutation(np.searchsorted(cumFitnV, pointers, 'right'))
+
+def urs(FitnV, Nsel):
+
+    """
+urs : function - (Uncommitted Random Selection)无约束随机选择
+
+语法:
+    NewChrIx = urs(FitnV, Nsel)
+
+描述:
+    等概率地随机选择Nsel个个体。
+
+"""
+
+    return rng.randint(0, np.asarray(FitnV).shape[0], Nsel)
+
+_SELECTORS = {'dup' : dup, 'ecs' : ecs, 'etour' : etour, 'otos' : otos, 'rcs' : rcs,
+              'rps' : rps, 'rws' : rws, 'sus' : sus, 'tour' : tour, 'urs' : urs}
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+rng.py - 纯Numpy内核及种群、算法模板所用的随机数来源
+
+描述:
+    纯Numpy内核的各算子、Population.shuffle()、RVEA-RES的参考点以及蒙特卡洛法超体积估计都通过本模块的函数获取随机数，
+    它们从“当前随机数生成器”中取数。当前随机数生成器默认为Numpy的全局随机数状态（即np.random.seed()所设置的状态），
+    此时的行为与直接调用np.random.rand()等函数完全相同；
+    算法模板设置了seed或rng属性时，会在initialization()中把自己的np.random.Generator设为当前随机数生成器，
+    并在run()返回（或出错、被中断）时恢复原来的生成器，因此同一个种子总能得到相同的结果，而与其他代码是否使用np.random无关。
+    当前随机数生成器是进程内的全局状态：同一进程中多个线程同时运行的算法模板会共用它，此时结果不可复现，应改用多进程。
+    岛屿模型、批量实验等并行场景中，每个进程的算法模板使用各自独立的随机数流（详见IslandModel类与Experiment类）。
+    注意：编译版内核的算子使用其自身的随机数生成器，不受本模块控制。
+
+函数:
+    getRng()            : 返回当前随机数生成器（np.random.Generator或np.random.RandomState对象）。
+    setRng(rng)         : 把rng设为当前随机数生成器，rng为None时恢复为Numpy的全局随机数状态，返回原来的生成器。
+    rand(*shape)        : 与np.random.rand相同，返回[0, 1)上均匀分布的随机数。
+    randn(*shape)       : 与np.random.randn相同，返回标准正态分布的随机数。
+    randint(low, high = None, size = None) : 与np.random.randint相同，返回[low, high)上的随机整数。
+    choice(a, size = None, replace = True) : 与np.random.choice相同。
+    permutation(x)      : 与np.random.permutation相同。
+    geometric(p, size = None) : 与np.random.geometric相同。
+
+"""
+
+import numpy as np
+
+_legacy = np.random.mtrand._rand # Numpy的全局随机数状态，np.random.rand()等函数使用的就是它
+_current = _legacy
+
+def getRng():
+    return _current
+
+def setRng(rng):
+    global _current
+    previous = _current
+    _current = _legacy if rng is None else rng
+    return previous
+
+def rand(*shape):
+    return _current.random(shape if len(shape) > 0 else None)
+
+def randn(*shape):
+    return _current.standard_normal(shape if len(shape) > 0 else None)
+
+def randint(low, high = None, size = None):
+    if isinstance(_current, np.random.RandomState):
+        return _current.randint(low, high, size)
+    return _current.integers(low, high, size)
+
+def choice(a, size = None, replace = True):
+    return _current.choice(a, size, replace)
+
+def permutation(x):
+    return _current.permutation(x)
+
+def geometric(p, size = None):
+    return _current.geometric(p, size)
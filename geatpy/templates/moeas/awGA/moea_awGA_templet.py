@@ -62,31 +62,50 @@ moea_awGA_templet : class - 多目标进化优化awGA算法模板
             MAXSIZE = 2 * NIND
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
-        if population.Chrom is None:
-            population.initChrom(NIND) # 初始化种群染色体矩阵（内含解码，详见Population类的源码）
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        NDSet = updateNDSet(population, problem.maxormins, MAXSIZE) # 计算适应度和得到全局非支配种群
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population, [archive] = resumed
+            NDSet = archive.NDSet
+        else:
+            if population.Chrom is None:
+                population.initChrom(NIND) # 初始化种群染色体矩阵（内含解码，详见Population类的源码）
+            self.call_aimFunc(population) # 计算种群的目标函数值
+            archive = ea.ParetoArchive(problem.maxormins, MAXSIZE, False) # 全局非支配个体存档（详见ParetoArchive类），保留目标函数值相同的个体
+            NDSet = updateNDSet(population, archive) # 计算适应度和得到全局非支配种群
         #===========================开始进化============================
-        while self.terminated(population) == False:
+        while self.terminated(population, archive) == False:
             uniChrom = np.unique(NDSet.Chrom, axis = 0)
             repRate = 1 - uniChrom.shape[0] / NDSet.sizes # 计算NDSet中的重复率
             # 选择个体去进化形成子代
-            offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
+            offspring = population[ea.selecting(self.selFunc, population.FitnV, self.candidateNum(NIND))] # 设置了surrogate时生成更多的候选子代
+            self.tick('selection')
             offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) #重组
+            self.tick('recombination')
             offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
             if population.Encoding != 'BG' and repRate > 0.1:
                 offspring.Chrom = ea.mutate('mutgau', offspring.Encoding, offspring.Chrom, offspring.Field, self.pm, False, 3) # 高斯变异，对标准差放大3倍。
+            self.tick('mutation')
             offspring.Phen = offspring.decoding() # 染色体解码
-            self.problem.aimFunc(offspring) # 求进化后个体的目标函数值
-            self.evalsNum += offspring.sizes # 更新评价次数
+            self.tick('decoding')
+            offspring = self.prescreen(offspring, NIND) # 用代理模型筛选出最有希望的子代（详见Algorithm类的prescreen()）
+            self.call_aimFunc(offspring) # 求进化后个体的目标函数值
+            self.tick('evaluation')
             # 父代种群和育种种群合并
-            population = population + offspring
-            NDSet = updateNDSet(population, problem.maxormins, MAXSIZE, NDSet) # 计算合并种群的适应度及更新NDSet
+            population = self.arena.merge(population, offspring) # 在种群缓冲区中合并，避免重新分配内存（详见PopArena类）
+            NDSet = updateNDSet(population, archive) # 计算合并种群的适应度及增量地更新NDSet
+            self.tick('fitness')
             # 保留个体到下一代
-            population = population[ea.selecting('dup', population.FitnV, NIND)] # 选择，保留NIND个个体
+            population = self.arena.select(population, ea.selecting('dup', population.FitnV, NIND)) # 选择，保留NIND个个体
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
         NDSet = NDSet[np.where(np.all(NDSet.CV <= 0, 1))[0]] # 最后要彻底排除非可行解
         self.passTime += time.time() - self.timeSlot # 更新用时记录
+        self.problem.closePool() # 释放并行评价所用的进程池
+        self.closePlotSink() # 关闭绘图接收器
+        ea.setRng(self.previousRng) # 恢复原来的随机数生成器
+        if self.hooks:
+            self.fire('finish', NDSet) # 触发“结束”事件
         #=========================绘图及输出结果=========================
         if self.drawing != 0:
             ea.moeaplot(NDSet.ObjV, 'Pareto Front', True)
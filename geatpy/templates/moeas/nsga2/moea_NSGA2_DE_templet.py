@@ -40,7 +40,7 @@ moea_NSGA2_DE_templet : class - 基于NSGA-II-DE算法的多目标进化算法
     def __init__(self, problem, population):
         ea.MoeaAlgorithm.__init__(self, problem, population) # 先调用父类构造方法
         self.name = 'NSGA2-DE'
-        self.ndSort = ea.ndsortESS # 设置非支配排序算子
+        self.ndSort = ea.ndsortSweep # 设置非支配排序算子（双目标和三目标时采用扫描法，详见ndsortSweep）
         self.selFunc = 'tour' # 选择方式，采用锦标赛选择
         if population.Encoding == 'RI':
             self.mutFunc = 'mutde' # 差分变异
@@ -62,13 +62,14 @@ moea_NSGA2_DE_templet : class - 基于NSGA-II-DE算法的多目标进化算法
         """
         
         # 父子两代合并
-        population = population + offspring
+        population = self.arena.merge(population, offspring) # 在种群缓冲区中合并，避免重新分配内存（详见PopArena类）
         # 选择个体保留到下一代
         [levels, criLevel] = self.ndSort(self.problem.maxormins * population.ObjV, NUM, None, population.CV) # 对NUM个个体进行非支配分层
+        self.tick('ndsort')
         dis = ea.crowdis(population.ObjV, levels) # 计算拥挤距离
         population.FitnV[:, 0] = np.argsort(np.lexsort(np.array([dis, -levels])), kind = 'mergesort') # 计算适应度
         chooseFlag = ea.selecting('dup', population.FitnV, NUM) # 调用低级选择算子dup进行基于适应度排序的选择，保留NUM个个体
-        return population[chooseFlag]
+        return self.arena.select(population, chooseFlag)
     
     def run(self):
         #==========================初始化配置===========================
@@ -76,24 +77,34 @@ moea_NSGA2_DE_templet : class - 基于NSGA-II-DE算法的多目标进化算法
         NIND = population.sizes
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
-        if population.Chrom is None:
-            population.initChrom() # 初始化种群染色体矩阵（内含解码，详见Population类的源码）
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None:
+                population.initChrom() # 初始化种群染色体矩阵（内含解码，详见Population类的源码）
+            self.call_aimFunc(population) # 计算种群的目标函数值
         #===========================开始进化============================
         while self.terminated(population) == False:
             # 进行差分进化操作
             r0 = ea.selecting(self.selFunc, population.FitnV, NIND) # 得到基向量索引
+            self.tick('selection')
             offspring = population.copy() # 存储子代种群
             offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, r0, self.F, 1) # 差分变异
-            tempPop = population + offspring # 当代种群个体与变异个体进行合并（为的是后面用于重组）
+            self.tick('mutation')
+            tempPop = self.arena.merge(population, offspring) # 当代种群个体与变异个体进行合并（为的是后面用于重组）
             offspring.Chrom = ea.recombin(self.recFunc, tempPop.Chrom, self.pc, True) # 重组
+            self.tick('recombination')
             # 求进化后个体的目标函数值
             offspring.Phen = offspring.decoding() # 染色体解码
-            self.problem.aimFunc(offspring)
-            self.evalsNum += offspring.sizes # 更新评价次数
+            self.tick('decoding')
+            self.call_aimFunc(offspring)
+            self.tick('evaluation')
             # 重插入生成新一代种群
             population = self.reinsertion(population, offspring, NIND)
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
         
         return self.finishing(population) # 调用finishing完成后续工作并返回结果
 
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import geatpy as ea # 导入geatpy库
+from sys import path as paths
+from os import path
+paths.append(path.split(path.split(path.realpath(__file__))[0])[0])
+
+class moea_asyncNSGA2_templet(ea.MoeaAlgorithm):
+
+    """
+moea_asyncNSGA2_templet : class - 异步稳态NSGA-II算法模板
+
+算法描述:
+    本模板实现的是异步评价的稳态NSGA-II。与每一代生成并评价NIND个子代的moea_NSGA2_templet不同，
+    本模板通过异步评价器（详见AsyncEvaluator类）始终让poolSize个子代在进程池中同时评价，
+    每得到一个评价结果，就立即把该子代插入种群，再生成一个新的子代提交评价，因此各进程不必等待最慢的个体。算法流程如下：
+    1) 根据编码规则初始化N个个体的种群，并行评价后进行非支配排序。
+    2) 按非支配层级和拥挤距离进行锦标赛选择，经交叉、变异生成子代，提交评价，直到有poolSize个子代正在评价。
+    3) 取回最先评价完成的子代，按增量的方式更新非支配层级（算法详见参考文献[2]）：
+       子代进入第一个不含支配它的个体的层，被它支配的该层个体及其在后面各层引起连锁反应的个体依次下移一层。
+       然后删除最后一层中拥挤距离最小的个体（可能就是该子代本身），使种群规模保持为N。
+    4) 生成一个新的子代提交评价，回到第3步。
+    每插入N个子代记为一代，此时进行统计分析、保存检查点并判断是否终止进化。
+    进化结束时，仍在评价中的子代会在评价完成后插入种群。
+    由于不需要对整个种群重新进行非支配排序，插入一个子代的时间复杂度为O(MN)（M为目标数），
+    当个体的评价用时相差很大时，其评价次数/秒与进程利用率都明显高于代际模板。
+    本模板不使用evalCache，也不会在检查点中保存正在评价的子代，从检查点恢复时会重新生成子代。
+    进化结束后，utilization属性为进程池的利用率（各进程调用aimFunc的用时之和 / (poolSize * 异步进化阶段的用时)），
+    evalsPerSec属性为平均每秒的评价次数。
+
+模板使用注意:
+    本模板调用的目标函数形如：aimFunc(pop),
+    其中pop为Population类的对象，代表一个种群，
+    pop对象的Phen属性（即种群染色体的表现型）等价于种群所有个体的决策变量组成的矩阵，
+    该函数根据该Phen计算得到种群所有个体的目标函数值组成的矩阵，并将其赋值给pop对象的ObjV属性。
+    若有约束条件，则在计算违反约束程度矩阵CV后赋值给pop对象的CV属性（详见Geatpy数据结构）。
+    该函数不返回任何的返回值，求得的目标函数值保存在种群对象的ObjV属性中，
+                          违反约束程度矩阵保存在种群对象的CV属性中。
+    例如：population为一个种群对象，则调用aimFunc(population)即可完成目标函数值的计算，
+         此时可通过population.ObjV得到求得的目标函数值，population.CV得到违反约束程度矩阵。
+    本模板每次只把一个个体交给aimFunc评价，poolSize为None或不大于1时在主进程中逐个评价。
+    若不符合上述规范，则请修改算法模板或自定义新算法模板。
+
+参考文献:
+    [1] Deb K , Pratap A , Agarwal S , et al. A fast and elitist multiobjective
+    genetic algorithm: NSGA-II[J]. IEEE Transactions on Evolutionary
+    Computation, 2002, 6(2):0-197.
+
+    [2] Li K , Deb K , Zhang Q , et al. Efficient non-domination level update
+    approach for steady-state evolutionary multiobjective optimization[J].
+    Department of Electtrical and Computer Engineering, Michigan State
+    University, East Lansing, USA, Tech. Rep. COIN Report, 2014 (2014014).
+
+    """
+
+    def __init__(self, problem, population):
+        ea.MoeaAlgorithm.__init__(self, problem, population) # 先调用父类构造方法
+        self.name = 'asyncNSGA2'
+        self.ndSort = ea.ndsortSweep # 设置非支配排序算子，只用于对初始种群进行排序
+        self.selFunc = 'tour' # 选择方式，采用锦标赛选择
+        if population.Encoding == 'P':
+            self.recFunc = 'xovpmx' # 部分匹配交叉
+            self.mutFunc = 'mutinv' # 染色体片段互换变异
+        elif population.Encoding == 'BG':
+            self.recFunc = 'xovud' # 均匀交叉
+            self.mutFunc = 'mutbin' # 二进制变异
+        elif population.Encoding == 'RI':
+            self.recFunc = 'recsbx' # 模拟二进制交叉
+            self.mutFunc = 'mutpolyn' # 多项式变异
+        else:
+            raise RuntimeError('编码方式必须为''BG''、''RI''或''P''.')
+        self.pc = 1 # 重组概率
+        self.pm = 1 # 整条染色体的变异概率
+        self.utilization = None # 进程池的利用率
+        self.evalsPerSec = None # 平均每秒的评价次数
+
+    def breed(self, population, levels):
+
+        """
+        描述:
+            按非支配层级和拥挤距离进行锦标赛选择，并经交叉、变异生成两个子代，返回由它们组成的种群。
+        """
+
+        dis = ea.crowdis(population.ObjV, levels) # 计算拥挤距离
+        population.FitnV[:, 0] = np.argsort(np.lexsort(np.array([dis, -levels])), kind = 'mergesort') # 计算适应度
+        offspring = population[ea.selecting(self.selFunc, population.FitnV, 2)]
+        self.tick('selection')
+        offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) # 重组
+        self.tick('recombination')
+        offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
+        self.tick('mutation')
+        offspring.Phen = offspring.decoding() # 解码
+        self.tick('decoding')
+        return offspring
+
+    def insert(self, population, levels, child):
+
+        """
+        描述:
+            把评价完成的一个子代插入种群：先增量地更新非支配层级，再删除最后一层中拥挤距离最小的个体。
+            种群在原地修改，返回更新后的非支配层级。
+        """
+
+        ObjV = self.problem.maxormins * population.ObjV # 统一为最小化
+        vio = np.sum(np.maximum(population.CV, 0), 1)
+        childObjV = self.problem.maxormins * child.ObjV[0]
+        childVio = np.sum(np.maximum(child.CV[0], 0))
+        # 子代进入第一个不含支配它的个体的层
+        dominators = np.unique(levels[_dominates(ObjV, vio, childObjV, childVio)])
+        childLevel = 1
+        while childLevel in dominators:
+            childLevel += 1
+        # 被子代支配的该层个体下移一层，并在后面各层引起连锁反应
+        newLevels = levels.copy()
+        level = childLevel
+        moved = np.where((levels == level) & _dominated(childObjV, childVio, ObjV, vio))[0]
+        while len(moved) > 0:
+            newLevels[moved] = level + 1
+            nextIdx = np.where(levels == level + 1)[0]
+            if len(nextIdx) == 0:
+                break
+            hit = np.zeros(len(nextIdx), dtype = bool)
+            for i in moved:
+                hit |= _dominated(ObjV[i], vio[i], ObjV[nextIdx], vio[nextIdx])
+            moved = nextIdx[hit]
+            level += 1
+        self.tick('ndsort')
+        # 删除最后一层中拥挤距离最小的个体
+        allLevels = np.append(newLevels, childLevel)
+        lastIdx = np.where(allLevels == np.max(allLevels))[0]
+        if len(lastIdx) == 1:
+            worst = lastIdx[0]
+        else:
+            lastObjV = np.vstack([population.ObjV, child.ObjV])[lastIdx]
+            worst = lastIdx[np.argmin(ea.crowdis(lastObjV, np.ones(len(lastIdx))))]
+        if worst == population.sizes: # 子代本身被删除，种群及各层保持不变
+            self.tick('reinsertion')
+            return levels
+        population.Chrom[worst] = child.Chrom[0]
+        population.Phen[worst] = child.Phen[0]
+        population.ObjV[worst] = child.ObjV[0]
+        population.CV[worst] = child.CV[0]
+        newLevels[worst] = childLevel
+        self.tick('reinsertion')
+        return newLevels
+
+    def run(self):
+        #==========================初始化配置===========================
+        population = self.population
+        NIND = population.sizes
+        self.initialization() # 初始化算法模板的一些动态参数
+        #===========================准备进化============================
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None:
+                population.initChrom() # 初始化种群染色体矩阵（内含解码，详见Population类的源码）
+            self.call_aimFunc(population) # 并行地计算初始种群的目标函数值
+            population = population.copy() # 之后的插入都在原地进行，不修改传入的种群
+        [levels, criLevel] = self.ndSort(self.problem.maxormins * population.ObjV, None, None, population.CV) # 对初始种群进行非支配分层
+        evaluator = ea.AsyncEvaluator(self.problem, self.poolSize)
+        children = [] # 已生成但尚未提交的子代
+        #===========================开始进化============================
+        while self.terminated(population) == False:
+            inserted = 0
+            while inserted < NIND:
+                # 让所有进程都有个体在评价，但提交的个体数不超过剩余的评价次数
+                while evaluator.pending < evaluator.workers and (self.MAXEVALS is None or self.evalsNum + evaluator.pending < self.MAXEVALS):
+                    if len(children) == 0:
+                        offspring = self.breed(population, levels)
+                        children = [offspring[[i]] for i in range(offspring.sizes)]
+                    evaluator.submit(children.pop())
+                if evaluator.pending == 0: # 评价次数已用完
+                    break
+                child = evaluator.next() # 等待最先评价完成的子代
+                self.evalsNum += 1
+                self.tick('evaluation')
+                if self.hooks:
+                    self.fire('afterEvaluation', child) # 触发“评价之后”事件
+                levels = self.insert(population, levels, child)
+                inserted += 1
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
+        # 把仍在评价中的子代插入种群
+        while evaluator.pending > 0:
+            child = evaluator.next()
+            self.evalsNum += 1
+            if self.hooks:
+                self.fire('afterEvaluation', child) # 触发“评价之后”事件
+            levels = self.insert(population, levels, child)
+            self.archivedPop = None # 种群已在原地改变，需在finishing()中重新插入帕累托存档
+        evaluator.close()
+        self.utilization = evaluator.utilization()
+        NDSet = self.finishing(population) # 调用finishing完成后续工作
+        self.evalsPerSec = self.evalsNum / self.passTime if self.passTime > 0 else 0
+        return NDSet
+
+def _dominates(ObjV, vio, x, xVio):
+    # 判断ObjV中的各个体是否支配个体x（可行个体支配不可行个体，不可行个体之间违反约束程度之和小者支配大者）
+    return (vio < xVio) | ((vio == 0) & (xVio == 0) & np.all(ObjV <= x, 1) & np.any(ObjV < x, 1))
+
+def _dominated(x, xVio, ObjV, vio):
+    # 判断ObjV中的各个体是否被个体x支配
+    return (xVio < vio) | ((xVio == 0) & (vio == 0) & np.all(x <= ObjV, 1) & np.any(x < ObjV, 1))
@@ -36,7 +36,7 @@ moea_NSGA3_templet : class - 多目标进化优化NSGA-III算法模板
     def __init__(self, problem, population):
         ea.MoeaAlgorithm.__init__(self, problem, population) # 先调用父类构造方法
         self.name = 'NSGA3'
-        self.ndSort = ea.ndsortESS # 设置非支配排序算子
+        self.ndSort = ea.ndsortSweep # 设置非支配排序算子（双目标和三目标时采用扫描法，详见ndsortSweep）
         self.selFunc = 'tour' # 选择方式，采用锦标赛选择
         if population.Encoding == 'P':
             self.recFunc = 'xovpmx' # 部分匹配交叉
@@ -61,11 +61,12 @@ moea_NSGA3_templet : class - 多目标进化优化NSGA-III算法模板
         """
         
         # 父子两代合并
-        population = population + offspring
+        population = self.arena.merge(population, offspring) # 在种群缓冲区中合并，避免重新分配内存（详见PopArena类）
         # 选择个体保留到下一代
         [levels, criLevel] = self.ndSort(self.problem.maxormins * population.ObjV, NUM, None, population.CV) # 对NUM个个体进行非支配分层
+        self.tick('ndsort')
         chooseFlag = ea.refselect(self.problem.maxormins * population.ObjV, levels, criLevel, NUM, uniformPoint, True) # 根据参考点选择个体(True表示使用伪随机数方法，可以提高速度，详见refselect帮助文档)
-        return population[chooseFlag]
+        return self.arena.select(population, chooseFlag)
     
     def run(self):
         #==========================初始化配置===========================
@@ -73,22 +74,33 @@ moea_NSGA3_templet : class - 多目标进化优化NSGA-III算法模板
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes) # 生成在单位目标维度上均匀分布的参考点集
-        if population.Chrom is None or population.sizes != NIND:
-            population.initChrom(NIND)   # 初始化种群染色体矩阵（内含解码，详见Population类的源码），此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None or population.sizes != NIND:
+                population.initChrom(NIND)   # 初始化种群染色体矩阵（内含解码，详见Population类的源码），此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            self.call_aimFunc(population) # 计算种群的目标函数值
         #===========================开始进化============================
         while self.terminated(population) == False:
             # 选择个体参与进化
-            offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
+            offspring = population[ea.selecting(self.selFunc, population.FitnV, self.candidateNum(NIND))] # 设置了surrogate时生成更多的候选子代
+            self.tick('selection')
             # 对选出的个体进行进化操作
             offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) # 重组
+            self.tick('recombination')
             offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
+            self.tick('mutation')
             offspring.Phen = offspring.decoding() # 解码
-            self.problem.aimFunc(offspring) # 求进化后个体的目标函数值
-            self.evalsNum += offspring.sizes # 更新评价次数
+            self.tick('decoding')
+            offspring = self.prescreen(offspring, NIND) # 用代理模型筛选出最有希望的子代（详见Algorithm类的prescreen()）
+            self.call_aimFunc(offspring) # 求进化后个体的目标函数值
+            self.tick('evaluation')
             # 重插入生成新一代种群
             population = self.reinsertion(population, offspring, NIND, uniformPoint)
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
         
         return self.finishing(population) # 调用finishing完成后续工作并返回结果
     
\ No newline at end of file
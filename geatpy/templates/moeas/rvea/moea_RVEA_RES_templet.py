@@ -37,7 +37,7 @@ moea_RVEA_RES_templet : class - 带参考点再生策略的多目标进化优化
     def __init__(self, problem, population):
         ea.MoeaAlgorithm.__init__(self, problem, population) # 先调用父类构造方法
         self.name = 'RVEA-RES'
-        self.ndSort = ea.ndsortESS # 设置非支配排序算子
+        self.ndSort = ea.ndsortSweep # 设置非支配排序算子（双目标和三目标时采用扫描法，详见ndsortSweep）
         self.selFunc = 'urs' # 选择方式，采用无约束随机选择
         if population.Encoding == 'P':
             self.recFunc = 'xovpmx' # 部分匹配交叉
@@ -63,19 +63,20 @@ moea_RVEA_RES_templet : class - 带参考点再生策略的多目标进化优化
         """
         
         # 父子两代合并
-        population = population + offspring
+        population = self.arena.merge(population, offspring) # 在种群缓冲区中合并，避免重新分配内存（详见PopArena类）
         # 得到非支配个体
         [levels, criLevel] = self.ndSort(self.problem.maxormins * population.ObjV, None, 1, population.CV) # 非支配排序，1表示只排序到第一层即非支配个体所在的层级
-        population = population[np.where(levels == 1)[0]]
+        self.tick('ndsort')
+        population = self.arena.select(population, np.where(levels == 1)[0])
         # 选择个体保留到下一代
-        [chooseFlag, ans] = ea.refgselect(population.ObjV, refPoint, self.problem.M * ((self.currentGen) / self.MAXGEN)**self.a, population.CV) # ans表示不使用该返回结果
-        return population[chooseFlag]
+        [chooseFlag, ans] = ea.refgselect(population.ObjV, refPoint, self.problem.M * self.progress()**self.a, population.CV) # ans表示不使用该返回结果
+        return self.arena.select(population, chooseFlag)
     
     def renewRefPoint(self, ObjV, refPoint): # 更新参考点
         _ObjV = ObjV - np.min(ObjV, 0)
         linkIdx = np.argmax(1 - cdist(_ObjV, refPoint, 'cosine'), 1) # 找到与参考点关联的点的索引
         noLinkIdx = list(set(range(refPoint.shape[0])) - set(linkIdx)) # 找到不与参考点关联的点的索引
-        refPoint[noLinkIdx, :] = np.random.rand(len(noLinkIdx), refPoint.shape[1]) * np.max(_ObjV, 0)
+        refPoint[noLinkIdx, :] = ea.rng.rand(len(noLinkIdx), refPoint.shape[1]) * np.max(_ObjV, 0)
         return refPoint
     
     def run(self):
@@ -84,26 +85,44 @@ moea_RVEA_RES_templet : class - 带参考点再生策略的多目标进化优化
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes) # 生成在单位目标维度上均匀分布的参考点集
-        refPoint = np.vstack([uniformPoint, np.random.rand(NIND, self.problem.M)]) # 初始化参考点（详见注释中的参考文献）
-        if population.Chrom is None or population.sizes != NIND:
-            population.initChrom(NIND)   # 初始化种群染色体矩阵（内含解码，详见Population类的源码），此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population, [refPoint, lastStage] = resumed
+        else:
+            refPoint = np.vstack([uniformPoint, ea.rng.rand(NIND, self.problem.M)]) # 初始化参考点（详见注释中的参考文献）
+            if population.Chrom is None or population.sizes != NIND:
+                population.initChrom(NIND)   # 初始化种群染色体矩阵（内含解码，详见Population类的源码），此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            self.call_aimFunc(population) # 计算种群的目标函数值
+            lastStage = 0 # 上一次更新参考点时所处的预算阶段
         #===========================开始进化============================
-        while self.terminated(population) == False:
+        while self.terminated(population, refPoint, lastStage) == False:
             # 选择个体参与进化
-            offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
+            offspring = population[ea.selecting(self.selFunc, population.FitnV, self.candidateNum(NIND))] # 设置了surrogate时生成更多的候选子代
+            self.tick('selection')
             # 对选出的个体进行进化操作
             offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) # 重组
+            self.tick('recombination')
             offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
+            self.tick('mutation')
             offspring.Phen = offspring.decoding() # 解码
-            self.problem.aimFunc(offspring) # 求进化后个体的目标函数值
-            self.evalsNum += offspring.sizes # 更新评价次数
+            self.tick('decoding')
+            offspring = self.prescreen(offspring, NIND) # 用代理模型筛选出最有希望的子代（详见Algorithm类的prescreen()）
+            self.call_aimFunc(offspring) # 求进化后个体的目标函数值
+            self.tick('evaluation')
             # 重插入生成新一代种群
             population = self.reinsertion(population, offspring, refPoint)            
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
             # 修改refPoint
             refPoint[NIND:, :] = self.renewRefPoint(population.ObjV, refPoint[NIND:, :])
-            if (self.currentGen) % np.ceil(self.fr * self.MAXGEN) == 0:
+            if self.MAXGEN is not None:
+                renewFlag = self.currentGen % np.ceil(self.fr * self.MAXGEN) == 0
+            else: # 未设置最大进化代数时，每消耗fr比例的预算就更新一次参考点
+                renewStage = int(self.progress() / self.fr)
+                renewFlag = renewStage > lastStage
+                lastStage = renewStage
+            if renewFlag:
                 refPoint[:NIND, :] = uniformPoint * (np.max(population.ObjV, 0) - np.min(population.ObjV, 0))
             
         # 后续处理，限制种群规模（因为此时种群规模有可能大于NIND）
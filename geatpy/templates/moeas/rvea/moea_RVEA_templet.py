@@ -61,10 +61,10 @@ moea_RVEA_templet : class - 多目标进化优化RVEA算法模板
         """
         
         # 父子两代合并
-        population = population + offspring
+        population = self.arena.merge(population, offspring) # 在种群缓冲区中合并，避免重新分配内存（详见PopArena类）
         # 选择个体保留到下一代
-        chooseFlag, self.Gamma = ea.refgselect(population.ObjV, refPoint, self.problem.M * ((self.currentGen) / self.MAXGEN)**self.a, population.CV, self.Gamma)
-        return population[chooseFlag]
+        chooseFlag, self.Gamma = ea.refgselect(population.ObjV, refPoint, self.problem.M * self.progress()**self.a, population.CV, self.Gamma)
+        return self.arena.select(population, chooseFlag)
     
     def run(self):
         #==========================初始化配置===========================
@@ -72,25 +72,43 @@ moea_RVEA_templet : class - 多目标进化优化RVEA算法模板
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes) # 生成在单位目标维度上均匀分布的参考点集
-        refPoint = uniformPoint.copy() # 初始化参考点为uniformPoint
-        if population.Chrom is None or population.sizes != NIND:
-            population.initChrom(NIND)   # 初始化种群染色体矩阵（内含解码，详见Population类的源码），此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population, [refPoint, lastStage] = resumed
+        else:
+            refPoint = uniformPoint.copy() # 初始化参考点为uniformPoint
+            if population.Chrom is None or population.sizes != NIND:
+                population.initChrom(NIND)   # 初始化种群染色体矩阵（内含解码，详见Population类的源码），此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            self.call_aimFunc(population) # 计算种群的目标函数值
+            lastStage = 0 # 上一次更新参考点时所处的预算阶段
         #===========================开始进化============================
-        while self.terminated(population) == False:
+        while self.terminated(population, refPoint, lastStage) == False:
             # 选择个体参与进化
-            offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
+            offspring = population[ea.selecting(self.selFunc, population.FitnV, self.candidateNum(NIND))] # 设置了surrogate时生成更多的候选子代
+            self.tick('selection')
             # 对选出的个体进行进化操作
             offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) # 重组
+            self.tick('recombination')
             offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
+            self.tick('mutation')
             offspring.Phen = offspring.decoding() # 解码
-            self.problem.aimFunc(offspring) # 求进化后个体的目标函数值
-            self.evalsNum += offspring.sizes # 更新评价次数
+            self.tick('decoding')
+            offspring = self.prescreen(offspring, NIND) # 用代理模型筛选出最有希望的子代（详见Algorithm类的prescreen()）
+            self.call_aimFunc(offspring) # 求进化后个体的目标函数值
+            self.tick('evaluation')
             # 重插入生成新一代种群
             population = self.reinsertion(population, offspring, refPoint)
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
             # 修改refPoint
-            if (self.currentGen) % np.ceil(self.fr * self.MAXGEN) == 0:
+            if self.MAXGEN is not None:
+                renewFlag = self.currentGen % np.ceil(self.fr * self.MAXGEN) == 0
+            else: # 未设置最大进化代数时，每消耗fr比例的预算就更新一次参考点
+                renewStage = int(self.progress() / self.fr)
+                renewFlag = renewStage > lastStage
+                lastStage = renewStage
+            if renewFlag:
                 refPoint = uniformPoint * (np.max(population.ObjV, 0) - np.min(population.ObjV, 0))
                 self.Gamma = None # 重置Gamma为None
             
@@ -57,25 +57,38 @@ soea_DE_best_1_bin_templet : class - 差分进化DE/best/1/bin算法模板
         NIND = population.sizes
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
-        if population.Chrom is None:
-            population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None:
+                population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
+            self.call_aimFunc(population) # 计算种群的目标函数值
+            population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
         #===========================开始进化============================
         while self.terminated(population) == False:
             # 进行差分进化操作
             r0 = ea.selecting('ecs', population.FitnV, NIND) # 得到基向量索引，采用ecs复制精英个体索引
+            self.tick('selection')
             experimentPop = population.copy() # 存储试验个体
             experimentPop.Chrom = ea.mutate(self.mutFunc, experimentPop.Encoding, experimentPop.Chrom, experimentPop.Field, r0, self.F, 1) # 差分变异
-            tempPop = population + experimentPop # 当代种群个体与变异个体进行合并（为的是后面用于重组）
+            self.tick('mutation')
+            tempPop = self.arena.merge(population, experimentPop) # 当代种群个体与变异个体进行合并（为的是后面用于重组）
             experimentPop.Chrom = ea.recombin(self.recFunc, tempPop.Chrom, self.pc, True) # 重组
+            self.tick('recombination')
             # 求进化后个体的目标函数值
             experimentPop.Phen = experimentPop.decoding() # 染色体解码
-            self.problem.aimFunc(experimentPop) # 计算目标函数值
-            self.evalsNum += experimentPop.sizes # 更新评价次数
-            tempPop = population + experimentPop # 临时合并，以调用otos进行一对一生存者选择
+            self.tick('decoding')
+            self.call_aimFunc(experimentPop) # 计算目标函数值
+            self.tick('evaluation')
+            if experimentPop.sizes < NIND: # 评价次数达到上限时只评价了部分试验个体，其余试验个体保持为原个体
+                experimentPop = experimentPop + population[experimentPop.sizes:]
+            tempPop = self.arena.merge(population, experimentPop) # 临时合并，以调用otos进行一对一生存者选择
             tempPop.FitnV = ea.scaling(self.problem.maxormins * tempPop.ObjV, tempPop.CV) # 计算适应度
-            population = tempPop[ea.selecting('otos', tempPop.FitnV, NIND)] # 采用One-to-One Survivor选择，产生新一代种群
+            self.tick('fitness')
+            population = self.arena.select(tempPop, ea.selecting('otos', tempPop.FitnV, NIND)) # 采用One-to-One Survivor选择，产生新一代种群
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
         
         return self.finishing(population) # 调用finishing完成后续工作并返回结果
@@ -60,26 +60,38 @@ soea_SEGA_templet : class - Strengthen Elitist GA templet(增强精英保留的
         NIND = population.sizes
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
-        if population.Chrom is None:
-            population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None:
+                population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
+            self.call_aimFunc(population) # 计算种群的目标函数值
+            population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
         #===========================开始进化============================
         while self.terminated(population) == False:
             # 选择
-            offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
+            offspring = population[ea.selecting(self.selFunc, population.FitnV, self.candidateNum(NIND))] # 设置了surrogate时生成更多的候选子代
+            self.tick('selection')
             # 进行进化操作
             offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) # 重组
+            self.tick('recombination')
             offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
+            self.tick('mutation')
             # 求进化后个体的目标函数值
             offspring.Phen = offspring.decoding() # 染色体解码
-            self.problem.aimFunc(offspring) # 计算目标函数值
-            self.evalsNum += offspring.sizes # 更新评价次数
-            population = population + offspring # 父子合并
+            self.tick('decoding')
+            offspring = self.prescreen(offspring, NIND) # 用代理模型筛选出最有希望的子代（详见Algorithm类的prescreen()）
+            self.call_aimFunc(offspring) # 计算目标函数值
+            self.tick('evaluation')
+            population = self.arena.merge(population, offspring) # 父子合并（在种群缓冲区中进行，详见PopArena类）
             population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
+            self.tick('fitness')
             # 得到新一代种群
-            population = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
+            population = self.arena.select(population, ea.selecting(self.selFunc, population.FitnV, NIND))
+            self.tick('reinsertion')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
         
         return self.finishing(population) # 调用finishing完成后续工作并返回结果
     
\ No newline at end of file
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import geatpy as ea # 导入geatpy库
+from sys import path as paths
+from os import path
+paths.append(path.split(path.split(path.realpath(__file__))[0])[0])
+
+class soea_asyncSSGA_templet(ea.SoeaAlgorithm):
+
+    """
+soea_asyncSSGA_templet : class - Asynchronous Steady-State GA templet(异步稳态遗传算法模板)
+
+算法描述:
+    本模板实现的是异步评价的稳态遗传算法。代际模板每一代都要等种群中最慢的个体评价完才能开始下一代，
+    本模板则通过异步评价器（详见AsyncEvaluator类）始终让poolSize个子代在进程池中同时评价，
+    每得到一个评价结果就立即把该子代插入种群，再生成一个新的子代提交评价。算法流程如下：
+    1) 根据编码规则初始化N个个体的种群，并行评价。
+    2) 按排序适应度进行锦标赛选择，经交叉、变异生成子代，提交评价，直到有poolSize个子代正在评价。
+    3) 取回最先评价完成的子代，若它优于种群中最差的个体，则替换该个体（可行个体优于不可行个体，
+       不可行个体之间违反约束程度之和越小越优，其余情况按目标函数值比较）。
+    4) 生成一个新的子代提交评价，回到第3步。
+    每取回N个子代记为一代，此时进行统计分析、保存检查点并判断是否终止进化。
+    进化结束时，仍在评价中的子代会在评价完成后插入种群。
+    本模板不使用evalCache，也不会在检查点中保存正在评价的子代，从检查点恢复时会重新生成子代。
+    进化结束后，utilization属性为进程池的利用率（各进程调用aimFunc的用时之和 / (poolSize * 异步进化阶段的用时)），
+    evalsPerSec属性为平均每秒的评价次数。
+
+模板使用注意:
+    本模板调用的目标函数形如：aimFunc(pop),
+    其中pop为Population类的对象，代表一个种群，
+    pop对象的Phen属性（即种群染色体的表现型）等价于种群所有个体的决策变量组成的矩阵，
+    该函数根据该Phen计算得到种群所有个体的目标函数值组成的矩阵，并将其赋值给pop对象的ObjV属性。
+    若有约束条件，则在计算违反约束程度矩阵CV后赋值给pop对象的CV属性（详见Geatpy数据结构）。
+    该函数不返回任何的返回值，求得的目标函数值保存在种群对象的ObjV属性中，
+                          违反约束程度矩阵保存在种群对象的CV属性中。
+    例如：population为一个种群对象，则调用aimFunc(population)即可完成目标函数值的计算，
+         此时可通过population.ObjV得到求得的目标函数值，population.CV得到违反约束程度矩阵。
+    本模板每次只把一个个体交给aimFunc评价，poolSize为None或不大于1时在主进程中逐个评价。
+    若不符合上述规范，则请修改算法模板或自定义新算法模板。
+
+"""
+
+    def __init__(self, problem, population):
+        ea.SoeaAlgorithm.__init__(self, problem, population) # 先调用父类构造方法
+        self.name = 'asyncSSGA'
+        self.selFunc = 'tour' # 锦标赛选择算子
+        if population.Encoding == 'P':
+            self.recFunc = 'xovpmx' # 部分匹配交叉
+            self.mutFunc = 'mutinv' # 染色体片段互换变异
+        else:
+            self.recFunc = 'xovdp' # 两点交叉
+            if population.Encoding == 'BG':
+                self.mutFunc = 'mutbin' # 二进制变异
+            elif population.Encoding == 'RI':
+                self.mutFunc = 'mutbga' # breeder GA中的变异算子
+            else:
+                raise RuntimeError('编码方式必须为''BG''、''RI''或''P''.')
+        self.pc = 1 # 重组概率
+        self.pm = 1 # 整条染色体的变异概率
+        self.utilization = None # 进程池的利用率
+        self.evalsPerSec = None # 平均每秒的评价次数
+
+    def breed(self, population):
+
+        """
+        描述:
+            按排序适应度进行锦标赛选择，并经交叉、变异生成两个子代，返回由它们组成的种群。
+        """
+
+        population.FitnV = ea.ranking(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
+        offspring = population[ea.selecting(self.selFunc, population.FitnV, 2)]
+        self.tick('selection')
+        offspring.Chrom = ea.recombin(self.recFunc, offspring.Chrom, self.pc) # 重组
+        self.tick('recombination')
+        offspring.Chrom = ea.mutate(self.mutFunc, offspring.Encoding, offspring.Chrom, offspring.Field, self.pm) # 变异
+        self.tick('mutation')
+        offspring.Phen = offspring.decoding() # 解码
+        self.tick('decoding')
+        return offspring
+
+    def insert(self, population, child):
+
+        """
+        描述:
+            若评价完成的子代优于种群中最差的个体，则用它原地替换该个体。
+        """
+
+        ObjV = self.problem.maxormins[0] * population.ObjV[:, 0] # 统一为最小化
+        vio = np.sum(np.maximum(population.CV, 0), 1)
+        childObjV = self.problem.maxormins[0] * child.ObjV[0, 0]
+        childVio = np.sum(np.maximum(child.CV[0], 0))
+        worst = np.lexsort([ObjV, vio])[-1] # 最差的个体
+        if childVio < vio[worst] or (childVio == vio[worst] and childObjV < ObjV[worst]):
+            population.Chrom[worst] = child.Chrom[0]
+            population.Phen[worst] = child.Phen[0]
+            population.ObjV[worst] = child.ObjV[0]
+            population.CV[worst] = child.CV[0]
+        self.tick('reinsertion')
+
+    def run(self):
+        #==========================初始化配置===========================
+        population = self.population
+        NIND = population.sizes
+        self.initialization() # 初始化算法模板的一些动态参数
+        #===========================准备进化============================
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None:
+                population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
+            self.call_aimFunc(population) # 并行地计算初始种群的目标函数值
+            population = population.copy() # 之后的插入都在原地进行，不修改传入的种群
+        evaluator = ea.AsyncEvaluator(self.problem, self.poolSize)
+        children = [] # 已生成但尚未提交的子代
+        #===========================开始进化============================
+        while self.terminated(population) == False:
+            inserted = 0
+            while inserted < NIND:
+                # 让所有进程都有个体在评价，但提交的个体数不超过剩余的评价次数
+                while evaluator.pending < evaluator.workers and (self.MAXEVALS is None or self.evalsNum + evaluator.pending < self.MAXEVALS):
+                    if len(children) == 0:
+                        offspring = self.breed(population)
+                        children = [offspring[[i]] for i in range(offspring.sizes)]
+                    evaluator.submit(children.pop())
+                if evaluator.pending == 0: # 评价次数已用完
+                    break
+                child = evaluator.next() # 等待最先评价完成的子代
+                self.evalsNum += 1
+                self.tick('evaluation')
+                if self.hooks:
+                    self.fire('afterEvaluation', child) # 触发“评价之后”事件
+                self.insert(population, child)
+                inserted += 1
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
+        # 把仍在评价中的子代插入种群
+        while evaluator.pending > 0:
+            child = evaluator.next()
+            self.evalsNum += 1
+            if self.hooks:
+                self.fire('afterEvaluation', child) # 触发“评价之后”事件
+            self.insert(population, child)
+        evaluator.close()
+        self.utilization = evaluator.utilization()
+        result = self.finishing(population) # 调用finishing完成后续工作
+        self.evalsPerSec = self.evalsNum / self.passTime if self.passTime > 0 else 0
+        return result
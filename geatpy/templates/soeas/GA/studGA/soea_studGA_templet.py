@@ -57,11 +57,14 @@ soea_studGA_templet.py - Stud GA templet(种马遗传算法模板)
         NIND = population.sizes
         self.initialization() # 初始化算法模板的一些动态参数
         #===========================准备进化============================
-        if population.Chrom is None:
-            population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
-        self.problem.aimFunc(population) # 计算种群的目标函数值
-        population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
-        self.evalsNum = population.sizes # 记录评价次数
+        resumed = self.restoreLoop() # 从检查点恢复时得到检查点中的种群及循环状态（详见Algorithm类的resume()），否则为None
+        if resumed is not None:
+            population = resumed[0]
+        else:
+            if population.Chrom is None:
+                population.initChrom(NIND) # 初始化种群染色体矩阵（内含染色体解码，详见Population类的源码）
+            self.call_aimFunc(population) # 计算种群的目标函数值
+            population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
         #===========================开始进化============================
         while self.terminated(population) == False:
             bestIdx = np.argmax(population.FitnV, axis = 0) # 得到当代的最优个体的索引, 设置axis=0可使得返回一个向量
@@ -69,16 +72,23 @@ soea_studGA_templet.py - Stud GA templet(种马遗传算法模板)
             restPop = population[np.where(np.array(range(NIND)) != bestIdx)[0]] # 得到除去精英个体外其它个体组成的种群
             # 选择个体，以便后面与种马种群进行交配
             tempPop = restPop[ea.selecting(self.selFunc, restPop.FitnV, (NIND - studPop.sizes))]
+            self.tick('selection')
             # 将种马种群与选择出来的个体进行合并
             population = studPop + tempPop
             # 进行进化操作
             population.Chrom = ea.recombin(self.recFunc, population.Chrom, self.pc) # 重组
+            self.tick('recombination')
             population.Chrom = ea.mutate(self.mutFunc, population.Encoding, population.Chrom, population.Field, self.pm) # 变异
+            self.tick('mutation')
             # 求进化后个体的目标函数值
             population.Phen = population.decoding() # 染色体解码
-            self.problem.aimFunc(population)
-            self.evalsNum += population.sizes # 更新评价次数
+            self.tick('decoding')
+            self.call_aimFunc(population)
+            self.tick('evaluation')
             population.FitnV = ea.scaling(self.problem.maxormins * population.ObjV, population.CV) # 计算适应度
+            self.tick('fitness')
+            if self.hooks:
+                self.fire('afterReinsertion', population) # 触发“重插入之后”事件
         
         return self.finishing(population) # 调用finishing完成后续工作并返回结果
     
\ No newline at end of file
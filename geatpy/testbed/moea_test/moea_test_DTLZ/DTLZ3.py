@@ -23,8 +23,8 @@ class DTLZ3(ea.Problem): # 继承Problem父类
         f = np.fliplr(np.cumprod(np.hstack([ones_metrix, np.cos(Vars[:,:self.M-1] * np.pi / 2)]), 1)) * np.hstack([ones_metrix, np.sin(Vars[:, range(self.M - 2, -1, -1)] * np.pi / 2)]) * np.tile(1 + g, (1, self.M))
         pop.ObjV = f # 把求得的目标函数值赋值给种群pop的ObjV
     
-    def calBest(self): # 计算全局最优解
-        uniformPoint, ans = ea.crtup(self.M, 10000) # 生成10000个在各目标的单位维度上均匀分布的参考点
+    def calBest(self, N = 10000): # 计算全局最优解
+        uniformPoint, ans = ea.crtup(self.M, N) # 生成N个在各目标的单位维度上均匀分布的参考点
         globalBestObjV = uniformPoint / np.tile(np.sqrt(np.sum(uniformPoint ** 2, 1, keepdims = True)), (1, self.M))
         
         return globalBestObjV
@@ -26,11 +26,10 @@ class DTLZ5(ea.Problem): # 继承Problem父类
         f = np.fliplr(np.cumprod(np.hstack([ones_metrix, np.cos(_Phen[:,:self.M-1] * np.pi / 2)]), 1)) * np.hstack([ones_metrix, np.sin(_Phen[:, range(self.M - 2, -1, -1)] * np.pi / 2)]) * np.tile(1 + g, (1, self.M))
         pop.ObjV = f # 把求得的目标函数值赋值给种群pop的ObjV
     
-    def calBest(self): # 计算全局最优解
-        N = 10000 # 生成10000个参考点
+    def calBest(self, N = 10000): # 计算全局最优解，N为所要生成的参考点的个数
         P = np.vstack([np.linspace(0,1,N), np.linspace(1,0,N)]).T
         P = P / np.tile(np.sqrt(np.sum(P**2, 1, keepdims = True)), (1, P.shape[1]))
-        P = np.hstack([P[:, np.zeros(self.M-2, dtype = np.int)], P])
+        P = np.hstack([P[:, np.zeros(self.M-2, dtype = int)], P])
         globalBestObjV = P / np.sqrt(2) ** np.tile(np.hstack([self.M - 2, np.linspace(self.M - 2, 0, self.M - 1)]), (P.shape[0], 1))
         
         return globalBestObjV
@@ -51,27 +51,32 @@ class WFG1(ea.Problem): # 继承Problem父类
         f = np.tile(D * x[: ,[M - 1]], (1, M)) + np.tile(S, (N, 1)) * h
         pop.ObjV = f # 把求得的目标函数值赋值给种群pop的ObjV
     
-    def calBest(self): # 计算全局最优解
-        N = 10000 # 设置所要生成的全局最优解的个数
+    def calBest(self, N = 10000): # 计算全局最优解，N为所要生成的全局最优解的个数
         Point, num = ea.crtup(self.M, N) # 生成N个在各目标的单位维度上均匀分布的参考点
         M = self.M
         c = np.ones((num, M))
-        for i in range(num):
-            for j in range(1, M):
-                temp = Point[i, j] / Point[i, 0] * np.prod(1 - c[i, M - j: M - 1])
-                c[i, M - j - 1] = (temp**2 - temp + np.sqrt(2 * temp)) / (temp**2 + 1)
+        for j in range(1, M): # 对所有点同时计算
+            temp = Point[:, j] / Point[:, 0] * np.prod(1 - c[:, M - j: M - 1], 1)
+            c[:, M - j - 1] = (temp**2 - temp + np.sqrt(2 * temp)) / (temp**2 + 1)
         x = np.arccos(c) * 2 / np.pi
         temp = (1 - np.sin(np.pi / 2 * x[:, [1]])) * Point[:, [M - 1]] / Point[:, [M - 2]]
         a = np.linspace(0, 1, 10000 + 1)
-        for i in range(num):
-            E = np.abs(temp[i] * (1 - np.cos(np.pi / 2 * a)) - 1 + a + np.cos(10 * np.pi * a + np.pi / 2) / 10 / np.pi)
-            rank = np.argsort(E, kind = 'mergesort')
-            x[i, 0] = a[np.min(rank[0: 10])]
+        u = 1 - np.cos(np.pi / 2 * a)
+        v = np.cos(10 * np.pi * a + np.pi / 2) / 10 / np.pi
+        for start in range(0, num, 200): # 分块计算，每块的误差矩阵为200行10001列
+            E = np.abs(temp[start : start + 200] * u - 1 + a + v)
+            x[start : start + 200, 0] = a[first_min(E, 10)]
         Point = convex(x)
         Point[:, [M - 1]] = mixed(x)
-        globalBestObjV = np.tile(np.array([list(range(2, 2 * self.M + 1, 2))]), (num, 1)) * Point
+        Point = Point[np.all(np.isfinite(Point), 1)] # 删去第一个目标值为0的参考点所产生的无效点
+        globalBestObjV = np.tile(np.array([list(range(2, 2 * self.M + 1, 2))]), (Point.shape[0], 1)) * Point
         return globalBestObjV
 
+def first_min(E, k):
+    # 求E的每一行中最小的k个元素（按稳定排序）的最小下标，即不大于第k小的值的第一个元素的下标
+    kth = np.partition(E, k - 1, 1)[:, [k - 1]]
+    return np.argmax(E <= kth, 1)
+
 def convex(x):
     return np.fliplr(np.cumprod(np.hstack([np.ones((x.shape[0], 1)), 1 - np.cos(x[:,:-1] * np.pi / 2)]), 1)) * np.hstack([np.ones((x.shape[0], 1)), 1 - np.sin(x[:, list(range(x.shape[1] - 1 - 1, -1, -1))] * np.pi / 2)])
 
@@ -47,8 +47,7 @@ class WFG4(ea.Problem): # 继承Problem父类
         f = np.tile(D * x[: ,[M - 1]], (1, M)) + np.tile(S, (N, 1)) * h
         pop.ObjV = f # 把求得的目标函数值赋值给种群pop的ObjV
     
-    def calBest(self): # 计算全局最优解
-        N = 10000 # 设置所要生成的全局最优解的个数
+    def calBest(self, N = 10000): # 计算全局最优解，N为所要生成的全局最优解的个数
         Point, num = ea.crtup(self.M, N) # 生成N个在各目标的单位维度上均匀分布的参考点
         Point = Point / np.tile(np.sqrt(np.array([np.sum(Point**2, 1)]).T), (1, self.M))
         globalBestObjV = np.tile(np.array([list(range(2, 2 * self.M + 1, 2))]), (Point.shape[0], 1)) * Point
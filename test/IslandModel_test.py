@@ -0,0 +1,44 @@
+"""
+This file checks that the islands of an IslandModel can evaluate their populations with a process pool (poolSize),
+i.e. that the islands are not daemonic processes, and that the results are reproducible with a seed.
+
+Usage: python IslandModel_test.py (or run it with pytest)
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+class ZDT1(ea.Problem):
+    def __init__(self, Dim = 5):
+        ea.Problem.__init__(self, 'ZDT1', 2, [1, 1], Dim, [0] * Dim, [0] * Dim, [1] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        f1 = pop.Phen[:, [0]]
+        g = 1 + 9 * np.mean(pop.Phen[:, 1:], 1, keepdims = True)
+        pop.ObjV = np.hstack([f1, g * (1 - np.sqrt(f1 / g))])
+
+def runIslands(poolSize):
+    problem = ZDT1()
+    population = ea.Population('RI', ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders), 20)
+    islands = ea.IslandModel(ea.moea_NSGA2_templet, problem, population, 2)
+    islands.settings = {'MAXGEN' : 10, 'poolSize' : poolSize}
+    islands.migrationGap = 5
+    islands.drawing = 0
+    islands.seed = 1
+    NDSet = islands.run()
+    return NDSet, islands
+
+def test_process_pool():
+    [NDSet, islands] = runIslands(2)
+    assert islands.islandGens == [9, 9]
+    assert islands.evalsNum == 400
+    [serialNDSet, serialIslands] = runIslands(None)
+    assert np.array_equal(NDSet.ObjV, serialNDSet.ObjV) # 并行评价不改变结果
+
+if __name__ == '__main__':
+    test_process_pool()
+    print('IslandModel_test passed.')
@@ -0,0 +1,96 @@
+"""
+This file checks that inserting populations into a ParetoArchive one after another gives the same individuals
+as merging all of them and keeping the first non-dominated level found by ndsortESS.
+
+Usage: python ParetoArchive_test.py (or run it with pytest)
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+def randomPop(rng, N, M, constrained):
+    Field = ea.crtfld('RI', np.array([0, 0]), np.array([[0, 0], [100, 100]]), np.array([[1, 1], [1, 1]]))
+    Chrom = rng.integers(0, 101, (N, 2)).astype(float)
+    ObjV = rng.integers(0, 8, (N, M)).astype(float) # 取值范围很小，因此有大量相同的目标函数值
+    CV = rng.integers(-3, 2, (N, 1)).astype(float) if constrained else np.zeros((N, 1))
+    return ea.Population('RI', Field, N, Chrom, ObjV, None, CV, Chrom)
+
+def rows(pop):
+    # 把种群的各行（染色体、目标函数值、违反约束程度）排序后返回，用于不考虑顺序地比较两个种群
+    data = np.hstack([pop.Chrom, pop.ObjV, pop.CV])
+    return data[np.lexsort(data.T[::-1])]
+
+def firstLevel(pops, maxormins):
+    merged = pops[0]
+    for pop in pops[1:]:
+        merged = merged + pop
+    [levels, criLevel] = ea.ndsortESS(maxormins * merged.ObjV, None, 1, merged.CV)
+    return merged[np.where(levels == 1)[0]]
+
+def test_matches_merge():
+    rng = np.random.default_rng(1)
+    for M in [2, 3, 4]:
+        for constrained in [False, True]:
+            for maxormins in [np.ones(M), np.array([1, -1] + [1] * (M - 2))]:
+                for repeat in range(10):
+                    pops = [randomPop(rng, int(rng.integers(1, 30)), M, constrained) for i in range(8)]
+                    archive = ea.ParetoArchive(maxormins, None, False)
+                    for i, pop in enumerate(pops):
+                        archive.insert(pop)
+                        assert np.array_equal(rows(archive.NDSet), rows(firstLevel(pops[:i + 1], maxormins))), (M, constrained, i)
+
+def test_unique():
+    rng = np.random.default_rng(2)
+    for M in [2, 3]:
+        for constrained in [False, True]:
+            for repeat in range(10):
+                pops = [randomPop(rng, 20, M, constrained) for i in range(8)]
+                archive = ea.ParetoArchive(np.ones(M), None, True)
+                for pop in pops:
+                    archive.insert(pop)
+                expected = np.unique(firstLevel(pops, np.ones(M)).ObjV, axis = 0)
+                assert len(np.unique(archive.NDSet.ObjV, axis = 0)) == archive.NDSet.sizes # 没有重复的目标函数值
+                assert np.array_equal(np.unique(archive.NDSet.ObjV, axis = 0), expected), (M, constrained)
+
+class ZDT1(ea.Problem):
+    def __init__(self, Dim = 5):
+        ea.Problem.__init__(self, 'ZDT1', 2, [1, 1], Dim, [0] * Dim, [0] * Dim, [1] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        f1 = pop.Phen[:, [0]]
+        g = 1 + 9 * np.mean(pop.Phen[:, 1:], 1, keepdims = True)
+        pop.ObjV = np.hstack([f1, g * (1 - np.sqrt(f1 / g))])
+
+class CountingArchive(ea.ParetoArchive): # 记录每次插入的种群及其内容
+    def __init__(self, maxormins):
+        ea.ParetoArchive.__init__(self, maxormins, None, False)
+        self.inserted = []
+
+    def insert(self, pop):
+        self.inserted.append((pop, rows(pop)))
+        ea.ParetoArchive.insert(self, pop)
+
+def test_finishing_no_reinsert():
+    # finishing()不应把stat()已插入过的最后一代种群再插入一次；异步模板在终止后原地插入了子代，则需要再插入
+    for name in ['moea_NSGA2_templet', 'moea_asyncNSGA2_templet']:
+        problem = ZDT1()
+        population = ea.Population('RI', ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders), 20)
+        algorithm = getattr(ea, name)(problem, population)
+        algorithm.MAXGEN = 5
+        algorithm.drawing = 0
+        algorithm.seed = 1
+        algorithm.archive = CountingArchive(problem.maxormins)
+        algorithm.run()
+        inserted = algorithm.archive.inserted
+        for i in range(1, len(inserted)):
+            assert not (inserted[i][0] is inserted[i - 1][0] and np.array_equal(inserted[i][1], inserted[i - 1][1])), (name, i)
+
+if __name__ == '__main__':
+    test_matches_merge()
+    test_unique()
+    test_finishing_no_reinsert()
+    print('ParetoArchive_test passed.')
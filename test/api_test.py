@@ -0,0 +1,69 @@
+"""
+This file checks that the lazily imported parts of geatpy can be reached through the package on the running Python version:
+it calls a few operators of the core, builds and runs a single-objective and a multi-objective template,
+and computes the metrics of the result with ea.indicator.
+
+Usage: python api_test.py (or run it with pytest)
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+class Sphere(ea.Problem):
+    def __init__(self, Dim = 5):
+        ea.Problem.__init__(self, 'Sphere', 1, [1], Dim, [0] * Dim, [-5] * Dim, [5] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        pop.ObjV = np.sum(pop.Phen ** 2, 1, keepdims = True)
+
+class ZDT1(ea.Problem):
+    def __init__(self, Dim = 5):
+        ea.Problem.__init__(self, 'ZDT1', 2, [1, 1], Dim, [0] * Dim, [0] * Dim, [1] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        f1 = pop.Phen[:, [0]]
+        g = 1 + 9 * np.mean(pop.Phen[:, 1:], 1, keepdims = True)
+        pop.ObjV = np.hstack([f1, g * (1 - np.sqrt(f1 / g))])
+
+    def calReferObjV(self):
+        f1 = np.linspace(0, 1, 1000)[:, None]
+        return np.hstack([f1, 1 - np.sqrt(f1)])
+
+def test_operators():
+    ea.setRng(np.random.default_rng(0))
+    Field = ea.crtfld('RI', np.array([0, 0, 0]), np.array([[0, 0, 0], [1, 1, 1]]), np.array([[1, 1, 1], [1, 1, 1]]))
+    Chrom = ea.crtrp(10, Field)
+    assert Chrom.shape == (10, 3)
+    assert np.all((Chrom >= 0) & (Chrom <= 1))
+    [levels, criLevel] = ea.ndsortESS(np.array([[1, 2], [2, 1], [2, 2], [3, 3]]), None, None)
+    assert list(levels) == [1, 1, 2, 3]
+    assert ea.indicator.HV(np.array([[0.0, 1.0], [1.0, 0.0]])) > 0
+
+def test_templates():
+    problem = Sphere()
+    population = ea.Population('RI', ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders), 20)
+    algorithm = ea.soea_SEGA_templet(problem, population)
+    algorithm.MAXGEN = 20
+    algorithm.drawing = 0
+    algorithm.seed = 1
+    [population, obj_trace, var_trace] = algorithm.run()
+    assert obj_trace.shape == (20, 2)
+    problem = ZDT1()
+    population = ea.Population('RI', ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders), 20)
+    algorithm = ea.moea_NSGA2_templet(problem, population)
+    algorithm.MAXGEN = 20
+    algorithm.drawing = 0
+    algorithm.seed = 1
+    NDSet = algorithm.run()
+    assert NDSet.sizes > 0
+    PF = problem.calReferObjV()
+    assert np.isfinite(ea.indicator.IGD(NDSet.ObjV, PF)) and np.isfinite(ea.indicator.GD(NDSet.ObjV, PF))
+
+if __name__ == '__main__':
+    test_operators()
+    test_templates()
+    print('api_test passed.')
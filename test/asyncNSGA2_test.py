@@ -0,0 +1,61 @@
+"""
+This file checks that the incremental non-domination level update in moea_asyncNSGA2_templet.insert()
+gives exactly the levels that ndsortESS computes from scratch, on populations with duplicated objective values and constraints.
+
+Usage: python asyncNSGA2_test.py (or run it with pytest)
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+class Dummy(ea.Problem): # insert()只用到问题的maxormins
+    def __init__(self, M, maxormins):
+        ea.Problem.__init__(self, 'Dummy', M, maxormins, 2, [0, 0], [0, 0], [100, 100], [1, 1], [1, 1])
+
+    def aimFunc(self, pop):
+        pass
+
+def randomPop(rng, Field, N, M, constrained):
+    Chrom = rng.integers(0, 101, (N, 2)).astype(float)
+    ObjV = rng.integers(0, 8, (N, M)).astype(float) # 取值范围很小，因此有大量相同的目标函数值
+    CV = rng.integers(-3, 2, (N, 1)).astype(float) if constrained else np.zeros((N, 1))
+    return ea.Population('RI', Field, N, Chrom, ObjV, None, CV, Chrom.copy())
+
+def test_insert_levels():
+    rng = np.random.default_rng(1)
+    for M in [2, 3]:
+        for constrained in [False, True]:
+            for maxormins in [[1] * M, [-1] + [1] * (M - 1)]:
+                problem = Dummy(M, maxormins)
+                Field = ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders)
+                population = randomPop(rng, Field, 30, M, constrained)
+                algorithm = ea.moea_asyncNSGA2_templet(problem, population)
+                levels = ea.ndsortESS(problem.maxormins * population.ObjV, None, None, population.CV)[0]
+                for i in range(300):
+                    child = randomPop(rng, Field, 1, M, constrained)
+                    levels = algorithm.insert(population, levels, child)
+                    expected = ea.ndsortESS(problem.maxormins * population.ObjV, None, None, population.CV)[0]
+                    assert np.array_equal(levels, expected), (M, constrained, maxormins, i)
+                    assert population.sizes == 30
+
+def test_child_kept_when_not_worst():
+    # 子代支配种群中所有个体时，它一定会进入种群并位于第一层
+    problem = Dummy(2, [1, 1])
+    Field = ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders)
+    population = randomPop(np.random.default_rng(2), Field, 20, 2, False)
+    algorithm = ea.moea_asyncNSGA2_templet(problem, population)
+    levels = ea.ndsortESS(population.ObjV)[0]
+    child = randomPop(np.random.default_rng(3), Field, 1, 2, False)
+    child.ObjV[:] = -1
+    levels = algorithm.insert(population, levels, child)
+    row = np.where(np.all(population.ObjV == -1, 1))[0]
+    assert len(row) == 1 and levels[row[0]] == 1 and np.all(levels[np.arange(20) != row[0]] >= 2)
+
+if __name__ == '__main__':
+    test_insert_levels()
+    test_child_kept_when_not_worst()
+    print('asyncNSGA2_test passed.')
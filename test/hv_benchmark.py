@@ -0,0 +1,91 @@
+"""
+This file times the hypervolume engine (geatpy/hypervolume.py) on the DTLZ and WFG fronts of the testbed.
+For each front, NIND points are drawn from the front returned by calBest(). Their hypervolume is then computed in two ways:
+with ea.indicator.HV, which now goes through the engine on both cores, and with the HV routine it replaced.
+With the compiled core the old routine is the compiled indicator.HV. With the pure-Numpy core it is legacyHV below, a copy of
+the old pycore HV: exact for M = 2 and M = 3, and a 1,000,000-sample Monte Carlo estimate for M >= 4.
+
+Usage: python hv_benchmark.py [NIND]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import geatpy as ea
+
+testbed = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'geatpy', 'testbed', 'moea_test')
+sys.path.append(os.path.join(testbed, 'moea_test_DTLZ'))
+sys.path.append(os.path.join(testbed, 'moea_test_WFG'))
+from DTLZ1 import DTLZ1
+from DTLZ2 import DTLZ2
+from WFG4 import WFG4
+
+def _hv2d(points):
+    points = points[np.argsort(points[:, 0], kind = 'mergesort')]
+    best = np.minimum.accumulate(points[:, 1])
+    widths = np.diff(np.hstack([points[:, 0], 1]))
+    return np.sum(widths * (1 - best))
+
+def _hv3d(points):
+    points = points[np.argsort(points[:, 2], kind = 'mergesort')]
+    heights = np.diff(np.hstack([points[:, 2], 1]))
+    return sum(heights[i] * _hv2d(points[: i + 1, :2]) for i in range(len(points)) if heights[i] > 0)
+
+def legacyHV(ObjV, PF = None): # 纯Numpy内核原来的HV
+    ObjV = np.asarray(ObjV, dtype = float)
+    PF = ObjV if PF is None else np.asarray(PF, dtype = float)
+    M = ObjV.shape[1]
+    fmin = np.minimum(np.min(ObjV, 0), 0)
+    fmax = np.max(PF, 0)
+    span = (fmax - fmin) * 1.1
+    points = (ObjV - fmin) / np.where(span > 0, span, 1)
+    points = points[np.all(points <= 1, 1)]
+    if points.shape[0] == 0:
+        return 0.0
+    if M == 2:
+        return _hv2d(points)
+    if M == 3:
+        return _hv3d(points)
+    low = np.min(points, 0)
+    sampleNum = 1000000
+    chunk = 10000
+    dominated = 0
+    for start in range(0, sampleNum, chunk):
+        samples = low + np.random.rand(chunk, M) * (1 - low)
+        covered = np.zeros(chunk, dtype = bool)
+        for p in points:
+            covered |= np.all(samples >= p, 1)
+        dominated += np.sum(covered)
+    return np.prod(1 - low) * dominated / sampleNum
+
+if ea.__core__ == 'compiled':
+    # 编译版内核的indicator模块（geatpy/core已在sys.path中），第一次访问ea.indicator时其HV会被替换，因此要先取出原来的HV
+    import indicator
+    oldHV = indicator.HV
+else:
+    oldHV = legacyHV
+
+def timeit(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+    NIND = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    np.random.seed(0)
+    ea.indicator.HV(np.ones((1, 2))) # 先导入indicator，使第一行的计时不包含导入时间
+    header = ['front', 'M', 'HV', 'HV (s)', 'old HV', 'old HV (s)', 'speed-up']
+    rows = []
+    for Problem in [DTLZ1, DTLZ2, WFG4]:
+        for M in range(2, 9):
+            PF = Problem(M).calBest()
+            ObjV = PF[np.random.choice(PF.shape[0], min(NIND, PF.shape[0]), replace = False)]
+            hv, hvTime = timeit(lambda : ea.indicator.HV(ObjV, PF))
+            old, oldTime = timeit(lambda : oldHV(ObjV, PF))
+            rows.append([Problem.__name__, str(M), '%.6f' % hv, '%.4f' % hvTime, '%.6f' % old, '%.4f' % oldTime, '%.1f' % (oldTime / hvTime)])
+    widths = [max(len(h), max(len(row[i]) for row in rows)) for i, h in enumerate(header)]
+    print('core: %s, NIND = %d' % (ea.__core__, NIND))
+    print('  '.join(h.ljust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print('  '.join(r.ljust(w) for r, w in zip(row, widths)))
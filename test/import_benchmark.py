@@ -0,0 +1,41 @@
+"""
+This file times `import geatpy` in fresh interpreters.
+Templates, plotting functions, operators and the classes that depend on scipy are imported lazily on first access.
+For comparison, the benchmark also times an import that touches every name in geatpy.__all__, which is what
+`import geatpy` used to cost, and a bare `import numpy`, which is the lower bound.
+
+Usage: python import_benchmark.py [REPEAT]
+"""
+
+import os
+import sys
+import subprocess
+import time
+import numpy as np
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+cases = [['import numpy', 'import numpy'],
+         ['import geatpy', 'import geatpy'],
+         ['import geatpy + NSGA2', 'import geatpy as ea; ea.moea_NSGA2_templet'],
+         ['import geatpy + all names', 'import geatpy as ea; [getattr(ea, name) for name in ea.__all__]']]
+
+def timeit(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check = True, env = dict(os.environ, PYTHONPATH = root))
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    REPEAT = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in cases: # 先运行一遍，生成.pyc文件并预热磁盘缓存
+        timeit(code)
+    header = ['case', 'median (ms)', 'min (ms)']
+    rows = []
+    for name, code in cases:
+        times = [timeit(code) for i in range(REPEAT)]
+        rows.append([name, '%.1f' % (np.median(times) * 1000), '%.1f' % (np.min(times) * 1000)])
+    widths = [max(len(h), max(len(row[i]) for row in rows)) for i, h in enumerate(header)]
+    print('REPEAT = %d' % REPEAT)
+    print('  '.join(h.ljust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print('  '.join(r.ljust(w) for r, w in zip(row, widths)))
@@ -0,0 +1,56 @@
+"""
+This file checks that ndsortSweep gives exactly the same non-dominated levels as ndsortESS
+on random populations with duplicated objective values and constraints.
+
+Usage: python ndsortSweep_test.py (or run it with pytest)
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+def randomCase(rng, N, M, constrained):
+    ObjV = rng.integers(0, 6, (N, M)).astype(float) # 取值范围很小，因此有大量相同的目标函数值
+    CV = None
+    if constrained:
+        CV = rng.integers(-2, 3, (N, 2)).astype(float) # 约一半个体不可行，且违反约束程度之和有重复
+    return ObjV, CV
+
+def test_levels():
+    rng = np.random.default_rng(1)
+    for M in [2, 3, 4]:
+        for N in [1, 2, 7, 50, 200]:
+            for constrained in [False, True]:
+                for repeat in range(5):
+                    ObjV, CV = randomCase(rng, N, M, constrained)
+                    expected = ea.ndsortESS(ObjV, None, None, CV)
+                    actual = ea.ndsortSweep(ObjV, None, None, CV)
+                    assert np.array_equal(actual[0], expected[0]), (M, N, constrained)
+                    assert actual[1] == expected[1], (M, N, constrained)
+
+def test_needNum_needLevel():
+    rng = np.random.default_rng(2)
+    for M in [2, 3]:
+        for constrained in [False, True]:
+            for repeat in range(10):
+                ObjV, CV = randomCase(rng, 100, M, constrained)
+                for needNum, needLevel in [(1, None), (30, None), (100, None), (None, 1), (None, 3), (50, 2)]:
+                    expected = ea.ndsortESS(ObjV, needNum, needLevel, CV)
+                    actual = ea.ndsortSweep(ObjV, needNum, needLevel, CV)
+                    assert np.array_equal(actual[0], expected[0]), (M, constrained, needNum, needLevel)
+                    assert actual[1] == expected[1], (M, constrained, needNum, needLevel)
+
+def test_continuous():
+    rng = np.random.default_rng(3)
+    for M in [2, 3]:
+        ObjV = rng.random((500, M))
+        assert np.array_equal(ea.ndsortSweep(ObjV)[0], ea.ndsortESS(ObjV)[0])
+
+if __name__ == '__main__':
+    test_levels()
+    test_needNum_needLevel()
+    test_continuous()
+    print('ndsortSweep_test passed.')
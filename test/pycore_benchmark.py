@@ -0,0 +1,70 @@
+"""
+This file compares the speed of the pure-Numpy core (geatpy/pycore/) with the compiled core (geatpy/core/).
+When no compiled core matches the running Python version, only the pure-Numpy core is timed.
+
+Usage: python pycore_benchmark.py [NIND]
+"""
+
+import sys
+import time
+import numpy as np
+import geatpy as ea
+from geatpy import pycore
+
+def timeit(func, repeat = 5):
+    best = np.inf
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def cases(core, NIND):
+    Dim = 30
+    FieldDR = core.crtfld('RI', [0] * Dim, [[0] * Dim, [1] * Dim])
+    FieldD = core.crtfld('BG', [0] * Dim, [[0] * Dim, [1] * Dim], None, [4] * Dim)
+    FieldP = core.crtfld('P', [1] * Dim, [[0] * Dim, [Dim - 1] * Dim])
+    np.random.seed(0)
+    Chrom = core.crtpc('RI', NIND, FieldDR)
+    BinChrom = core.crtpc('BG', NIND, FieldD)
+    PermChrom = core.crtpc('P', NIND, FieldP)
+    ObjV2 = np.random.rand(NIND, 2)
+    ObjV3 = np.random.rand(NIND, 3)
+    FitnV = np.random.rand(NIND, 1)
+    levels, criLevel = core.ndsortESS(ObjV3, NIND // 2)
+    refPoint = core.crtup(3, NIND // 2)[0]
+    return [('crtpc RI', lambda : core.crtpc('RI', NIND, FieldDR)),
+            ('bs2ri', lambda : core.bs2ri(BinChrom, FieldD)),
+            ('ranking', lambda : core.ranking(ObjV2[:, [0]])),
+            ('selecting tour', lambda : core.selecting('tour', FitnV, NIND)),
+            ('selecting rws', lambda : core.selecting('rws', FitnV, NIND)),
+            ('recombin recsbx', lambda : core.recombin('recsbx', Chrom, 1)),
+            ('recombin xovdp', lambda : core.recombin('xovdp', BinChrom, 0.7)),
+            ('recombin xovpmx', lambda : core.recombin('xovpmx', PermChrom, 1)),
+            ('mutate mutpolyn', lambda : core.mutate('mutpolyn', 'RI', Chrom, FieldDR, 1)),
+            ('mutate mutde', lambda : core.mutate('mutde', 'RI', Chrom, FieldDR, np.arange(NIND), 0.5, 1)),
+            ('mutate mutbin', lambda : core.mutate('mutbin', 'BG', BinChrom, FieldD, 1)),
+            ('mutate mutinv', lambda : core.mutate('mutinv', 'P', PermChrom, FieldP, 1)),
+            ('ndsortESS M=2', lambda : core.ndsortESS(ObjV2, NIND // 2)),
+            ('ndsortESS M=3', lambda : core.ndsortESS(ObjV3, NIND // 2)),
+            ('crowdis', lambda : core.crowdis(ObjV3, levels)),
+            ('refselect', lambda : core.refselect(ObjV3, levels, criLevel, NIND // 2, refPoint, True))]
+
+if __name__ == '__main__':
+    NIND = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cores = [('pycore', pycore)]
+    if ea.__core__ == 'compiled':
+        cores.insert(0, ('compiled', ea))
+    else:
+        print('No compiled core matches Python %d.%d, only the pure-Numpy core is timed.' % sys.version_info[:2])
+    results = [[name for name, func in cases(pycore, NIND)]]
+    for coreName, core in cores:
+        results.append(['%.4f' % timeit(func) for name, func in cases(core, NIND)])
+    header = ['operator (NIND = %d)' % NIND] + ['%s (s)' % coreName for coreName, core in cores]
+    if len(cores) == 2:
+        header.append('ratio')
+        results.append(['%.2f' % (float(p) / max(float(c), 1e-9)) for c, p in zip(results[1], results[2])])
+    widths = [max(len(h), max(len(r) for r in col)) for h, col in zip(header, results)]
+    print('  '.join(h.ljust(w) for h, w in zip(header, widths)))
+    for row in zip(*results):
+        print('  '.join(r.ljust(w) for r, w in zip(row, widths)))
@@ -0,0 +1,61 @@
+"""
+This file checks that the reference-vector based selections ignore all-zero reference vectors,
+which RVEA-RES produces once the range of an objective shrinks to 0.
+
+Usage: python refgselect_test.py (or run it with pytest)
+"""
+
+import os
+import sys
+import warnings
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+def test_zero_reference_vector():
+    rng = np.random.default_rng(1)
+    ObjV = rng.random((50, 2))
+    refPoint = ea.crtup(2, 10)[0]
+    zeroRef = np.vstack([refPoint, np.zeros((1, 2))])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error') # 不应再出现除以0的警告
+        expected = ea.refgselect(ObjV, refPoint, 2)[0]
+        actual = ea.refgselect(ObjV, zeroRef, 2)[0]
+    assert np.sum(expected) == 10
+    assert np.array_equal(actual, expected)
+
+def test_zero_reference_point_refselect():
+    rng = np.random.default_rng(2)
+    ObjV = rng.random((60, 3))
+    refPoint = ea.crtup(3, 20)[0]
+    [levels, criLevel] = ea.ndsortESS(ObjV, 30)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        chooseFlag = ea.refselect(ObjV, levels, criLevel, 30, np.vstack([refPoint, np.zeros((1, 3))]), True)
+    assert np.sum(chooseFlag) == 30
+
+class ZDT1(ea.Problem):
+    def __init__(self, Dim = 30):
+        ea.Problem.__init__(self, 'ZDT1', 2, [1, 1], Dim, [0] * Dim, [0] * Dim, [1] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        f1 = pop.Phen[:, [0]]
+        g = 1 + 9 * np.mean(pop.Phen[:, 1:], 1, keepdims = True)
+        pop.ObjV = np.hstack([f1, g * (1 - np.sqrt(f1 / g))])
+
+def test_RVEA_RES_front():
+    problem = ZDT1()
+    population = ea.Population('RI', ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders), 100)
+    algorithm = ea.moea_RVEA_RES_templet(problem, population)
+    algorithm.MAXGEN = 100
+    algorithm.drawing = 0
+    algorithm.seed = 1
+    NDSet = algorithm.run()
+    assert NDSet.sizes > 20 # 参考向量为零向量时前沿曾退化为一个点
+
+if __name__ == '__main__':
+    test_zero_reference_vector()
+    test_zero_reference_point_refselect()
+    test_RVEA_RES_front()
+    print('refgselect_test passed.')
@@ -0,0 +1,75 @@
+"""
+This file compares the templates with and without surrogate pre-screening under the same budget of real evaluations.
+With a surrogate, every generation breeds four times as many candidate offspring and only the NIND candidates that the
+surrogate model ranks best are passed to aimFunc, so the same number of aimFunc calls yields better solutions.
+The 'saved' column is the number of candidates that were screened out, i.e. real evaluations that were not spent.
+
+Usage: python surrogate_benchmark.py [MAXEVALS] [RUNS]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import geatpy as ea
+
+class Ellipsoid(ea.Problem):
+    def __init__(self, Dim = 10):
+        ea.Problem.__init__(self, 'Ellipsoid', 1, [1], Dim, [0] * Dim, [-5] * Dim, [5] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        pop.ObjV = np.sum(np.arange(1, self.Dim + 1) * pop.Phen ** 2, 1, keepdims = True)
+
+class ZDT1(ea.Problem):
+    def __init__(self, Dim = 10):
+        ea.Problem.__init__(self, 'ZDT1', 2, [1, 1], Dim, [0] * Dim, [0] * Dim, [1] * Dim, [1] * Dim, [1] * Dim)
+
+    def aimFunc(self, pop):
+        f1 = pop.Phen[:, [0]]
+        g = 1 + 9 * np.mean(pop.Phen[:, 1:], 1, keepdims = True)
+        pop.ObjV = np.hstack([f1, g * (1 - np.sqrt(f1 / g))])
+
+    def calReferObjV(self):
+        f1 = np.linspace(0, 1, 1000)[:, None]
+        return np.hstack([f1, 1 - np.sqrt(f1)])
+
+cases = [['soea_SEGA_templet', Ellipsoid, None], ['soea_SEGA_templet', Ellipsoid, ['kriging', 'EI']],
+         ['soea_SEGA_templet', Ellipsoid, ['rbf', 'value']],
+         ['moea_NSGA2_templet', ZDT1, None], ['moea_NSGA2_templet', ZDT1, ['kriging', 'value']],
+         ['moea_NSGA2_templet', ZDT1, ['rbf', 'value']]]
+
+if __name__ == '__main__':
+    MAXEVALS = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    header = ['templet', 'surrogate', 'evals', 'saved', 'result', 'time (s)']
+    rows = []
+    for name, problemClass, setting in cases:
+        values = []
+        saved = 0
+        start = time.perf_counter()
+        for seed in range(RUNS):
+            problem = problemClass()
+            population = ea.Population('RI', ea.crtfld('RI', problem.varTypes, problem.ranges, problem.borders), 20)
+            algorithm = getattr(ea, name)(problem, population)
+            algorithm.MAXEVALS = MAXEVALS
+            algorithm.drawing = 0
+            algorithm.seed = seed
+            if setting is not None:
+                algorithm.surrogate = ea.Surrogate(setting[0], setting[1], 0.25)
+            result = algorithm.run()
+            if problem.M == 1: # 单目标问题记录最优目标函数值，多目标问题记录IGD
+                values.append(np.min(result[0].ObjV))
+            else:
+                values.append(ea.indicator.IGD(result.ObjV, problem.calReferObjV()))
+            if setting is not None:
+                saved += algorithm.surrogate.saved
+        elapsed = time.perf_counter() - start
+        rows.append([name, 'none' if setting is None else '/'.join(setting), str(algorithm.evalsNum), str(saved // RUNS),
+                     ('best ' if problem.M == 1 else 'IGD ') + '%.4g' % np.mean(values), '%.2f' % elapsed])
+    widths = [max(len(h), max(len(row[i]) for row in rows)) for i, h in enumerate(header)]
+    print('MAXEVALS = %d, mean of %d runs' % (MAXEVALS, RUNS))
+    print('  '.join(h.ljust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print('  '.join(r.ljust(w) for r, w in zip(row, widths)))